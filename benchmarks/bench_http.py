@@ -0,0 +1,136 @@
+"""In-process benchmark of the HTTP stack through the WSGI and ASGI adapters.
+
+No sockets are opened: requests go straight into the adapter callables, so the
+numbers isolate routing, JSON coding, metrics and controller work:
+
+    python -m benchmarks.bench_http --requests 5000
+"""
+
+import argparse
+import asyncio
+import io
+import json
+import statistics
+import sys
+import tempfile
+import time
+from collections.abc import Callable
+from pathlib import Path
+from typing import Any, Optional
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from src.bootstrap import create_dependency_container, initialize_database
+from src.infrastructure.cache.memory_cache import InMemoryCache
+from src.infrastructure.database.connection import DatabaseConnection
+from src.infrastructure.notifications.null_notifier import NullNotificationService
+from src.presentation.http.application import Application
+from src.presentation.http.asgi import ASGIApplication
+from src.presentation.http.wsgi import WSGIApplication
+
+DEFAULT_REQUESTS = 2_000
+
+AVAILABILITY = {"office_id": 1, "date": "2030-01-07", "start_time": "10:00", "end_time": "11:00"}
+
+ROUTES: list[tuple[str, str, Optional[dict[str, Any]]]] = [
+    ("GET", "/", None),
+    ("GET", "/api/offices", None),
+    ("POST", "/api/offices/availability", AVAILABILITY),
+    ("POST", "/api/offices/info", AVAILABILITY),
+]
+
+
+def build_application(db_path: Path) -> Application:
+    db = DatabaseConnection(f"sqlite:///{db_path}")
+    initialize_database(db)
+    controller, office_repository = create_dependency_container(
+        db, InMemoryCache(), NullNotificationService()
+    )
+    return Application(controller, office_repository)
+
+
+def wsgi_caller(app: WSGIApplication, method: str, path: str, body: bytes) -> Callable[[], None]:
+    def start_response(_status: str, _headers: list[tuple[str, str]]) -> None:
+        pass
+
+    def call() -> None:
+        environ = {
+            "REQUEST_METHOD": method,
+            "PATH_INFO": path,
+            "QUERY_STRING": "",
+            "CONTENT_LENGTH": str(len(body)),
+            "REMOTE_ADDR": "127.0.0.1",
+            "wsgi.input": io.BytesIO(body),
+        }
+        b"".join(app(environ, start_response))
+
+    return call
+
+
+def asgi_caller(app: ASGIApplication, method: str, path: str, body: bytes) -> Callable[[], None]:
+    scope = {
+        "type": "http",
+        "method": method,
+        "path": path,
+        "query_string": b"",
+        "headers": [],
+        "client": ("127.0.0.1", 0),
+    }
+
+    async def receive() -> dict[str, Any]:
+        return {"type": "http.request", "body": body, "more_body": False}
+
+    async def send(_message: dict[str, Any]) -> None:
+        pass
+
+    loop = asyncio.new_event_loop()
+
+    def call() -> None:
+        loop.run_until_complete(app(scope, receive, send))
+
+    return call
+
+
+def measure(call: Callable[[], None], requests: int) -> dict[str, float]:
+    for _ in range(min(50, requests)):
+        call()
+
+    samples = []
+    started = time.perf_counter()
+    for _ in range(requests):
+        t0 = time.perf_counter()
+        call()
+        samples.append(time.perf_counter() - t0)
+    elapsed = time.perf_counter() - started
+
+    samples.sort()
+    return {
+        "req_per_s": requests / elapsed,
+        "mean_us": statistics.fmean(samples) * 1e6,
+        "p99_us": samples[int(len(samples) * 0.99) - 1] * 1e6,
+    }
+
+
+def main(argv: Optional[list[str]] = None) -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--requests", type=int, default=DEFAULT_REQUESTS)
+    args = parser.parse_args(argv)
+
+    with tempfile.TemporaryDirectory() as workdir:
+        app = build_application(Path(workdir) / "bench.db")
+        adapters = {"wsgi": WSGIApplication(app), "asgi": ASGIApplication(app)}
+
+        print(f"{'adapter':<6} {'route':<28} {'req/s':>10} {'mean us':>10} {'p99 us':>10}")
+        for method, path, payload in ROUTES:
+            body = json.dumps(payload).encode("utf-8") if payload is not None else b""
+            for name, adapter in adapters.items():
+                factory = wsgi_caller if name == "wsgi" else asgi_caller
+                result = measure(factory(adapter, method, path, body), args.requests)  # type: ignore
+                print(
+                    f"{name:<6} {method + ' ' + path:<28} {result['req_per_s']:>10.0f} "
+                    f"{result['mean_us']:>10.1f} {result['p99_us']:>10.1f}"
+                )
+
+
+if __name__ == "__main__":
+    main()
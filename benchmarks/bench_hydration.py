@@ -0,0 +1,90 @@
+import sys
+import time
+from collections.abc import Callable
+from datetime import datetime, timedelta
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from src.domain.entities.reservation import Reservation, ReservationStatus
+from src.domain.entities.user import User
+from src.domain.value_objects.contact_info import ContactInfo
+from src.domain.value_objects.time_slot import TimeSlot
+from src.infrastructure.database.models import ReservationModel
+from src.infrastructure.database.repositories.reservation_repository import (
+    ReservationRepository,
+)
+
+NUM_ROWS = 50_000
+
+
+def build_models(count: int) -> list[ReservationModel]:
+    base = datetime(2025, 1, 6, 8, 0)
+    return [
+        ReservationModel(
+            reservation_id=i + 1,
+            office_id=i % 5 + 1,
+            user_name=f"User {i}",
+            user_email=f"user{i}@example.tj",
+            user_phone="+992901234567",
+            start_time=base + timedelta(hours=i),
+            end_time=base + timedelta(hours=i, minutes=45),
+            status="confirmed",
+            created_at=base,
+        )
+        for i in range(count)
+    ]
+
+
+def validated_model_to_entity(model: ReservationModel) -> Reservation:
+    return Reservation(
+        reservation_id=model.reservation_id,  # type: ignore
+        office_id=model.office_id,  # type: ignore
+        status=ReservationStatus(model.status),
+        created_at=model.created_at,  # type: ignore
+        user=User(
+            user_id=None,
+            name=model.user_name,  # type: ignore
+            contact_info=ContactInfo(
+                email=model.user_email,  # type: ignore
+                phone=model.user_phone,  # type: ignore
+            ),
+        ),
+        time_slot=TimeSlot(
+            start_time=model.start_time,  # type: ignore
+            end_time=model.end_time,  # type: ignore
+        ),
+    )
+
+
+def measure(
+    label: str,
+    convert: Callable[[ReservationModel], Reservation],
+    models: list[ReservationModel],
+) -> float:
+    start = time.perf_counter()
+    for model in models:
+        convert(model)
+    elapsed = time.perf_counter() - start
+    per_row_us = elapsed / len(models) * 1_000_000
+    print(f"  {label:<22} {elapsed:.3f}s total, {per_row_us:.2f} us/row")
+    return per_row_us
+
+
+def main() -> None:
+    print("\n" + "=" * 60)
+    print("ENTITY HYDRATION BENCHMARK")
+    print("=" * 60)
+
+    models = build_models(NUM_ROWS)
+    print(f"\nHydrating {NUM_ROWS} reservation rows...\n")
+
+    validated = measure("validated (before)", validated_model_to_entity, models)
+    trusted = measure("trusted (after)", ReservationRepository._model_to_entity, models)
+
+    print(f"\n  Speedup: {validated / trusted:.2f}x")
+    print("=" * 60 + "\n")
+
+
+if __name__ == "__main__":
+    main()
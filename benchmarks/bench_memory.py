@@ -0,0 +1,113 @@
+import sys
+import tracemalloc
+from collections.abc import Callable
+from dataclasses import dataclass, field
+from datetime import datetime, timedelta
+from pathlib import Path
+from typing import Any, Optional
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from src.domain.entities.reservation import Reservation, ReservationStatus
+from src.domain.entities.user import User
+from src.domain.value_objects.contact_info import ContactInfo
+from src.domain.value_objects.time_slot import TimeSlot
+
+NUM_RESERVATIONS = 20_000
+BASE_TIME = datetime(2025, 1, 6, 8, 0)
+
+
+@dataclass(frozen=True)
+class DictContactInfo:
+    email: str
+    phone: str
+
+
+@dataclass(frozen=True)
+class DictTimeSlot:
+    start_time: datetime
+    end_time: datetime
+
+
+@dataclass
+class DictUser:
+    user_id: Optional[int]
+    name: str
+    contact_info: DictContactInfo
+
+
+@dataclass
+class DictReservation:
+    office_id: int
+    user: DictUser
+    time_slot: DictTimeSlot
+    reservation_id: Optional[int] = None
+    status: ReservationStatus = field(default=ReservationStatus.PENDING)
+    created_at: datetime = field(default_factory=datetime.now)
+
+
+def build_dict_backed(i: int) -> Any:
+    return DictReservation(
+        office_id=i % 5 + 1,
+        user=DictUser(
+            user_id=None,
+            name=f"User {i}",
+            contact_info=DictContactInfo(email=f"user{i}@example.tj", phone="+992901234567"),
+        ),
+        time_slot=DictTimeSlot(
+            start_time=BASE_TIME + timedelta(hours=i),
+            end_time=BASE_TIME + timedelta(hours=i, minutes=45),
+        ),
+        reservation_id=i + 1,
+        status=ReservationStatus.CONFIRMED,
+        created_at=BASE_TIME,
+    )
+
+
+def build_slotted(i: int) -> Any:
+    return Reservation.from_trusted(
+        office_id=i % 5 + 1,
+        user=User.from_trusted(
+            user_id=None,
+            name=f"User {i}",
+            contact_info=ContactInfo.from_trusted(
+                email=f"user{i}@example.tj", phone="+992901234567"
+            ),
+        ),
+        time_slot=TimeSlot.from_trusted(
+            start_time=BASE_TIME + timedelta(hours=i),
+            end_time=BASE_TIME + timedelta(hours=i, minutes=45),
+        ),
+        reservation_id=i + 1,
+        status=ReservationStatus.CONFIRMED,
+        created_at=BASE_TIME,
+    )
+
+
+def measure(label: str, build: Callable[[int], Any]) -> float:
+    tracemalloc.start()
+    baseline, _ = tracemalloc.get_traced_memory()
+    items = [build(i) for i in range(NUM_RESERVATIONS)]
+    current, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    bytes_per_item = (current - baseline) / len(items)
+    print(f"  {label:<22} {bytes_per_item:,.0f} bytes/reservation")
+    return bytes_per_item
+
+
+def main() -> None:
+    print("\n" + "=" * 60)
+    print("RESERVATION MEMORY BENCHMARK")
+    print("=" * 60)
+    print(f"\nBuilding {NUM_RESERVATIONS} reservations (entity + user + contact + slot)...\n")
+
+    before = measure("dict-backed (before)", build_dict_backed)
+    after = measure("slotted (after)", build_slotted)
+
+    print(f"\n  Saved: {before - after:,.0f} bytes/reservation ({1 - after / before:.0%})")
+    print("=" * 60 + "\n")
+
+
+if __name__ == "__main__":
+    main()
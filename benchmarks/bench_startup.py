@@ -0,0 +1,114 @@
+"""Cold-start benchmark for the CLI.
+
+Every sample is a fresh interpreter, so the numbers include imports, settings
+loading and, for the commands, the schema check against a throw-away SQLite
+database:
+
+    python -m benchmarks.bench_startup --runs 10
+    python -m benchmarks.bench_startup --budget-ms 300   # non-zero exit when slower
+"""
+
+import argparse
+import os
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+from typing import Optional
+
+ROOT = Path(__file__).parent.parent
+DEFAULT_RUNS = 10
+SLOT_ARGS = [
+    "--office-id",
+    "1",
+    "--date",
+    "2030-01-07",
+    "--start-time",
+    "10:00",
+    "--end-time",
+    "11:00",
+]
+
+SCENARIOS: dict[str, list[str]] = {
+    "import main": ["-c", "import main"],
+    "main.py --help": ["main.py", "--help"],
+    "check-availability": ["main.py", "check-availability", *SLOT_ARGS],
+    "info": ["main.py", "info", *SLOT_ARGS],
+}
+
+
+def run_once(args: list[str], env: dict[str, str]) -> float:
+    started = time.perf_counter()
+    subprocess.run(
+        [sys.executable, *args],
+        cwd=ROOT,
+        env=env,
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.DEVNULL,
+        check=True,
+    )
+    return (time.perf_counter() - started) * 1000
+
+
+def slowest_imports(args: list[str], env: dict[str, str], limit: int = 8) -> list[str]:
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", *args],
+        cwd=ROOT,
+        env=env,
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.PIPE,
+        text=True,
+        check=True,
+    )
+    rows = []
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "self [us]" in line:
+            continue
+        _, cumulative, name = line[len("import time:") :].split("|")
+        # Only top-level entries: nested imports are already in their parent.
+        if name.startswith(" ") and not name.startswith("  "):
+            rows.append((int(cumulative), name.strip()))
+    rows.sort(reverse=True)
+    return [f"{name} {cumulative / 1000:.1f} ms" for cumulative, name in rows[:limit]]
+
+
+def main(argv: Optional[list[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--runs", type=int, default=DEFAULT_RUNS)
+    parser.add_argument(
+        "--budget-ms", type=float, help="fail when a command's median exceeds this"
+    )
+    args = parser.parse_args(argv)
+
+    with tempfile.TemporaryDirectory() as workdir:
+        env = {
+            **os.environ,
+            "DATABASE_URL": f"sqlite:///{Path(workdir) / 'startup.db'}",
+            "CACHE_BACKEND": "memory",
+        }
+        # Create the schema once so the runs measure the steady state.
+        run_once(SCENARIOS["check-availability"], env)
+
+        over_budget = []
+        print(f"{'scenario':<22} {'median ms':>10} {'min ms':>10}")
+        for name, scenario in SCENARIOS.items():
+            samples = [run_once(scenario, env) for _ in range(args.runs)]
+            median = statistics.median(samples)
+            print(f"{name:<22} {median:>10.1f} {min(samples):>10.1f}")
+            if args.budget_ms is not None and median > args.budget_ms:
+                over_budget.append(name)
+
+        print("\nSlowest top-level imports for check-availability:")
+        for line in slowest_imports(SCENARIOS["check-availability"], env):
+            print(f"  {line}")
+
+    if over_budget:
+        print(f"\nOver the {args.budget_ms} ms budget: {', '.join(over_budget)}")
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
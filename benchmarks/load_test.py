@@ -0,0 +1,349 @@
+"""Open-loop HTTP load generator with latency percentiles and booking checks.
+
+By default it starts the API locally against a temporary SQLite database, the
+in-memory cache stand-in and console notifiers:
+
+    python -m benchmarks.load_test --rps 200 --duration 30 \\
+        --mix list=40,availability=30,info=20,book=10 --output load.json
+
+Pass --url to target an already running server instead.
+"""
+
+import argparse
+import json
+import os
+import random
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+import urllib.error
+import urllib.request
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from datetime import datetime, timedelta
+from pathlib import Path
+from typing import Any, Optional
+
+PROJECT_ROOT = Path(__file__).parent.parent
+
+HTTP_CREATED = 201
+HTTP_CONFLICT = 409
+HTTP_ERROR_MIN = 400
+
+DEFAULT_MIX = "list=40,availability=30,info=20,book=10"
+NUM_OFFICES = 5
+STARTUP_TIMEOUT = 30.0
+
+
+@dataclass
+class Sample:
+    operation: str
+    status: int
+    latency_ms: float
+    booking: Optional[dict[str, Any]] = None
+
+
+@dataclass
+class LoadReport:
+    samples: list[Sample] = field(default_factory=list)
+    dropped: int = 0
+    in_flight: int = 0
+    lock: threading.Lock = field(default_factory=threading.Lock)
+
+    def add(self, sample: Sample) -> None:
+        with self.lock:
+            self.samples.append(sample)
+            self.in_flight -= 1
+
+
+def parse_mix(mix: str) -> dict[str, int]:
+    weights = {}
+    for part in mix.split(","):
+        name, _, weight = part.partition("=")
+        weights[name.strip()] = int(weight)
+    unknown = set(weights) - {"list", "availability", "info", "book"}
+    if unknown:
+        raise ValueError(f"Unknown operations in mix: {', '.join(sorted(unknown))}")
+    return weights
+
+
+def build_request(operation: str, rng: random.Random, slots: int) -> tuple[str, Optional[dict]]:
+    if operation == "list":
+        return "/api/offices", None
+
+    office_id = rng.randint(1, NUM_OFFICES)
+    slot = rng.randrange(slots)
+    start = datetime(2030, 1, 7, 8, 0) + timedelta(minutes=30 * slot)
+    payload: dict[str, Any] = {
+        "office_id": office_id,
+        "date": start.strftime("%Y-%m-%d"),
+        "start_time": start.strftime("%H:%M"),
+        "end_time": (start + timedelta(hours=1)).strftime("%H:%M"),
+    }
+
+    if operation == "availability":
+        return "/api/offices/availability", payload
+    if operation == "info":
+        return "/api/offices/info", payload
+
+    payload.update(
+        name=f"Load User {rng.randrange(1_000_000)}",
+        email="load@example.tj",
+        phone="+992901234567",
+    )
+    return "/api/reservations", payload
+
+
+def send(base_url: str, path: str, payload: Optional[dict]) -> tuple[int, Any]:
+    data = json.dumps(payload).encode("utf-8") if payload is not None else None
+    request = urllib.request.Request(
+        f"{base_url}{path}",
+        data=data,
+        headers={"Content-Type": "application/json"},
+        method="POST" if payload is not None else "GET",
+    )
+    try:
+        with urllib.request.urlopen(request, timeout=30) as response:
+            return response.status, json.loads(response.read() or b"null")
+    except urllib.error.HTTPError as e:
+        return e.code, None
+    except (urllib.error.URLError, OSError):
+        return 0, None
+
+
+def run_load(  # noqa: PLR0913
+    base_url: str,
+    *,
+    mix: dict[str, int],
+    rps: float,
+    duration: float,
+    concurrency: int,
+    slots: int,
+    seed: int,
+) -> LoadReport:
+    report = LoadReport()
+    rng = random.Random(seed)
+    operations = list(mix)
+    weights = [mix[name] for name in operations]
+    total = int(rps * duration)
+
+    def execute(operation: str, path: str, payload: Optional[dict], scheduled: float) -> None:
+        status, booking = 0, None
+        try:
+            status, body = send(base_url, path, payload)
+            if operation == "book" and status == HTTP_CREATED:
+                booking = {**payload, "reservation_id": body["data"]["reservation_id"]}  # type: ignore[dict-item]
+        except (ValueError, KeyError, TypeError):
+            # An unreadable response body counts as a failed request.
+            status = 0
+        finally:
+            # Latency is measured from the scheduled start so queueing delay is not hidden.
+            latency_ms = (time.perf_counter() - scheduled) * 1000
+            report.add(Sample(operation, status, latency_ms, booking))
+
+    with ThreadPoolExecutor(max_workers=concurrency) as executor:
+        start = time.perf_counter()
+        for i in range(total):
+            scheduled = start + i / rps
+            delay = scheduled - time.perf_counter()
+            if delay > 0:
+                time.sleep(delay)
+            with report.lock:
+                # Stop queueing once the client itself is saturated.
+                if report.in_flight > concurrency * 10:
+                    report.dropped += 1
+                    continue
+                report.in_flight += 1
+            operation = rng.choices(operations, weights)[0]
+            path, payload = build_request(operation, rng, slots)
+            executor.submit(execute, operation, path, payload, scheduled)
+
+    return report
+
+
+def percentile(sorted_values: list[float], fraction: float) -> float:
+    if not sorted_values:
+        return 0.0
+    index = min(len(sorted_values) - 1, round(fraction * (len(sorted_values) - 1)))
+    return round(sorted_values[index], 2)
+
+
+def latency_stats(samples: list[Sample]) -> dict[str, Any]:
+    latencies = sorted(sample.latency_ms for sample in samples)
+    count = len(samples)
+    return {
+        "requests": count,
+        "p50_ms": percentile(latencies, 0.50),
+        "p95_ms": percentile(latencies, 0.95),
+        "p99_ms": percentile(latencies, 0.99),
+        "max_ms": round(latencies[-1], 2) if latencies else 0.0,
+        "error_rate": round(
+            sum(
+                1
+                for s in samples
+                if s.status == 0 or (s.status >= HTTP_ERROR_MIN and s.status != HTTP_CONFLICT)
+            )
+            / count,
+            4,
+        )
+        if count
+        else 0.0,
+        "conflict_rate": round(sum(1 for s in samples if s.status == HTTP_CONFLICT) / count, 4)
+        if count
+        else 0.0,
+    }
+
+
+def find_double_bookings(samples: list[Sample]) -> list[dict[str, Any]]:
+    by_office: dict[int, list[tuple[datetime, datetime, int]]] = defaultdict(list)
+    for sample in samples:
+        if not sample.booking:
+            continue
+        booking = sample.booking
+        start = datetime.strptime(f"{booking['date']} {booking['start_time']}", "%Y-%m-%d %H:%M")
+        end = datetime.strptime(f"{booking['date']} {booking['end_time']}", "%Y-%m-%d %H:%M")
+        by_office[booking["office_id"]].append((start, end, booking["reservation_id"]))
+
+    violations = []
+    for office_id, bookings in by_office.items():
+        bookings.sort()
+        # Sweep by start, comparing against the booking that runs longest so
+        # far: a long one can overlap bookings well past its neighbour.
+        _, latest_end, latest_id = bookings[0]
+        for start, end, current_id in bookings[1:]:
+            if start < latest_end:
+                violations.append(
+                    {"office_id": office_id, "reservation_ids": [latest_id, current_id]}
+                )
+            if end > latest_end:
+                latest_end, latest_id = end, current_id
+    return violations
+
+
+def summarize(report: LoadReport, elapsed: float, config: dict[str, Any]) -> dict[str, Any]:
+    by_operation: dict[str, list[Sample]] = defaultdict(list)
+    status_counts: dict[str, int] = defaultdict(int)
+    for sample in report.samples:
+        by_operation[sample.operation].append(sample)
+        status_counts[str(sample.status)] += 1
+
+    violations = find_double_bookings(report.samples)
+    return {
+        "config": config,
+        "elapsed_s": round(elapsed, 3),
+        "throughput_rps": round(len(report.samples) / elapsed, 2) if elapsed else 0.0,
+        "dropped": report.dropped,
+        "status_counts": dict(status_counts),
+        "overall": latency_stats(report.samples),
+        "operations": {name: latency_stats(samples) for name, samples in by_operation.items()},
+        "double_bookings": {"count": len(violations), "examples": violations[:10]},
+    }
+
+
+def start_local_server(port: int, workdir: Path) -> subprocess.Popen:
+    env = {
+        **os.environ,
+        "DATABASE_URL": f"sqlite:///{workdir / 'load_test.db'}",
+        "CACHE_BACKEND": "memory",
+        "RATE_LIMIT_REQUESTS": "1000000000",
+        "SMTP_HOST": "",
+        "SMTP_USERNAME": "",
+        "SMTP_PASSWORD": "",
+        "OSONSMS_LOGIN": "",
+        "OSONSMS_HASH": "",
+        "DEBUG": "false",
+    }
+    log_file = (workdir / "server.log").open("w", encoding="utf-8")
+    process = subprocess.Popen(
+        [
+            sys.executable,
+            "-c",
+            f"from src.presentation.http.server import run_server; run_server({port})",
+        ],
+        cwd=PROJECT_ROOT,
+        env=env,
+        stdout=log_file,
+        stderr=subprocess.STDOUT,
+    )
+
+    base_url = f"http://127.0.0.1:{port}"
+    deadline = time.monotonic() + STARTUP_TIMEOUT
+    while time.monotonic() < deadline:
+        if process.poll() is not None:
+            raise RuntimeError(f"Server exited early, see {workdir / 'server.log'}")
+        status, _ = send(base_url, "/", None)
+        if status:
+            return process
+        time.sleep(0.2)
+
+    process.terminate()
+    raise RuntimeError("Server did not become ready in time")
+
+
+def main(argv: Optional[list[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description="HTTP load generator")
+    parser.add_argument("--url", help="Target an already running server instead of starting one")
+    parser.add_argument("--port", type=int, default=8765, help="Port for the local server")
+    parser.add_argument("--rps", type=float, default=100.0, help="Target requests per second")
+    parser.add_argument("--duration", type=float, default=10.0, help="Test duration in seconds")
+    parser.add_argument("--concurrency", type=int, default=32, help="Client worker threads")
+    parser.add_argument("--mix", default=DEFAULT_MIX, help="Weighted operation mix")
+    parser.add_argument(
+        "--booking-slots",
+        type=int,
+        default=16,
+        help="Distinct half-hour slots used by bookings; fewer means more contention",
+    )
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--output", help="Write the JSON report to this file")
+    args = parser.parse_args(argv)
+
+    mix = parse_mix(args.mix)
+    config = {
+        "rps": args.rps,
+        "duration_s": args.duration,
+        "concurrency": args.concurrency,
+        "mix": mix,
+        "booking_slots": args.booking_slots,
+        "seed": args.seed,
+    }
+
+    with tempfile.TemporaryDirectory() as workdir:
+        process = None
+        base_url = args.url
+        if not base_url:
+            process = start_local_server(args.port, Path(workdir))
+            base_url = f"http://127.0.0.1:{args.port}"
+        config["target"] = base_url
+
+        try:
+            start = time.perf_counter()
+            report = run_load(
+                base_url,
+                mix=mix,
+                rps=args.rps,
+                duration=args.duration,
+                concurrency=args.concurrency,
+                slots=args.booking_slots,
+                seed=args.seed,
+            )
+            elapsed = time.perf_counter() - start
+        finally:
+            if process:
+                process.terminate()
+                process.wait(timeout=10)
+
+    summary = summarize(report, elapsed, config)
+    output = json.dumps(summary, indent=2)
+    if args.output:
+        Path(args.output).write_text(output, encoding="utf-8")
+    print(output)
+
+    return 1 if summary["double_bookings"]["count"] else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
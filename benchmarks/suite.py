@@ -0,0 +1,255 @@
+"""Offline benchmark suite for the use cases, repositories and rate limiter.
+
+Runs against a throw-away SQLite database and the in-memory cache stand-in,
+so no server, Postgres or Redis is needed:
+
+    python -m benchmarks.suite --sizes 1000,10000,100000 --output bench.json
+    python -m benchmarks.suite --compare bench.json --output bench-new.json
+"""
+
+import argparse
+import json
+import platform
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from collections.abc import Callable, Iterator
+from datetime import datetime, timedelta
+from pathlib import Path
+from typing import Any, Optional
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from src.application.use_cases.check_availability import CheckAvailabilityUseCase
+from src.application.use_cases.create_reservation import CreateReservationUseCase
+from src.application.use_cases.get_reservation_info import GetReservationInfoUseCase
+from src.bootstrap import initialize_database
+from src.domain.value_objects.time_slot import TimeSlot
+from src.infrastructure.cache.memory_cache import InMemoryCache
+from src.infrastructure.database.booking_lock import SessionBookingLock
+from src.infrastructure.database.connection import DatabaseConnection
+from src.infrastructure.database.models import ReservationModel
+from src.infrastructure.database.repositories.cached_office_repository import (
+    CachedOfficeRepository,
+)
+from src.infrastructure.database.repositories.office_repository import OfficeRepository
+from src.infrastructure.database.repositories.reservation_repository import (
+    ReservationRepository,
+)
+from src.infrastructure.notifications.null_notifier import NullNotificationService
+from src.infrastructure.security.rate_limiter import RateLimiter
+
+DEFAULT_SIZES = [1_000, 10_000, 100_000]
+DEFAULT_ITERATIONS = 200
+REGRESSION_THRESHOLD = 1.25
+
+NUM_OFFICES = 5
+SEED_START = datetime(2024, 1, 1, 0, 0)
+SLOT_LENGTH = timedelta(hours=1)
+INSERT_CHUNK = 10_000
+HYDRATION_BATCH = 1_000
+
+
+def seed_reservations(db: DatabaseConnection, size: int) -> None:
+    rows_per_office = size // NUM_OFFICES
+
+    def rows() -> Iterator[dict[str, Any]]:
+        for i in range(size):
+            start = SEED_START + SLOT_LENGTH * (i // NUM_OFFICES)
+            yield {
+                "office_id": i % NUM_OFFICES + 1,
+                "user_name": f"User {i}",
+                "user_email": f"user{i}@example.tj",
+                "user_phone": "+992901234567",
+                "start_time": start,
+                "end_time": start + SLOT_LENGTH,
+                "status": "confirmed",
+                "created_at": SEED_START,
+            }
+
+    with db.session_scope() as session:
+        batch: list[dict[str, Any]] = []
+        for row in rows():
+            batch.append(row)
+            if len(batch) == INSERT_CHUNK:
+                session.execute(ReservationModel.__table__.insert(), batch)
+                batch = []
+        if batch:
+            session.execute(ReservationModel.__table__.insert(), batch)
+
+    print(f"  Seeded {size} reservations ({rows_per_office} per office)")
+
+
+def time_calls(func: Callable[[int], Any], iterations: int) -> dict[str, float]:
+    samples = []
+    for i in range(iterations):
+        start = time.perf_counter_ns()
+        func(i)
+        samples.append((time.perf_counter_ns() - start) / 1000)
+
+    samples.sort()
+    return {
+        "iterations": iterations,
+        "mean_us": round(statistics.fmean(samples), 2),
+        "p50_us": round(samples[len(samples) // 2], 2),
+        "p95_us": round(samples[int(len(samples) * 0.95) - 1], 2),
+        "ops_per_sec": round(1_000_000 / statistics.fmean(samples), 1),
+    }
+
+
+def run_size(size: int, iterations: int, workdir: Path) -> dict[str, dict[str, float]]:
+    db = DatabaseConnection(f"sqlite:///{workdir / f'bench_{size}.db'}")
+    initialize_database(db)
+    seed_reservations(db, size)
+
+    cache = InMemoryCache()
+    session = db.get_session()
+    base_office_repository = OfficeRepository(session)
+    office_repository = CachedOfficeRepository(repository=base_office_repository, cache=cache)
+    reservation_repository = ReservationRepository(session)
+
+    check_availability = CheckAvailabilityUseCase(office_repository, reservation_repository)
+    get_info = GetReservationInfoUseCase(office_repository, reservation_repository)
+    create_reservation = CreateReservationUseCase(
+        office_repository, SessionBookingLock(db.session_scope), NullNotificationService()
+    )
+    rate_limiter = RateLimiter(cache=cache, max_requests=1_000_000, window_seconds=60)
+
+    middle = SEED_START + SLOT_LENGTH * (size // NUM_OFFICES // 2)
+    busy_slot = TimeSlot(start_time=middle, end_time=middle + SLOT_LENGTH)
+    history_end = SEED_START + SLOT_LENGTH * (size // NUM_OFFICES + 1)
+    free_slot = TimeSlot(start_time=history_end, end_time=history_end + SLOT_LENGTH)
+
+    def book(i: int) -> None:
+        start = history_end + timedelta(days=1) + SLOT_LENGTH * i
+        create_reservation.execute(
+            office_id=i % NUM_OFFICES + 1,
+            user_name="Benchmark User",
+            user_email="bench@example.tj",
+            user_phone="+992901234567",
+            time_slot=TimeSlot(start_time=start, end_time=start + SLOT_LENGTH),
+        )
+
+    def office_miss(i: int) -> None:
+        office_id = i % NUM_OFFICES + 1
+        cache.delete(f"{CachedOfficeRepository.CACHE_KEY_PREFIX}{office_id}")
+        office_repository.get_by_id(office_id)
+
+    def hydrate(_i: int) -> None:
+        models = session.query(ReservationModel).limit(HYDRATION_BATCH).all()
+        for model in models:
+            ReservationRepository._model_to_entity(model)
+
+    office_repository.find_all()
+    scenarios: dict[str, Callable[[int], Any]] = {
+        "check_availability_busy": lambda i: check_availability.execute(i % 5 + 1, busy_slot),
+        "check_availability_free": lambda i: check_availability.execute(i % 5 + 1, free_slot),
+        "get_reservation_info_busy": lambda i: get_info.execute(i % 5 + 1, busy_slot),
+        "create_reservation": book,
+        "office_cache_hit": lambda i: office_repository.get_by_id(i % 5 + 1),
+        "office_cache_miss": office_miss,
+        "rate_limiter_is_allowed": lambda i: rate_limiter.is_allowed(f"10.0.0.{i % 250}"),
+        f"hydrate_{HYDRATION_BATCH}_rows": hydrate,
+    }
+
+    results = {}
+    for name, func in scenarios.items():
+        count = max(1, iterations // 20) if name.startswith("hydrate") else iterations
+        results[name] = time_calls(func, count)
+        print(f"    {name:<28} p50 {results[name]['p50_us']:>10.1f} us")
+
+    session.close()
+    return results
+
+
+def git_revision() -> str:
+    try:
+        output = subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"],
+            capture_output=True,
+            text=True,
+            check=True,
+            cwd=Path(__file__).parent,
+        )
+        return output.stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return "unknown"
+
+
+def compare(current: dict[str, Any], baseline: dict[str, Any], threshold: float) -> int:
+    print("\n" + "=" * 60)
+    print(f"COMPARISON WITH BASELINE ({baseline['meta'].get('git_revision', '?')})")
+    print("=" * 60)
+
+    regressions = 0
+    for size, scenarios in current["results"].items():
+        for name, stats in scenarios.items():
+            previous = baseline["results"].get(size, {}).get(name)
+            if not previous:
+                continue
+            ratio = stats["p50_us"] / previous["p50_us"] if previous["p50_us"] else 1.0
+            marker = ""
+            if ratio > threshold:
+                marker = "  <-- REGRESSION"
+                regressions += 1
+            print(f"  {size:>8} {name:<28} {ratio:>6.2f}x{marker}")
+
+    return regressions
+
+
+def main(argv: Optional[list[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description="Offline benchmark suite")
+    parser.add_argument(
+        "--sizes",
+        default=",".join(str(size) for size in DEFAULT_SIZES),
+        help="Comma-separated reservation table sizes (e.g. 1000,10000,1000000)",
+    )
+    parser.add_argument("--iterations", type=int, default=DEFAULT_ITERATIONS)
+    parser.add_argument("--output", help="Write results as JSON to this file")
+    parser.add_argument("--compare", help="Baseline JSON file to compare against")
+    parser.add_argument(
+        "--threshold",
+        type=float,
+        default=REGRESSION_THRESHOLD,
+        help="p50 slowdown ratio that counts as a regression",
+    )
+    args = parser.parse_args(argv)
+
+    sizes = [int(size) for size in args.sizes.split(",") if size]
+
+    print("\n" + "=" * 60)
+    print("OFFICE RESERVATION BENCHMARK SUITE")
+    print("=" * 60)
+
+    report: dict[str, Any] = {
+        "meta": {
+            "timestamp": datetime.now().isoformat(timespec="seconds"),
+            "git_revision": git_revision(),
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "iterations": args.iterations,
+        },
+        "results": {},
+    }
+
+    with tempfile.TemporaryDirectory() as workdir:
+        for size in sizes:
+            print(f"\nTable size: {size}")
+            report["results"][str(size)] = run_size(size, args.iterations, Path(workdir))
+
+    if args.output:
+        Path(args.output).write_text(json.dumps(report, indent=2), encoding="utf-8")
+        print(f"\nResults written to {args.output}")
+
+    if args.compare:
+        baseline = json.loads(Path(args.compare).read_text(encoding="utf-8"))
+        if compare(report, baseline, args.threshold):
+            return 1
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
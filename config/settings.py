@@ -14,7 +14,20 @@ except ImportError:
 @dataclass
 class Settings:
     database_url: str
+    database_replica_urls: list[str]
+    replica_max_lag: float
+    read_your_writes_seconds: int
     debug: bool
+    log_format: str
+    log_file: str
+    slow_query_threshold_ms: float
+    explain_slow_queries: bool
+    reservation_partitioning: str
+    partition_months_ahead: int
+    sweep_interval: float
+    archive_retention_days: int
+    sweep_batch_size: int
+    sweep_batch_pause: float
 
     smtp_host: str
     smtp_port: int
@@ -28,15 +41,49 @@ class Settings:
     osonsms_server: str
 
     redis_url: str
+    cache_backend: str
     cache_ttl: int
+    availability_index: str
     rate_limit_requests: int
     rate_limit_window: int
+    idempotency_ttl: int
+
+    json_codec: str
+
+    workers: int
+    reuse_port: bool
+    http_threads: int
+    http_queue_size: int
+    http_queue_timeout: float
+    http_connection_timeout: float
+    http_retry_after: int
+    shutdown_timeout: float
+
+    admin_token: str
+    profile_sample_rate: float
 
     @classmethod
     def from_env(cls) -> "Settings":
         return cls(
             database_url=os.getenv("DATABASE_URL", ""),
+            database_replica_urls=[
+                url.strip()
+                for url in os.getenv("DATABASE_REPLICA_URLS", "").split(",")
+                if url.strip()
+            ],
+            replica_max_lag=float(os.getenv("REPLICA_MAX_LAG_SECONDS", "5")),
+            read_your_writes_seconds=int(os.getenv("READ_YOUR_WRITES_SECONDS", "5")),
             debug=os.getenv("DEBUG", "false").lower() == "true",
+            log_format=os.getenv("LOG_FORMAT", "text").lower(),
+            log_file=os.getenv("LOG_FILE", ""),
+            slow_query_threshold_ms=float(os.getenv("SLOW_QUERY_THRESHOLD_MS", "200")),
+            explain_slow_queries=os.getenv("EXPLAIN_SLOW_QUERIES", "false").lower() == "true",
+            reservation_partitioning=os.getenv("RESERVATION_PARTITIONING", "none").lower(),
+            partition_months_ahead=int(os.getenv("PARTITION_MONTHS_AHEAD", "3")),
+            sweep_interval=float(os.getenv("SWEEP_INTERVAL_SECONDS", "0")),
+            archive_retention_days=int(os.getenv("ARCHIVE_RETENTION_DAYS", "90")),
+            sweep_batch_size=int(os.getenv("SWEEP_BATCH_SIZE", "500")),
+            sweep_batch_pause=float(os.getenv("SWEEP_BATCH_PAUSE_SECONDS", "0.1")),
             smtp_host=os.getenv("SMTP_HOST", ""),
             smtp_port=int(os.getenv("SMTP_PORT", "587")),
             smtp_username=os.getenv("SMTP_USERNAME", ""),
@@ -47,9 +94,23 @@ class Settings:
             osonsms_sender=os.getenv("OSONSMS_SENDER", "OsonSMS"),
             osonsms_server=os.getenv("OSONSMS_SERVER", "https://api.osonsms.com/sendsms_v1.php"),
             redis_url=os.getenv("REDIS_URL", "redis://localhost:6379/0"),
+            cache_backend=os.getenv("CACHE_BACKEND", "redis").lower(),
             cache_ttl=int(os.getenv("CACHE_TTL", "300")),
+            availability_index=os.getenv("AVAILABILITY_INDEX", "none").lower(),
             rate_limit_requests=int(os.getenv("RATE_LIMIT_REQUESTS", "100")),
             rate_limit_window=int(os.getenv("RATE_LIMIT_WINDOW", "60")),
+            idempotency_ttl=int(os.getenv("IDEMPOTENCY_TTL_SECONDS", "86400")),
+            json_codec=os.getenv("JSON_CODEC", "auto").lower(),
+            workers=int(os.getenv("WORKERS", "1")),
+            reuse_port=os.getenv("REUSE_PORT", "false").lower() == "true",
+            http_threads=int(os.getenv("HTTP_THREADS", "32")),
+            http_queue_size=int(os.getenv("HTTP_QUEUE_SIZE", "64")),
+            http_queue_timeout=float(os.getenv("HTTP_QUEUE_TIMEOUT", "1.0")),
+            http_connection_timeout=float(os.getenv("HTTP_CONNECTION_TIMEOUT", "10")),
+            http_retry_after=int(os.getenv("HTTP_RETRY_AFTER", "1")),
+            shutdown_timeout=float(os.getenv("SHUTDOWN_TIMEOUT", "30")),
+            admin_token=os.getenv("ADMIN_TOKEN", ""),
+            profile_sample_rate=float(os.getenv("PROFILE_SAMPLE_RATE", "0")),
         )
 
 
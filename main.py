@@ -1,23 +1,115 @@
 import sys
+from collections.abc import Iterator
+from contextlib import contextmanager
+from typing import TYPE_CHECKING, Any, Optional
 
-from src.bootstrap import (
-    create_dependency_container,
-    get_database_connection,
-    initialize_database,
-)
 from src.presentation.cli.commands import CLI
+from src.presentation.controllers.reservation_controller import ReservationController
 
+if TYPE_CHECKING:
+    from src.infrastructure.database.archival import ReservationSweeper
+
+
+def build_controller() -> ReservationController:
+    # Imported here so `--help` and argument errors skip SQLAlchemy entirely.
+    from src.bootstrap import (  # noqa: PLC0415
+        create_availability_index,
+        create_cache,
+        create_dependency_container,
+        get_database_connection,
+        initialize_database,
+    )
+
+    db = get_database_connection()
+    initialize_database(db)
+    controller, _ = create_dependency_container(
+        db, create_cache(), availability_index=create_availability_index()
+    )
+    return controller
+
+
+@contextmanager
+def build_batch_controller(*, transaction: bool, notify: bool) -> Iterator[ReservationController]:
+    from src.bootstrap import (  # noqa: PLC0415
+        create_availability_index,
+        create_cache,
+        create_dependency_container,
+        create_notification_service,
+        get_database_connection,
+        initialize_database,
+    )
+    from src.infrastructure.database.availability import (  # noqa: PLC0415
+        rebuild_availability_index,
+    )
+    from src.infrastructure.notifications.buffered_notifier import (  # noqa: PLC0415
+        BufferedNotificationService,
+    )
+    from src.infrastructure.notifications.null_notifier import (  # noqa: PLC0415
+        NullNotificationService,
+    )
 
-def main() -> int:
     db = get_database_connection()
     initialize_database(db)
+    cache = create_cache()
+    index = create_availability_index()
+
+    if not transaction:
+        notifier = None if notify else NullNotificationService()
+        controller, _ = create_dependency_container(db, cache, notifier, availability_index=index)
+        yield controller
+        return
+
+    # The transaction's commits are savepoints the index cannot follow: it
+    # stands aside for the batch and is rebuilt once the outcome is known.
+    if index is not None:
+        index.invalidate()
+
+    # Notifications wait for the commit so rolled-back bookings stay silent.
+    buffered = BufferedNotificationService(
+        create_notification_service() if notify else NullNotificationService()
+    )
+    try:
+        with db.transaction_scope() as session:
+            controller, _ = create_dependency_container(
+                db, cache, buffered, session=session, availability_index=index
+            )
+            yield controller
+    finally:
+        if index is not None:
+            rebuild_availability_index(db, index)
+    buffered.flush()
+
 
+def build_sweeper(**overrides: Any) -> "ReservationSweeper":
+    from src.bootstrap import (  # noqa: PLC0415
+        create_sweeper,
+        get_database_connection,
+        initialize_database,
+    )
+
+    db = get_database_connection()
+    initialize_database(db)
+    return create_sweeper(db, **overrides)
+
+
+def run_availability_rebuild(office_id: Optional[int] = None) -> int:
+    from src.bootstrap import (  # noqa: PLC0415
+        get_database_connection,
+        initialize_database,
+        rebuild_availability,
+    )
+
+    db = get_database_connection()
+    initialize_database(db)
+    return rebuild_availability(db, office_id)
+
+
+def main() -> int:
     if len(sys.argv) == 1:
         print("Use --help to see available commands")
         return 0
 
-    controller, _ = create_dependency_container(db)
-    cli = CLI(controller)
+    cli = CLI(build_controller, build_batch_controller, build_sweeper, run_availability_rebuild)
     return cli.run()
 
 
@@ -1,8 +1,10 @@
 from dataclasses import dataclass
 from typing import Optional
 
+from ...domain.slots import DATACLASS_SLOTS
 
-@dataclass
+
+@dataclass(**DATACLASS_SLOTS)
 class ReservationDTO:
     office_id: int
     office_name: str
@@ -14,9 +16,10 @@ class ReservationDTO:
     status: str
     created_at: str
     reservation_id: Optional[int] = None
+    seats: Optional[int] = None
 
 
-@dataclass
+@dataclass(**DATACLASS_SLOTS)
 class ConflictingReservationDTO:
     user_name: str
     user_email: str
@@ -25,7 +28,7 @@ class ConflictingReservationDTO:
     start_time: str
 
 
-@dataclass
+@dataclass(**DATACLASS_SLOTS)
 class AvailabilityDTO:
     office_id: int
     office_name: str
@@ -34,9 +37,11 @@ class AvailabilityDTO:
     requested_end_time: str
     conflicting_reservations: list[ConflictingReservationDTO]
     message: str
+    capacity: int = 0
+    peak_occupancy: int = 0
 
 
-@dataclass
+@dataclass(**DATACLASS_SLOTS)
 class ReservationInfoDTO:
     office_id: int
     office_name: str
@@ -47,3 +52,23 @@ class ReservationInfoDTO:
     until_time: Optional[str] = None
     from_time: Optional[str] = None
     message: str = ""
+
+
+@dataclass(**DATACLASS_SLOTS)
+class ReservationSeriesDTO:
+    series_id: int
+    office_id: int
+    office_name: str
+    user_name: str
+    user_email: str
+    user_phone: str
+    recurrence: str
+    interval: int
+    first_start_time: str
+    first_end_time: str
+    last_end_time: str
+    occurrence_count: int
+    exceptions: list[str]
+    until: Optional[str] = None
+    count: Optional[int] = None
+    seats: Optional[int] = None
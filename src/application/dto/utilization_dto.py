@@ -0,0 +1,24 @@
+from dataclasses import dataclass
+
+from ...domain.slots import DATACLASS_SLOTS
+
+
+@dataclass(**DATACLASS_SLOTS)
+class UtilizationBucketDTO:
+    start_time: str
+    occupied_hours: float
+    utilization: float
+
+
+@dataclass(**DATACLASS_SLOTS)
+class UtilizationDTO:
+    office_id: int
+    office_name: str
+    start_time: str
+    end_time: str
+    bucket: str
+    # "rollup" when served from the rollup table, "adhoc" when computed
+    # from the reservations in the range.
+    source: str
+    utilization: float
+    buckets: list[UtilizationBucketDTO]
@@ -0,0 +1,50 @@
+from abc import ABC, abstractmethod
+from collections.abc import Iterable
+from typing import NamedTuple, Optional
+
+from ...domain.entities.reservation import Reservation
+from ...domain.entities.reservation_series import ReservationSeries
+from ...domain.value_objects.time_slot import TimeSlot
+
+
+class IndexedSchedule(NamedTuple):
+    reservations: list[Reservation]
+    series: list[ReservationSeries]
+
+
+class AvailabilityIndexInterface(ABC):
+    """Read model of each office's active reservations and series, shared between nodes."""
+
+    @abstractmethod
+    def find_overlapping(self, office_id: int, time_slot: TimeSlot) -> Optional[IndexedSchedule]:
+        """Reservations overlapping ``time_slot`` in start order, and the series
+        that may have occurrences in it.
+
+        ``None`` means the index cannot answer (not built, built by another
+        version, unreachable) and the caller must ask the database.
+        """
+
+    @abstractmethod
+    def add(self, reservation: Reservation) -> None:
+        pass
+
+    @abstractmethod
+    def remove(self, reservation: Reservation) -> None:
+        """Drop ``reservation`` as it was last added."""
+
+    @abstractmethod
+    def put_series(self, series: ReservationSeries) -> None:
+        """Add ``series``, or replace the stored copy with the same id."""
+
+    @abstractmethod
+    def rebuild(
+        self,
+        office_id: int,
+        reservations: Iterable[Reservation],
+        series: Iterable[ReservationSeries],
+    ) -> None:
+        """Replace the office's entries with these and mark it current."""
+
+    @abstractmethod
+    def invalidate(self, office_id: Optional[int] = None) -> None:
+        """Stop answering for one office, or all of them, until rebuilt."""
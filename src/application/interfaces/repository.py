@@ -1,8 +1,12 @@
 from abc import ABC, abstractmethod
-from typing import Optional
+from contextlib import AbstractContextManager
+from datetime import datetime
+from typing import NamedTuple, Optional
 
 from ...domain.entities.office import Office
 from ...domain.entities.reservation import Reservation
+from ...domain.entities.reservation_series import ReservationSeries
+from ...domain.utilization import Granularity
 from ...domain.value_objects.time_slot import TimeSlot
 
 
@@ -15,6 +19,18 @@ class OfficeRepositoryInterface(ABC):
     def find_all(self) -> list[Office]:
         pass
 
+    @abstractmethod
+    def find_page(
+        self,
+        *,
+        after_id: Optional[int] = None,
+        limit: int = 50,
+        min_capacity: Optional[int] = None,
+        building: Optional[str] = None,
+        text: Optional[str] = None,
+    ) -> list[Office]:
+        """Up to ``limit`` matching offices with ids above ``after_id``, by id."""
+
     @abstractmethod
     def save(self, office: Office) -> Office:
         pass
@@ -40,3 +56,47 @@ class ReservationRepositoryInterface(ABC):
     @abstractmethod
     def delete(self, reservation_id: int) -> bool:
         pass
+
+
+class ReservationSeriesRepositoryInterface(ABC):
+    @abstractmethod
+    def get_by_id(self, series_id: int) -> Optional[ReservationSeries]:
+        pass
+
+    @abstractmethod
+    def find_by_office_and_time(self, office_id: int, window: TimeSlot) -> list[ReservationSeries]:
+        """Series of the office with occurrences that may overlap ``window``."""
+
+    @abstractmethod
+    def save(self, series: ReservationSeries) -> ReservationSeries:
+        pass
+
+
+class BookingScope(NamedTuple):
+    reservations: ReservationRepositoryInterface
+    series: ReservationSeriesRepositoryInterface
+
+
+class BookingLockInterface(ABC):
+    @abstractmethod
+    def lock_office(self, office_id: int) -> AbstractContextManager[BookingScope]:
+        """Serialize bookings of one office for the duration of the block.
+
+        The check and the save go through the yielded repositories, which
+        share a transaction of their own with the lock; it commits once when
+        the block exits.
+        """
+
+
+class UtilizationRepositoryInterface(ABC):
+    @abstractmethod
+    def find_rollups(
+        self, office_id: int, granularity: Granularity, start: datetime, end: datetime
+    ) -> dict[datetime, tuple[int, int]]:
+        """(whole_seconds, seat_seconds) of the buckets starting in [start, end)."""
+
+    @abstractmethod
+    def find_booked_times(
+        self, office_id: int, start: datetime, end: datetime
+    ) -> tuple[list[datetime], list[datetime], list[Optional[int]]]:
+        """Starts, ends and seats of live and archived bookings overlapping [start, end)."""
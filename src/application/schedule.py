@@ -0,0 +1,56 @@
+from typing import Optional
+
+from ..domain.entities.reservation import Reservation
+from ..domain.entities.reservation_series import ReservationSeries
+from ..domain.value_objects.time_slot import TimeSlot
+from .interfaces.availability_index import AvailabilityIndexInterface
+from .interfaces.repository import (
+    ReservationRepositoryInterface,
+    ReservationSeriesRepositoryInterface,
+)
+
+
+def reservations_in_window(  # noqa: PLR0913
+    reservation_repository: ReservationRepositoryInterface,
+    series_repository: Optional[ReservationSeriesRepositoryInterface],
+    office_id: int,
+    window: TimeSlot,
+    *,
+    replacing: Optional[ReservationSeries] = None,
+    availability_index: Optional[AvailabilityIndexInterface] = None,
+) -> list[Reservation]:
+    """Active reservations of an office overlapping ``window``, in start order.
+
+    Recurring series are expanded here, and only inside ``window``; their
+    occurrences come back as unsaved reservations without an id. ``replacing``
+    stands in for the stored copy of a series that is being changed.
+
+    Reservations and series come from ``availability_index`` when it can answer.
+    Bookings pass none: their conflict check must see the database itself.
+    """
+    indexed = (
+        availability_index.find_overlapping(office_id, window) if availability_index else None
+    )
+    if indexed is not None:
+        reservations, series_list = indexed
+    else:
+        reservations = reservation_repository.find_by_office_and_time(office_id, window)
+        if series_repository is None:
+            return reservations
+        series_list = series_repository.find_by_office_and_time(office_id, window)
+
+    if replacing is not None:
+        series_list = [
+            replacing if series.series_id == replacing.series_id else series
+            for series in series_list
+        ]
+    occurrences = [
+        series.as_reservation(time_slot)
+        for series in series_list
+        for time_slot in series.occurrences(window)
+    ]
+    if not occurrences:
+        return reservations
+    return sorted(
+        reservations + occurrences, key=lambda reservation: reservation.time_slot.start_time
+    )
@@ -1,11 +1,18 @@
 
+from typing import Optional
+
 from ...domain.exceptions.domain_exceptions import OfficeNotFoundError
+from ...domain.occupancy import peak_occupancy
+from ...domain.time_format import format_date_time, format_time
 from ...domain.value_objects.time_slot import TimeSlot
 from ..dto.reservation_dto import AvailabilityDTO, ConflictingReservationDTO
+from ..interfaces.availability_index import AvailabilityIndexInterface
 from ..interfaces.repository import (
     OfficeRepositoryInterface,
     ReservationRepositoryInterface,
+    ReservationSeriesRepositoryInterface,
 )
+from ..schedule import reservations_in_window
 
 
 class CheckAvailabilityUseCase:
@@ -13,39 +20,53 @@ class CheckAvailabilityUseCase:
         self,
         office_repository: OfficeRepositoryInterface,
         reservation_repository: ReservationRepositoryInterface,
+        series_repository: Optional[ReservationSeriesRepositoryInterface] = None,
+        availability_index: Optional[AvailabilityIndexInterface] = None,
     ) -> None:
         self._office_repository = office_repository
         self._reservation_repository = reservation_repository
+        self._series_repository = series_repository
+        self._availability_index = availability_index
 
-    def execute(self, office_id: int, time_slot: TimeSlot) -> AvailabilityDTO:
+    def execute(
+        self, office_id: int, time_slot: TimeSlot, seats: Optional[int] = None
+    ) -> AvailabilityDTO:
         office = self._office_repository.get_by_id(office_id)
         if not office:
             raise OfficeNotFoundError(office_id)
 
-        conflicting_reservations = self._reservation_repository.find_by_office_and_time(
-            office_id, time_slot
+        overlapping = reservations_in_window(
+            self._reservation_repository,
+            self._series_repository,
+            office_id,
+            time_slot,
+            availability_index=self._availability_index,
         )
+        peak = peak_occupancy(overlapping, time_slot, office.capacity)
+        requested_seats = seats if seats is not None else office.capacity
+        is_available = peak + requested_seats <= office.capacity
 
         conflicts: list[ConflictingReservationDTO] = []
-        for reservation in conflicting_reservations:
-            conflicts.append(
-                ConflictingReservationDTO(
-                    user_name=reservation.user.name,
-                    user_email=reservation.user.contact_info.email,
-                    user_phone=reservation.user.contact_info.phone,
-                    start_time=reservation.time_slot.start_time.strftime("%Y-%m-%d %H:%M"),
-                    end_time=reservation.time_slot.end_time.strftime("%Y-%m-%d %H:%M"),
+        if not is_available:
+            for reservation in overlapping:
+                conflicts.append(
+                    ConflictingReservationDTO(
+                        user_name=reservation.user.name,
+                        user_email=reservation.user.contact_info.email,
+                        user_phone=reservation.user.contact_info.phone,
+                        start_time=format_date_time(reservation.time_slot.start_time),
+                        end_time=format_date_time(reservation.time_slot.end_time),
+                    )
                 )
-            )
-
-        is_available = len(conflicts) == 0
 
         if is_available:
             message = (
                 f"Office {office_id} ({office.name}) is available "
-                f"from {time_slot.start_time.strftime('%Y-%m-%d %H:%M')} "
-                f"to {time_slot.end_time.strftime('%H:%M')}"
+                f"from {format_date_time(time_slot.start_time)} "
+                f"to {format_time(time_slot.end_time)}"
             )
+            if peak:
+                message += f" ({office.capacity - peak} of {office.capacity} seats free)"
         else:
             message = (
                 f"Office {office_id} ({office.name}) is NOT available. "
@@ -56,8 +77,10 @@ class CheckAvailabilityUseCase:
             office_id=office_id,
             office_name=office.name,
             is_available=is_available,
-            requested_start_time=time_slot.start_time.strftime("%Y-%m-%d %H:%M"),
-            requested_end_time=time_slot.end_time.strftime("%Y-%m-%d %H:%M"),
+            requested_start_time=format_date_time(time_slot.start_time),
+            requested_end_time=format_date_time(time_slot.end_time),
             conflicting_reservations=conflicts,
             message=message,
+            capacity=office.capacity,
+            peak_occupancy=peak,
         )
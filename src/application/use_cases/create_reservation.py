@@ -1,56 +1,48 @@
 
+from typing import Optional
+
 from ...domain.entities.reservation import Reservation
 from ...domain.entities.user import User
 from ...domain.exceptions.domain_exceptions import (
     OfficeNotFoundError,
     ReservationConflictError,
 )
+from ...domain.occupancy import peak_occupancy
+from ...domain.time_format import format_date_time, format_timestamp
 from ...domain.value_objects.contact_info import ContactInfo
 from ...domain.value_objects.time_slot import TimeSlot
 from ..dto.reservation_dto import ReservationDTO
 from ..interfaces.notification import NotificationData, NotificationServiceInterface
-from ..interfaces.repository import (
-    OfficeRepositoryInterface,
-    ReservationRepositoryInterface,
-)
+from ..interfaces.repository import BookingLockInterface, OfficeRepositoryInterface
+from ..schedule import reservations_in_window
 
 
 class CreateReservationUseCase:
     def __init__(
         self,
         office_repository: OfficeRepositoryInterface,
-        reservation_repository: ReservationRepositoryInterface,
+        booking_lock: BookingLockInterface,
         notification_service: NotificationServiceInterface,
     ) -> None:
         self._office_repository = office_repository
-        self._reservation_repository = reservation_repository
+        self._booking_lock = booking_lock
         self._notification_service = notification_service
 
-    def execute(
+    def execute(  # noqa: PLR0913
         self,
         office_id: int,
         user_name: str,
         user_email: str,
         user_phone: str,
         time_slot: TimeSlot,
+        *,
+        seats: Optional[int] = None,
     ) -> ReservationDTO:
         office = self._office_repository.get_by_id(office_id)
         if not office:
             raise OfficeNotFoundError(office_id)
-
-        conflicting_reservations = self._reservation_repository.find_by_office_and_time(
-            office_id, time_slot
-        )
-
-        if conflicting_reservations:
-            conflict = conflicting_reservations[0]
-            raise ReservationConflictError(
-                office_id=office_id,
-                conflicting_user=conflict.user.name,
-                end_time=conflict.time_slot.end_time.strftime("%Y-%m-%d %H:%M"),
-                conflicting_email=conflict.user.contact_info.email,
-                conflicting_phone=conflict.user.contact_info.phone,
-            )
+        if seats is not None and seats > office.capacity:
+            raise ValueError(f"Office {office_id} has only {office.capacity} seats")
 
         contact_info = ContactInfo(email=user_email, phone=user_phone)
         user = User(user_id=None, name=user_name, contact_info=contact_info)
@@ -59,11 +51,31 @@ class CreateReservationUseCase:
             office_id=office_id,
             user=user,
             time_slot=time_slot,
+            seats=seats,
         )
+        requested_seats = seats if seats is not None else office.capacity
+
+        # Checking and saving under one lock keeps concurrent bookings from
+        # both fitting into the last free seats.
+        with self._booking_lock.lock_office(office_id) as booking:
+            overlapping = reservations_in_window(
+                booking.reservations, booking.series, office_id, time_slot
+            )
+
+            peak = peak_occupancy(overlapping, time_slot, office.capacity)
+            if peak + requested_seats > office.capacity:
+                conflict = overlapping[0]
+                raise ReservationConflictError(
+                    office_id=office_id,
+                    conflicting_user=conflict.user.name,
+                    end_time=format_date_time(conflict.time_slot.end_time),
+                    conflicting_email=conflict.user.contact_info.email,
+                    conflicting_phone=conflict.user.contact_info.phone,
+                )
 
-        reservation.confirm()
+            reservation.confirm()
 
-        saved_reservation = self._reservation_repository.save(reservation)
+            saved_reservation = booking.reservations.save(reservation)
 
         notification_data = NotificationData(
             recipient_name=user_name,
@@ -71,8 +83,8 @@ class CreateReservationUseCase:
             recipient_phone=user_phone,
             office_id=office_id,
             office_name=office.name,
-            start_time=time_slot.start_time.strftime("%Y-%m-%d %H:%M"),
-            end_time=time_slot.end_time.strftime("%Y-%m-%d %H:%M"),
+            start_time=format_date_time(time_slot.start_time),
+            end_time=format_date_time(time_slot.end_time),
             reservation_id=saved_reservation.reservation_id or 0,
         )
 
@@ -85,8 +97,9 @@ class CreateReservationUseCase:
             user_name=user_name,
             user_email=user_email,
             user_phone=user_phone,
-            start_time=time_slot.start_time.strftime("%Y-%m-%d %H:%M"),
-            end_time=time_slot.end_time.strftime("%Y-%m-%d %H:%M"),
+            start_time=format_date_time(time_slot.start_time),
+            end_time=format_date_time(time_slot.end_time),
             status=saved_reservation.status.value,
-            created_at=saved_reservation.created_at.strftime("%Y-%m-%d %H:%M:%S"),
+            created_at=format_timestamp(saved_reservation.created_at),
+            seats=saved_reservation.seats,
         )
@@ -0,0 +1,118 @@
+from collections.abc import Iterable
+from datetime import date
+from typing import Optional
+
+from ...domain.entities.reservation_series import Recurrence, ReservationSeries
+from ...domain.entities.user import User
+from ...domain.exceptions.domain_exceptions import (
+    OfficeNotFoundError,
+    ReservationConflictError,
+)
+from ...domain.occupancy import first_overbooked
+from ...domain.time_format import format_date_time
+from ...domain.value_objects.contact_info import ContactInfo
+from ...domain.value_objects.time_slot import TimeSlot
+from ..dto.reservation_dto import ReservationSeriesDTO
+from ..interfaces.notification import NotificationData, NotificationServiceInterface
+from ..interfaces.repository import BookingLockInterface, OfficeRepositoryInterface
+from ..schedule import reservations_in_window
+
+
+class CreateReservationSeriesUseCase:
+    def __init__(
+        self,
+        office_repository: OfficeRepositoryInterface,
+        booking_lock: BookingLockInterface,
+        notification_service: NotificationServiceInterface,
+    ) -> None:
+        self._office_repository = office_repository
+        self._booking_lock = booking_lock
+        self._notification_service = notification_service
+
+    def execute(  # noqa: PLR0913
+        self,
+        *,
+        office_id: int,
+        user_name: str,
+        user_email: str,
+        user_phone: str,
+        first_slot: TimeSlot,
+        recurrence: Recurrence,
+        interval: int = 1,
+        until: Optional[date] = None,
+        count: Optional[int] = None,
+        exceptions: Iterable[date] = (),
+        seats: Optional[int] = None,
+    ) -> ReservationSeriesDTO:
+        office = self._office_repository.get_by_id(office_id)
+        if not office:
+            raise OfficeNotFoundError(office_id)
+        if seats is not None and seats > office.capacity:
+            raise ValueError(f"Office {office_id} has only {office.capacity} seats")
+
+        contact_info = ContactInfo(email=user_email, phone=user_phone)
+        series = ReservationSeries(
+            office_id=office_id,
+            user=User(user_id=None, name=user_name, contact_info=contact_info),
+            first_slot=first_slot,
+            recurrence=recurrence,
+            interval=interval,
+            until=until,
+            count=count,
+            exceptions=set(exceptions),
+            seats=seats,
+        )
+        requested_seats = seats if seats is not None else office.capacity
+        span = TimeSlot.from_trusted(first_slot.start_time, series.last_end)
+
+        with self._booking_lock.lock_office(office_id) as booking:
+            # One read for the whole span, then every occurrence is checked
+            # in a single sweep.
+            existing = reservations_in_window(booking.reservations, booking.series, office_id, span)
+            blocking = first_overbooked(
+                series.occurrences(span), existing, office.capacity, requested_seats
+            )
+            if blocking:
+                conflict = blocking[0]
+                raise ReservationConflictError(
+                    office_id=office_id,
+                    conflicting_user=conflict.user.name,
+                    end_time=format_date_time(conflict.time_slot.end_time),
+                    conflicting_email=conflict.user.contact_info.email,
+                    conflicting_phone=conflict.user.contact_info.phone,
+                )
+
+            saved = booking.series.save(series)
+
+        # One notification for the series, not one per occurrence.
+        self._notification_service.send_all(
+            NotificationData(
+                recipient_name=user_name,
+                recipient_email=user_email,
+                recipient_phone=user_phone,
+                office_id=office_id,
+                office_name=office.name,
+                start_time=format_date_time(first_slot.start_time),
+                end_time=format_date_time(first_slot.end_time),
+                reservation_id=saved.series_id or 0,
+            )
+        )
+
+        return ReservationSeriesDTO(
+            series_id=saved.series_id or 0,
+            office_id=office_id,
+            office_name=office.name,
+            user_name=user_name,
+            user_email=user_email,
+            user_phone=user_phone,
+            recurrence=saved.recurrence.value,
+            interval=saved.interval,
+            first_start_time=format_date_time(first_slot.start_time),
+            first_end_time=format_date_time(first_slot.end_time),
+            last_end_time=format_date_time(saved.last_end),
+            occurrence_count=saved.occurrence_count() - len(saved.exceptions),
+            exceptions=sorted(day.isoformat() for day in saved.exceptions),
+            until=saved.until.isoformat() if saved.until else None,
+            count=saved.count,
+            seats=saved.seats,
+        )
@@ -1,10 +1,16 @@
+from typing import Optional
+
 from ...domain.exceptions.domain_exceptions import OfficeNotFoundError
+from ...domain.time_format import format_date_time, format_time
 from ...domain.value_objects.time_slot import TimeSlot
 from ..dto.reservation_dto import ReservationInfoDTO
+from ..interfaces.availability_index import AvailabilityIndexInterface
 from ..interfaces.repository import (
     OfficeRepositoryInterface,
     ReservationRepositoryInterface,
+    ReservationSeriesRepositoryInterface,
 )
+from ..schedule import reservations_in_window
 
 
 class GetReservationInfoUseCase:
@@ -12,16 +18,26 @@ class GetReservationInfoUseCase:
         self,
         office_repository: OfficeRepositoryInterface,
         reservation_repository: ReservationRepositoryInterface,
+        series_repository: Optional[ReservationSeriesRepositoryInterface] = None,
+        availability_index: Optional[AvailabilityIndexInterface] = None,
     ) -> None:
         self._office_repository = office_repository
         self._reservation_repository = reservation_repository
+        self._series_repository = series_repository
+        self._availability_index = availability_index
 
     def execute(self, office_id: int, time_slot: TimeSlot) -> ReservationInfoDTO:
         office = self._office_repository.get_by_id(office_id)
         if not office:
             raise OfficeNotFoundError(office_id)
 
-        reservations = self._reservation_repository.find_by_office_and_time(office_id, time_slot)
+        reservations = reservations_in_window(
+            self._reservation_repository,
+            self._series_repository,
+            office_id,
+            time_slot,
+            availability_index=self._availability_index,
+        )
 
         if not reservations:
             return ReservationInfoDTO(
@@ -30,8 +46,8 @@ class GetReservationInfoUseCase:
                 is_occupied=False,
                 message=(
                     f"Office {office_id} ({office.name}) is free during "
-                    f"{time_slot.start_time.strftime('%Y-%m-%d %H:%M')} - "
-                    f"{time_slot.end_time.strftime('%H:%M')}"
+                    f"{format_date_time(time_slot.start_time)} - "
+                    f"{format_time(time_slot.end_time)}"
                 ),
             )
 
@@ -44,14 +60,14 @@ class GetReservationInfoUseCase:
             occupied_by=reservation.user.name,
             occupant_email=reservation.user.contact_info.email,
             occupant_phone=reservation.user.contact_info.phone,
-            from_time=reservation.time_slot.start_time.strftime("%Y-%m-%d %H:%M"),
-            until_time=reservation.time_slot.end_time.strftime("%Y-%m-%d %H:%M"),
+            from_time=format_date_time(reservation.time_slot.start_time),
+            until_time=format_date_time(reservation.time_slot.end_time),
             message=(
                 f"Office {office_id} ({office.name}) is occupied by "
                 f"{reservation.user.name} "
                 f"({reservation.user.contact_info.email}, "
                 f"{reservation.user.contact_info.phone}) "
-                f"from {reservation.time_slot.start_time.strftime('%Y-%m-%d %H:%M')} "
-                f"until {reservation.time_slot.end_time.strftime('%Y-%m-%d %H:%M')}"
+                f"from {format_date_time(reservation.time_slot.start_time)} "
+                f"until {format_date_time(reservation.time_slot.end_time)}"
             ),
         )
@@ -0,0 +1,114 @@
+from datetime import datetime, timedelta
+from typing import Optional
+
+from ...domain.exceptions.domain_exceptions import OfficeNotFoundError
+from ...domain.time_format import format_date_time
+from ...domain.utilization import Granularity, bucket_edges, occupied_seconds
+from ...domain.value_objects.time_slot import TimeSlot
+from ..dto.utilization_dto import UtilizationBucketDTO, UtilizationDTO
+from ..interfaces.repository import (
+    OfficeRepositoryInterface,
+    ReservationSeriesRepositoryInterface,
+    UtilizationRepositoryInterface,
+)
+
+MAX_BUCKETS = 2000
+
+
+class GetUtilizationUseCase:
+    """Share of an office's time that is booked, per bucket.
+
+    Ranges aligned to hours, days or weeks are read from the rollup table.
+    Anything else (a custom bucket length, or bounds inside a bucket) is
+    computed from the bookings in the range with array operations. Series
+    occurrences are never stored, so they are expanded inside the range and
+    added the same way.
+    """
+
+    def __init__(
+        self,
+        office_repository: OfficeRepositoryInterface,
+        utilization_repository: UtilizationRepositoryInterface,
+        series_repository: Optional[ReservationSeriesRepositoryInterface] = None,
+    ) -> None:
+        self._office_repository = office_repository
+        self._utilization_repository = utilization_repository
+        self._series_repository = series_repository
+
+    def execute(
+        self,
+        office_id: int,
+        start: datetime,
+        end: datetime,
+        granularity: Granularity = Granularity.DAY,
+        bucket: Optional[timedelta] = None,
+    ) -> UtilizationDTO:
+        office = self._office_repository.get_by_id(office_id)
+        if not office:
+            raise OfficeNotFoundError(office_id)
+        if start >= end:
+            raise ValueError("The range must end after it starts")
+
+        length = bucket or granularity.length
+        if (end - start) / length > MAX_BUCKETS:
+            raise ValueError(f"A report can have at most {MAX_BUCKETS} buckets")
+        edges = bucket_edges(start, end, length)
+
+        use_rollups = bucket is None and all(
+            granularity.floor(moment) == moment for moment in (start, end)
+        )
+        if use_rollups:
+            rollups = self._utilization_repository.find_rollups(office_id, granularity, start, end)
+            occupied = []
+            for bucket_start in edges[:-1]:
+                whole, seat = rollups.get(bucket_start, (0, 0))
+                occupied.append(whole + seat / office.capacity)
+        else:
+            starts, ends, seats = self._utilization_repository.find_booked_times(
+                office_id, start, end
+            )
+            occupied = occupied_seconds(
+                starts, ends, [self._weight(count, office.capacity) for count in seats], edges
+            )
+
+        if self._series_repository is not None:
+            window = TimeSlot.from_trusted(start, end)
+            occurrences = [
+                (time_slot, series.seats)
+                for series in self._series_repository.find_by_office_and_time(office_id, window)
+                for time_slot in series.occurrences(window)
+            ]
+            if occurrences:
+                from_series = occupied_seconds(
+                    [time_slot.start_time for time_slot, _ in occurrences],
+                    [time_slot.end_time for time_slot, _ in occurrences],
+                    [self._weight(count, office.capacity) for _, count in occurrences],
+                    edges,
+                )
+                occupied = [
+                    booked + extra for booked, extra in zip(occupied, from_series)
+                ]
+
+        buckets = [
+            UtilizationBucketDTO(
+                start_time=format_date_time(left),
+                occupied_hours=round(seconds / 3600, 2),
+                utilization=round(seconds / (right - left).total_seconds(), 4),
+            )
+            for left, right, seconds in zip(edges, edges[1:], occupied)
+        ]
+        return UtilizationDTO(
+            office_id=office_id,
+            office_name=office.name,
+            start_time=format_date_time(start),
+            end_time=format_date_time(end),
+            bucket=granularity.value if bucket is None else f"{bucket // timedelta(minutes=1)}m",
+            source="rollup" if use_rollups else "adhoc",
+            utilization=round(sum(occupied) / (end - start).total_seconds(), 4),
+            buckets=buckets,
+        )
+
+    @staticmethod
+    def _weight(seats: Optional[int], capacity: int) -> float:
+        # A whole-office booking occupies all of it; a shared one its seats.
+        return 1.0 if seats is None else seats / capacity
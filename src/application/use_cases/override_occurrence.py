@@ -0,0 +1,118 @@
+from dataclasses import replace
+from datetime import date
+from typing import Optional
+
+from ...domain.exceptions.domain_exceptions import (
+    OfficeNotFoundError,
+    ReservationConflictError,
+    ReservationSeriesNotFoundError,
+)
+from ...domain.occupancy import peak_occupancy
+from ...domain.time_format import format_date_time, format_timestamp
+from ...domain.value_objects.time_slot import TimeSlot
+from ..dto.reservation_dto import ReservationDTO
+from ..interfaces.notification import NotificationData, NotificationServiceInterface
+from ..interfaces.repository import (
+    BookingLockInterface,
+    OfficeRepositoryInterface,
+    ReservationSeriesRepositoryInterface,
+)
+from ..schedule import reservations_in_window
+
+
+class OverrideOccurrenceUseCase:
+    """Cancel one occurrence of a series, or move it to another time that day.
+
+    A moved occurrence is materialized as a standalone reservation and its
+    date becomes an exception of the series; the other occurrences stay
+    virtual.
+    """
+
+    def __init__(
+        self,
+        office_repository: OfficeRepositoryInterface,
+        series_repository: ReservationSeriesRepositoryInterface,
+        booking_lock: BookingLockInterface,
+        notification_service: NotificationServiceInterface,
+    ) -> None:
+        self._office_repository = office_repository
+        self._series_repository = series_repository
+        self._booking_lock = booking_lock
+        self._notification_service = notification_service
+
+    def execute(
+        self, series_id: int, day: date, time_slot: Optional[TimeSlot] = None
+    ) -> Optional[ReservationDTO]:
+        found = self._series_repository.get_by_id(series_id)
+        if not found:
+            raise ReservationSeriesNotFoundError(series_id)
+        office = self._office_repository.get_by_id(found.office_id)
+        if not office:
+            raise OfficeNotFoundError(found.office_id)
+
+        with self._booking_lock.lock_office(found.office_id) as booking:
+            # Read again under the lock, so concurrent overrides of the same
+            # series do not drop each other's exceptions.
+            series = booking.series.get_by_id(series_id)
+            if not series:
+                raise ReservationSeriesNotFoundError(series_id)
+            if time_slot is None:
+                series.skip(day)
+                booking.series.save(series)
+                return None
+
+            reservation = replace(series.materialize(day), time_slot=time_slot)
+            requested_seats = (
+                reservation.seats if reservation.seats is not None else office.capacity
+            )
+
+            overlapping = reservations_in_window(
+                booking.reservations,
+                booking.series,
+                series.office_id,
+                time_slot,
+                replacing=series,
+            )
+            peak = peak_occupancy(overlapping, time_slot, office.capacity)
+            if peak + requested_seats > office.capacity:
+                conflict = overlapping[0]
+                raise ReservationConflictError(
+                    office_id=series.office_id,
+                    conflicting_user=conflict.user.name,
+                    end_time=format_date_time(conflict.time_slot.end_time),
+                    conflicting_email=conflict.user.contact_info.email,
+                    conflicting_phone=conflict.user.contact_info.phone,
+                )
+
+            reservation.confirm()
+            # The reservation is saved first: failing between the two commits
+            # leaves the occurrence doubled for its owner rather than lost.
+            saved = booking.reservations.save(reservation)
+            booking.series.save(series)
+
+        self._notification_service.send_all(
+            NotificationData(
+                recipient_name=saved.user.name,
+                recipient_email=saved.user.contact_info.email,
+                recipient_phone=saved.user.contact_info.phone,
+                office_id=office.office_id,
+                office_name=office.name,
+                start_time=format_date_time(time_slot.start_time),
+                end_time=format_date_time(time_slot.end_time),
+                reservation_id=saved.reservation_id or 0,
+            )
+        )
+
+        return ReservationDTO(
+            reservation_id=saved.reservation_id,
+            office_id=office.office_id,
+            office_name=office.name,
+            user_name=saved.user.name,
+            user_email=saved.user.contact_info.email,
+            user_phone=saved.user.contact_info.phone,
+            start_time=format_date_time(time_slot.start_time),
+            end_time=format_date_time(time_slot.end_time),
+            status=saved.status.value,
+            created_at=format_timestamp(saved.created_at),
+            seats=saved.seats,
+        )
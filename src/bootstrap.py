@@ -1,12 +1,35 @@
+import time
+from collections.abc import Callable
+from contextlib import AbstractContextManager
+from functools import partial
+from typing import TYPE_CHECKING, Optional
+
+from sqlalchemy.orm import Session
+
+from config.logging import get_logger, setup_logging
 from config.settings import settings
+from src.application.interfaces.availability_index import AvailabilityIndexInterface
 from src.application.interfaces.cache import CacheInterface
+from src.application.interfaces.notification import NotificationServiceInterface
 from src.application.interfaces.repository import OfficeRepositoryInterface
 from src.application.use_cases.check_availability import CheckAvailabilityUseCase
 from src.application.use_cases.create_reservation import CreateReservationUseCase
+from src.application.use_cases.create_reservation_series import (
+    CreateReservationSeriesUseCase,
+)
 from src.application.use_cases.get_reservation_info import GetReservationInfoUseCase
+from src.application.use_cases.get_utilization import GetUtilizationUseCase
+from src.application.use_cases.override_occurrence import OverrideOccurrenceUseCase
 from src.domain.entities.office import Office
-from src.infrastructure.cache.redis_cache import RedisCache
+from src.infrastructure.cache.availability_index import InMemoryAvailabilityIndex
+from src.infrastructure.cache.memory_cache import InMemoryCache
+from src.infrastructure.database.archival import ReservationSweeper
+from src.infrastructure.database.availability import rebuild_availability_index
+from src.infrastructure.database.booking_lock import SessionBookingLock, joined_session
 from src.infrastructure.database.connection import DatabaseConnection
+from src.infrastructure.database.models import SCHEMA_VERSION
+from src.infrastructure.database.partitions import ReservationPartitions
+from src.infrastructure.database.replicas import ReadYourWritesPins
 from src.infrastructure.database.repositories.cached_office_repository import (
     CachedOfficeRepository,
 )
@@ -14,23 +37,67 @@ from src.infrastructure.database.repositories.office_repository import OfficeRep
 from src.infrastructure.database.repositories.reservation_repository import (
     ReservationRepository,
 )
-from src.infrastructure.notifications.combined_notifier import (
-    CombinedNotificationService,
+from src.infrastructure.database.repositories.series_repository import (
+    ReservationSeriesRepository,
+)
+from src.infrastructure.database.repositories.utilization_repository import (
+    UtilizationRepository,
 )
-from src.infrastructure.notifications.email_notifier import EmailNotifier
-from src.infrastructure.notifications.sms_notifier import SMSNotifier
+from src.infrastructure.database.rollups import backfill_rollups
+from src.infrastructure.database.schema import (
+    ensure_office_catalog,
+    ensure_reservation_periods,
+    ensure_reservation_seats,
+    get_schema_version,
+    set_schema_version,
+)
+from src.infrastructure.notifications.lazy_notifier import LazyNotificationService
+from src.infrastructure.security.idempotency import IdempotencyKeys
 from src.infrastructure.security.rate_limiter import RateLimiter
 from src.presentation.controllers.reservation_controller import ReservationController
 
+# Redis, the SMTP/SMS notifiers and the HTTP application are imported inside
+# the functions that build them, so CLI commands that never touch them start
+# faster.
+if TYPE_CHECKING:
+    from src.presentation.http.application import Application
+
+logger = get_logger(__name__)
+
 
 def initialize_database(db: DatabaseConnection) -> None:
-    db.create_tables()
+    partitions = create_reservation_partitions(db)
+    if get_schema_version(db) != SCHEMA_VERSION:
+        if partitions is not None:
+            # Must precede create_all, which would create a plain table.
+            partitions.create_table()
+        db.create_tables()
+        ensure_reservation_periods(db)
+        ensure_office_catalog(db)
+        ensure_reservation_seats(db)
+        backfill_rollups(db)
+        _seed_offices(db)
+        set_schema_version(db, SCHEMA_VERSION)
+
+    if partitions is not None:
+        # Keeps the coming months' partitions in place even with the sweep off.
+        partitions.rotate()
 
+
+def create_reservation_partitions(db: DatabaseConnection) -> Optional[ReservationPartitions]:
+    if settings.reservation_partitioning != "monthly":
+        return None
+    if db.dialect_name != "postgresql":
+        logger.warning("RESERVATION_PARTITIONING=monthly needs PostgreSQL; ignoring it")
+        return None
+    return ReservationPartitions(db, months_ahead=settings.partition_months_ahead)
+
+
+def _seed_offices(db: DatabaseConnection) -> None:
     with db.session_scope() as session:
         office_repo = OfficeRepository(session)
 
-        existing_offices = office_repo.find_all()
-        if existing_offices:
+        if office_repo.find_page(limit=1):
             return
 
         offices = [
@@ -71,9 +138,34 @@ def initialize_database(db: DatabaseConnection) -> None:
 
 
 def create_cache() -> CacheInterface:
+    if settings.cache_backend == "memory":
+        return InMemoryCache()
+
+    from src.infrastructure.cache.redis_cache import RedisCache  # noqa: PLC0415
+
     return RedisCache(settings.redis_url)
 
 
+def create_availability_index() -> Optional[AvailabilityIndexInterface]:
+    if settings.availability_index == "memory":
+        return InMemoryAvailabilityIndex()
+    if settings.availability_index != "redis":
+        return None
+
+    from src.infrastructure.cache.redis_availability_index import (  # noqa: PLC0415
+        RedisAvailabilityIndex,
+    )
+
+    return RedisAvailabilityIndex(settings.redis_url)
+
+
+def rebuild_availability(db: DatabaseConnection, office_id: Optional[int] = None) -> int:
+    index = create_availability_index()
+    if index is None:
+        raise ValueError("AVAILABILITY_INDEX is not enabled")
+    return rebuild_availability_index(db, index, None if office_id is None else [office_id])
+
+
 def create_rate_limiter(cache: CacheInterface) -> RateLimiter:
     return RateLimiter(
         cache=cache,
@@ -82,18 +174,12 @@ def create_rate_limiter(cache: CacheInterface) -> RateLimiter:
     )
 
 
-def create_dependency_container(
-    db: DatabaseConnection, cache: CacheInterface
-) -> tuple[ReservationController, OfficeRepositoryInterface]:
-    session = db.get_session()
-
-    base_office_repository = OfficeRepository(session)
-    office_repository = CachedOfficeRepository(
-        repository=base_office_repository,
-        cache=cache,
-        ttl_seconds=settings.cache_ttl,
+def create_notification_service() -> NotificationServiceInterface:
+    from src.infrastructure.notifications.combined_notifier import (  # noqa: PLC0415
+        CombinedNotificationService,
     )
-    reservation_repository = ReservationRepository(session)
+    from src.infrastructure.notifications.email_notifier import EmailNotifier  # noqa: PLC0415
+    from src.infrastructure.notifications.sms_notifier import SMSNotifier  # noqa: PLC0415
 
     email_notifier = EmailNotifier(
         smtp_host=settings.smtp_host,
@@ -108,32 +194,186 @@ def create_dependency_container(
         sender=settings.osonsms_sender,
         server=settings.osonsms_server,
     )
-    notification_service = CombinedNotificationService(
-        email_notifier=email_notifier, sms_notifier=sms_notifier
+    return CombinedNotificationService(email_notifier=email_notifier, sms_notifier=sms_notifier)
+
+
+def create_dependency_container(
+    db: DatabaseConnection,
+    cache: CacheInterface,
+    notification_service: Optional[NotificationServiceInterface] = None,
+    session: Optional[Session] = None,
+    availability_index: Optional[AvailabilityIndexInterface] = None,
+) -> tuple[ReservationController, OfficeRepositoryInterface]:
+    # Bookings always read and write the primary, each in a session of its
+    # own: the long-lived one below is shared by the HTTP server's threads.
+    # The read-only use cases and the office listing go through a
+    # replica-routed session when replicas are configured. An explicit
+    # session serves all of them.
+    #
+    # Writes are mirrored into ``availability_index`` as they commit. An
+    # explicit session may belong to an outer transaction whose commits are
+    # only savepoints, so its caller keeps the index in step instead.
+    synced_index = availability_index if session is None else None
+    booking_scope: Callable[[], AbstractContextManager[Session]]
+    if session is None:
+        booking_scope = db.session_scope
+        session = db.get_session()
+        read_session = db.get_read_session() if db.has_replicas else session
+    else:
+        booking_scope = partial(joined_session, session)
+        read_session = session
+
+    postgres = db.dialect_name == "postgresql"
+    office_repository = CachedOfficeRepository(
+        repository=OfficeRepository(session, full_text_search=postgres),
+        cache=cache,
+        ttl_seconds=settings.cache_ttl,
     )
+    reservation_repository = ReservationRepository(session, range_overlap=postgres)
+    series_repository = ReservationSeriesRepository(session)
+    booking_lock = SessionBookingLock(
+        booking_scope, range_overlap=postgres, availability_index=synced_index
+    )
+    if read_session is session:
+        read_office_repository: OfficeRepositoryInterface = office_repository
+        read_reservation_repository = reservation_repository
+        read_series_repository = series_repository
+    else:
+        read_office_repository = CachedOfficeRepository(
+            repository=OfficeRepository(read_session, full_text_search=postgres),
+            cache=cache,
+            ttl_seconds=settings.cache_ttl,
+        )
+        read_reservation_repository = ReservationRepository(read_session, range_overlap=postgres)
+        read_series_repository = ReservationSeriesRepository(read_session)
+
+    if notification_service is None:
+        notification_service = LazyNotificationService(create_notification_service)
 
     check_availability_use_case = CheckAvailabilityUseCase(
-        office_repository=office_repository, reservation_repository=reservation_repository
+        office_repository=read_office_repository,
+        reservation_repository=read_reservation_repository,
+        series_repository=read_series_repository,
+        availability_index=availability_index,
     )
 
     create_reservation_use_case = CreateReservationUseCase(
         office_repository=office_repository,
-        reservation_repository=reservation_repository,
+        booking_lock=booking_lock,
         notification_service=notification_service,
     )
 
     get_reservation_info_use_case = GetReservationInfoUseCase(
-        office_repository=office_repository, reservation_repository=reservation_repository
+        office_repository=read_office_repository,
+        reservation_repository=read_reservation_repository,
+        series_repository=read_series_repository,
+        availability_index=availability_index,
+    )
+
+    create_series_use_case = CreateReservationSeriesUseCase(
+        office_repository=office_repository,
+        booking_lock=booking_lock,
+        notification_service=notification_service,
+    )
+
+    override_occurrence_use_case = OverrideOccurrenceUseCase(
+        office_repository=office_repository,
+        series_repository=series_repository,
+        booking_lock=booking_lock,
+        notification_service=notification_service,
+    )
+
+    get_utilization_use_case = GetUtilizationUseCase(
+        office_repository=read_office_repository,
+        utilization_repository=UtilizationRepository(read_session),
+        series_repository=read_series_repository,
     )
 
     controller = ReservationController(
         check_availability_use_case=check_availability_use_case,
         create_reservation_use_case=create_reservation_use_case,
         get_reservation_info_use_case=get_reservation_info_use_case,
+        create_series_use_case=create_series_use_case,
+        override_occurrence_use_case=override_occurrence_use_case,
+        get_utilization_use_case=get_utilization_use_case,
     )
 
-    return controller, office_repository
+    return controller, read_office_repository
 
 
 def get_database_connection() -> DatabaseConnection:
-    return DatabaseConnection(settings.database_url)
+    return DatabaseConnection(
+        settings.database_url,
+        slow_query_threshold_ms=settings.slow_query_threshold_ms,
+        explain_slow_queries=settings.explain_slow_queries,
+        replica_urls=settings.database_replica_urls,
+        replica_max_lag=settings.replica_max_lag,
+    )
+
+
+def create_sweeper(
+    db: DatabaseConnection,
+    *,
+    retention_days: Optional[int] = None,
+    batch_size: Optional[int] = None,
+    pause_seconds: Optional[float] = None,
+) -> ReservationSweeper:
+    return ReservationSweeper(
+        db,
+        retention_days=settings.archive_retention_days if retention_days is None else retention_days,
+        batch_size=batch_size or settings.sweep_batch_size,
+        pause_seconds=settings.sweep_batch_pause if pause_seconds is None else pause_seconds,
+        partitions=create_reservation_partitions(db),
+    )
+
+
+def create_application(db: DatabaseConnection, cache: CacheInterface) -> "Application":
+    from src.presentation.http.application import Application  # noqa: PLC0415
+
+    controller, office_repository = create_dependency_container(
+        db, cache, availability_index=create_availability_index()
+    )
+    if settings.sweep_interval > 0:
+        create_sweeper(db).start(settings.sweep_interval)
+    read_your_writes = None
+    if db.has_replicas:
+        db.start_heartbeat()
+        read_your_writes = ReadYourWritesPins(cache, settings.read_your_writes_seconds)
+    return Application(
+        controller,
+        office_repository,
+        rate_limiter=create_rate_limiter(cache),
+        read_your_writes=read_your_writes,
+        idempotency=IdempotencyKeys(cache, settings.idempotency_ttl),
+    )
+
+
+def configure_logging() -> None:
+    setup_logging(
+        debug=settings.debug,
+        log_file=settings.log_file or None,
+        json_output=settings.log_format == "json",
+    )
+
+
+def warm_up(application: "Application", db: DatabaseConnection) -> None:
+    started = time.perf_counter()
+    connections = db.warm_up()
+    offices = application.warm_up()
+    application.mark_ready()
+    logger.info(
+        "Warm-up done in %.1f ms: %s DB connections, %s offices cached",
+        (time.perf_counter() - started) * 1000,
+        connections,
+        offices,
+    )
+
+
+def load_application() -> "Application":
+    """Build a ready-to-serve application for servers that import it (WSGI/ASGI)."""
+    configure_logging()
+    db = get_database_connection()
+    initialize_database(db)
+    application = create_application(db, create_cache())
+    warm_up(application, db)
+    return application
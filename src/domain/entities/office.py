@@ -1,23 +1,42 @@
 from dataclasses import dataclass
 from typing import Optional
 
+from ..slots import DATACLASS_SLOTS
 
-@dataclass
+
+@dataclass(**DATACLASS_SLOTS)
 class Office:
     office_id: int
     name: str
     capacity: int
     description: Optional[str] = None
+    building: Optional[str] = None
 
     def __post_init__(self) -> None:
         self._validate()
 
     MIN_OFFICE_ID = 1
-    MAX_OFFICE_ID = 5
+
+    @classmethod
+    def from_trusted(
+        cls,
+        office_id: int,
+        name: str,
+        capacity: int,
+        description: Optional[str] = None,
+        building: Optional[str] = None,
+    ) -> "Office":
+        instance = object.__new__(cls)
+        instance.office_id = office_id
+        instance.name = name
+        instance.capacity = capacity
+        instance.description = description
+        instance.building = building
+        return instance
 
     def _validate(self) -> None:
-        if self.office_id < self.MIN_OFFICE_ID or self.office_id > self.MAX_OFFICE_ID:
-            raise ValueError(f"Office ID must be between {self.MIN_OFFICE_ID} and {self.MAX_OFFICE_ID}")
+        if self.office_id < self.MIN_OFFICE_ID:
+            raise ValueError(f"Office ID must be at least {self.MIN_OFFICE_ID}")
 
         if not self.name or not self.name.strip():
             raise ValueError("Office name cannot be empty")
@@ -31,5 +50,6 @@ class Office:
     def __repr__(self) -> str:
         return (
             f"Office(office_id={self.office_id}, name='{self.name}', "
-            f"capacity={self.capacity}, description='{self.description}')"
+            f"capacity={self.capacity}, description='{self.description}', "
+            f"building='{self.building}')"
         )
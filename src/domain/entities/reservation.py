@@ -3,6 +3,7 @@ from datetime import datetime
 from enum import Enum
 from typing import Optional
 
+from ..slots import DATACLASS_SLOTS
 from ..value_objects.time_slot import TimeSlot
 from .user import User
 
@@ -14,7 +15,7 @@ class ReservationStatus(Enum):
     COMPLETED = "completed"
 
 
-@dataclass
+@dataclass(**DATACLASS_SLOTS)
 class Reservation:
     office_id: int
     user: User
@@ -22,20 +23,48 @@ class Reservation:
     reservation_id: Optional[int] = None
     status: ReservationStatus = field(default=ReservationStatus.PENDING)
     created_at: datetime = field(default_factory=datetime.now)
+    # Seats held in a shared office; None books the whole office.
+    seats: Optional[int] = None
 
     def __post_init__(self) -> None:
         self._validate()
 
     MIN_OFFICE_ID = 1
-    MAX_OFFICE_ID = 5
+
+    @classmethod
+    def from_trusted(  # noqa: PLR0913
+        cls,
+        *,
+        office_id: int,
+        user: User,
+        time_slot: TimeSlot,
+        reservation_id: Optional[int],
+        status: ReservationStatus,
+        created_at: datetime,
+        seats: Optional[int] = None,
+    ) -> "Reservation":
+        # Rows read back from our own database were validated when written.
+        instance = object.__new__(cls)
+        instance.office_id = office_id
+        instance.user = user
+        instance.time_slot = time_slot
+        instance.reservation_id = reservation_id
+        instance.status = status
+        instance.created_at = created_at
+        instance.seats = seats
+        return instance
 
     def _validate(self) -> None:
-        if self.office_id < self.MIN_OFFICE_ID or self.office_id > self.MAX_OFFICE_ID:
-            raise ValueError(f"Office ID must be between {self.MIN_OFFICE_ID} and {self.MAX_OFFICE_ID}")
+        # Whether the office exists is the repository's call, not the entity's.
+        if self.office_id < self.MIN_OFFICE_ID:
+            raise ValueError(f"Office ID must be at least {self.MIN_OFFICE_ID}")
 
         if not self.time_slot.is_valid():
             raise ValueError("Invalid time slot")
 
+        if self.seats is not None and self.seats < 1:
+            raise ValueError("Seats must be at least 1")
+
     def is_active(self) -> bool:
         return self.status in {ReservationStatus.PENDING, ReservationStatus.CONFIRMED}
 
@@ -79,5 +108,5 @@ class Reservation:
         return (
             f"Reservation(reservation_id={self.reservation_id}, "
             f"office_id={self.office_id}, user={self.user}, "
-            f"time_slot={self.time_slot}, status={self.status})"
+            f"time_slot={self.time_slot}, status={self.status}, seats={self.seats})"
         )
@@ -0,0 +1,173 @@
+from collections.abc import Iterator
+from dataclasses import dataclass, field
+from datetime import date, datetime, timedelta
+from enum import Enum
+from typing import Optional
+
+from ..slots import DATACLASS_SLOTS
+from ..value_objects.time_slot import TimeSlot
+from .reservation import Reservation, ReservationStatus
+from .user import User
+
+
+class Recurrence(Enum):
+    DAILY = "daily"
+    WEEKLY = "weekly"
+
+
+_PERIOD = {Recurrence.DAILY: timedelta(days=1), Recurrence.WEEKLY: timedelta(weeks=1)}
+
+
+@dataclass(**DATACLASS_SLOTS)
+class ReservationSeries:
+    """A recurring booking stored once and expanded into occurrences on demand.
+
+    Occurrences repeat ``first_slot`` every ``interval`` days or weeks, up to
+    ``count`` of them and/or while they start on or before ``until``. Dates
+    in ``exceptions`` are skipped: cancelled, or overridden by a standalone
+    reservation materialized from the series.
+    """
+
+    office_id: int
+    user: User
+    first_slot: TimeSlot
+    recurrence: Recurrence
+    interval: int = 1
+    until: Optional[date] = None
+    count: Optional[int] = None
+    exceptions: set[date] = field(default_factory=set)
+    seats: Optional[int] = None
+    series_id: Optional[int] = None
+    created_at: datetime = field(default_factory=datetime.now)
+
+    MAX_OCCURRENCES = 520
+
+    def __post_init__(self) -> None:
+        self._validate()
+
+    @classmethod
+    def from_trusted(  # noqa: PLR0913
+        cls,
+        *,
+        office_id: int,
+        user: User,
+        first_slot: TimeSlot,
+        recurrence: Recurrence,
+        interval: int,
+        until: Optional[date],
+        count: Optional[int],
+        exceptions: set[date],
+        seats: Optional[int],
+        series_id: Optional[int],
+        created_at: datetime,
+    ) -> "ReservationSeries":
+        instance = object.__new__(cls)
+        instance.office_id = office_id
+        instance.user = user
+        instance.first_slot = first_slot
+        instance.recurrence = recurrence
+        instance.interval = interval
+        instance.until = until
+        instance.count = count
+        instance.exceptions = exceptions
+        instance.seats = seats
+        instance.series_id = series_id
+        instance.created_at = created_at
+        return instance
+
+    def _validate(self) -> None:
+        if self.office_id < Reservation.MIN_OFFICE_ID:
+            raise ValueError(f"Office ID must be at least {Reservation.MIN_OFFICE_ID}")
+
+        if not self.first_slot.is_valid():
+            raise ValueError("Invalid time slot")
+
+        if self.interval < 1:
+            raise ValueError("Interval must be at least 1")
+
+        if self.until is None and self.count is None:
+            raise ValueError("A series needs an until date or an occurrence count")
+
+        if self.count is not None and self.count < 1:
+            raise ValueError("Count must be at least 1")
+
+        if self.until is not None and self.until < self.first_slot.start_time.date():
+            raise ValueError("Until date is before the first occurrence")
+
+        if self.occurrence_count() > self.MAX_OCCURRENCES:
+            raise ValueError(f"A series cannot have more than {self.MAX_OCCURRENCES} occurrences")
+
+        if self.seats is not None and self.seats < 1:
+            raise ValueError("Seats must be at least 1")
+
+        for day in self.exceptions:
+            if not self._generates(day):
+                raise ValueError(f"Exception {day.isoformat()} is not an occurrence date")
+
+    @property
+    def period(self) -> timedelta:
+        return _PERIOD[self.recurrence] * self.interval
+
+    def occurrence_count(self) -> int:
+        """Occurrences the rule generates, exceptions included."""
+        total = self.count if self.count is not None else self.MAX_OCCURRENCES + 1
+        if self.until is not None:
+            days = (self.until - self.first_slot.start_time.date()).days
+            total = min(total, days // self.period.days + 1)
+        return total
+
+    @property
+    def last_end(self) -> datetime:
+        return self.first_slot.end_time + self.period * (self.occurrence_count() - 1)
+
+    def occurrences(self, window: TimeSlot) -> Iterator[TimeSlot]:
+        """Occurrences overlapping ``window``, without generating earlier ones."""
+        period = self.period
+        # First index whose end falls after the window start.
+        first_index = max(0, (window.start_time - self.first_slot.end_time) // period + 1)
+        for index in range(first_index, self.occurrence_count()):
+            start = self.first_slot.start_time + period * index
+            if start >= window.end_time:
+                break
+            if start.date() not in self.exceptions:
+                yield TimeSlot.from_trusted(start, self.first_slot.end_time + period * index)
+
+    def _generates(self, day: date) -> bool:
+        offset = day - self.first_slot.start_time.date()
+        index, remainder = divmod(offset, self.period)
+        return offset.days >= 0 and not remainder and index < self.occurrence_count()
+
+    def occurrence_on(self, day: date) -> TimeSlot:
+        if day in self.exceptions or not self._generates(day):
+            raise ValueError(f"Series {self.series_id} has no occurrence on {day.isoformat()}")
+        offset = day - self.first_slot.start_time.date()
+        return TimeSlot.from_trusted(
+            self.first_slot.start_time + offset, self.first_slot.end_time + offset
+        )
+
+    def skip(self, day: date) -> None:
+        self.occurrence_on(day)
+        self.exceptions.add(day)
+
+    def materialize(self, day: date) -> Reservation:
+        """Detach one occurrence as a standalone reservation that can be changed alone."""
+        time_slot = self.occurrence_on(day)
+        self.exceptions.add(day)
+        return Reservation(
+            office_id=self.office_id,
+            user=self.user,
+            time_slot=time_slot,
+            seats=self.seats,
+        )
+
+    def as_reservation(self, time_slot: TimeSlot) -> Reservation:
+        """An unsaved, confirmed stand-in for one occurrence in conflict checks."""
+        return Reservation.from_trusted(
+            office_id=self.office_id,
+            user=self.user,
+            time_slot=time_slot,
+            reservation_id=None,
+            status=ReservationStatus.CONFIRMED,
+            created_at=self.created_at,
+            seats=self.seats,
+        )
@@ -1,10 +1,11 @@
 from dataclasses import dataclass
 from typing import Optional
 
+from ..slots import DATACLASS_SLOTS
 from ..value_objects.contact_info import ContactInfo
 
 
-@dataclass
+@dataclass(**DATACLASS_SLOTS)
 class User:
     user_id: Optional[int]
     name: str
@@ -13,6 +14,16 @@ class User:
     def __post_init__(self) -> None:
         self._validate()
 
+    @classmethod
+    def from_trusted(
+        cls, user_id: Optional[int], name: str, contact_info: ContactInfo
+    ) -> "User":
+        instance = object.__new__(cls)
+        instance.user_id = user_id
+        instance.name = name
+        instance.contact_info = contact_info
+        return instance
+
     def _validate(self) -> None:
         if not self.name or not self.name.strip():
             raise ValueError("User name cannot be empty")
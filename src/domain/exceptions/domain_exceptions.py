@@ -44,3 +44,8 @@ class ReservationNotFoundError(DomainError):
         super().__init__(
             f"Reservation with ID {reservation_id} not found", {"reservation_id": reservation_id}
         )
+
+
+class ReservationSeriesNotFoundError(DomainError):
+    def __init__(self, series_id: int) -> None:
+        super().__init__(f"Reservation series {series_id} not found", {"series_id": series_id})
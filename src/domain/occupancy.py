@@ -0,0 +1,60 @@
+from collections.abc import Iterable
+from datetime import datetime
+from typing import Optional
+
+from .entities.reservation import Reservation
+from .value_objects.time_slot import TimeSlot
+
+
+def seats_taken(reservation: Reservation, capacity: int) -> int:
+    """Seats a reservation holds; one without a seat count takes the whole office."""
+    return reservation.seats if reservation.seats is not None else capacity
+
+
+def peak_occupancy(reservations: Iterable[Reservation], window: TimeSlot, capacity: int) -> int:
+    """Highest number of seats held at any instant inside ``window``.
+
+    One sweep over the sorted start (+seats) and end (-seats) events: O(n log n)
+    instead of comparing every pair. Ends sort before starts at the same
+    instant, since slots are half-open and back-to-back bookings never meet.
+    """
+    events: list[tuple[datetime, int]] = []
+    for reservation in reservations:
+        start = max(reservation.time_slot.start_time, window.start_time)
+        end = min(reservation.time_slot.end_time, window.end_time)
+        if start < end:
+            seats = seats_taken(reservation, capacity)
+            events.append((start, seats))
+            events.append((end, -seats))
+    events.sort()
+
+    peak = current = 0
+    for _, delta in events:
+        current += delta
+        peak = max(peak, current)
+    return peak
+
+
+def first_overbooked(
+    slots: Iterable[TimeSlot], reservations: Iterable[Reservation], capacity: int, seats: int
+) -> Optional[list[Reservation]]:
+    """Reservations overlapping the first of ``slots`` that cannot take ``seats`` more.
+
+    ``slots`` must be in chronological order and must not overlap. Both lists
+    are swept once, so checking a whole series costs one pass over the
+    reservations in its span rather than a query per occurrence.
+    """
+    pending = sorted(reservations, key=lambda reservation: reservation.time_slot.start_time)
+    active: list[Reservation] = []
+    next_index = 0
+    for slot in slots:
+        while (
+            next_index < len(pending)
+            and pending[next_index].time_slot.start_time < slot.end_time
+        ):
+            active.append(pending[next_index])
+            next_index += 1
+        active = [r for r in active if r.time_slot.end_time > slot.start_time]
+        if peak_occupancy(active, slot, capacity) + seats > capacity:
+            return active
+    return None
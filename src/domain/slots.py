@@ -0,0 +1,6 @@
+import sys
+from typing import Any
+
+# dataclass(slots=True) is only available from Python 3.10; older interpreters
+# fall back to regular dict-backed instances with identical behavior.
+DATACLASS_SLOTS: dict[str, Any] = {"slots": True} if sys.version_info >= (3, 10) else {}
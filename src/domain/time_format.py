@@ -0,0 +1,36 @@
+from datetime import datetime
+
+DATE_TIME_FORMAT = "%Y-%m-%d %H:%M"
+
+_DATE_LENGTH = 10
+_TIME_LENGTH = 5
+
+
+def parse_date_time(date: str, time: str) -> datetime:
+    # Fast path for the canonical YYYY-MM-DD / HH:MM shape; anything else (or a
+    # malformed value) goes through strptime so accepted inputs and error
+    # messages stay the same.
+    if (
+        len(date) == _DATE_LENGTH
+        and len(time) == _TIME_LENGTH
+        and date[4] == "-"
+        and date[7] == "-"
+        and time[2] == ":"
+    ):
+        try:
+            return datetime.fromisoformat(f"{date} {time}")
+        except ValueError:
+            pass
+    return datetime.strptime(f"{date} {time}", DATE_TIME_FORMAT)
+
+
+def format_date_time(value: datetime) -> str:
+    return value.isoformat(" ", "minutes")
+
+
+def format_time(value: datetime) -> str:
+    return f"{value.hour:02d}:{value.minute:02d}"
+
+
+def format_timestamp(value: datetime) -> str:
+    return value.isoformat(" ", "seconds")
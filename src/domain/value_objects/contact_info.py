@@ -1,8 +1,14 @@
 import re
 from dataclasses import dataclass
 
+from ..slots import DATACLASS_SLOTS
 
-@dataclass(frozen=True)
+_EMAIL_PATTERN = re.compile(r"^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$")
+_PHONE_STRIP_PATTERN = re.compile(r"[\s\-\(\)]")
+_PHONE_PATTERN = re.compile(r"^\+\d{10,15}$")
+
+
+@dataclass(frozen=True, **DATACLASS_SLOTS)
 class ContactInfo:
     email: str
     phone: str
@@ -11,15 +17,21 @@ class ContactInfo:
         self._validate_email()
         self._validate_phone()
 
+    @classmethod
+    def from_trusted(cls, email: str, phone: str) -> "ContactInfo":
+        # Values loaded from our own storage were validated on the way in.
+        instance = object.__new__(cls)
+        object.__setattr__(instance, "email", email)
+        object.__setattr__(instance, "phone", phone)
+        return instance
+
     def _validate_email(self) -> None:
-        email_pattern = r"^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$"
-        if not re.match(email_pattern, self.email):
+        if not _EMAIL_PATTERN.match(self.email):
             raise ValueError(f"Invalid email format: {self.email}")
 
     def _validate_phone(self) -> None:
-        cleaned_phone = re.sub(r"[\s\-\(\)]", "", self.phone)
-        phone_pattern = r"^\+\d{10,15}$"
-        if not re.match(phone_pattern, cleaned_phone):
+        cleaned_phone = _PHONE_STRIP_PATTERN.sub("", self.phone)
+        if not _PHONE_PATTERN.match(cleaned_phone):
             raise ValueError(
                 f"Invalid phone format: {self.phone}. "
                 "Must be international format (e.g., +1234567890)"
@@ -2,8 +2,14 @@ from dataclasses import dataclass
 from datetime import datetime, timedelta
 from typing import Any
 
+from ..slots import DATACLASS_SLOTS
+from ..time_format import format_date_time, format_time
 
-@dataclass(frozen=True)
+MIN_DURATION = timedelta(minutes=15)
+MAX_DURATION = timedelta(hours=24)
+
+
+@dataclass(frozen=True, **DATACLASS_SLOTS)
 class TimeSlot:
     start_time: datetime
     end_time: datetime
@@ -11,16 +17,25 @@ class TimeSlot:
     def __post_init__(self) -> None:
         self._validate()
 
+    @classmethod
+    def from_trusted(cls, start_time: datetime, end_time: datetime) -> "TimeSlot":
+        instance = object.__new__(cls)
+        object.__setattr__(instance, "start_time", start_time)
+        object.__setattr__(instance, "end_time", end_time)
+        return instance
+
     def _validate(self) -> None:
         if self.start_time >= self.end_time:
             raise ValueError(
                 f"Start time ({self.start_time}) must be before end time ({self.end_time})"
             )
 
-        if self.duration() < timedelta(minutes=15):
+        duration = self.end_time - self.start_time
+
+        if duration < MIN_DURATION:
             raise ValueError("Time slot duration must be at least 15 minutes")
 
-        if self.duration() > timedelta(hours=24):
+        if duration > MAX_DURATION:
             raise ValueError("Time slot duration cannot exceed 24 hours")
 
     def overlaps_with(self, other: "TimeSlot") -> bool:
@@ -40,7 +55,7 @@ class TimeSlot:
         return self.start_time <= point < self.end_time
 
     def __str__(self) -> str:
-        return f"{self.start_time.strftime('%Y-%m-%d %H:%M')} - {self.end_time.strftime('%H:%M')}"
+        return f"{format_date_time(self.start_time)} - {format_time(self.end_time)}"
 
     def __eq__(self, other: Any) -> bool:
         if not isinstance(other, TimeSlot):
@@ -0,0 +1,286 @@
+"""Per-office sorted sets of active reservations, scored by start time.
+
+Members are reservations encoded as JSON. Nothing outlasts MAX_DURATION, so
+the reservations overlapping a window are among the members scored in
+``(start - MAX_DURATION, end)``: one range read per lookup. The office's
+recurring series sit next to them, one JSON entry per series id, and are
+read in the same round trip; offices have few, so they are filtered here.
+
+Only what is still ahead is kept. Windows starting in the past go to the
+database, where the sweeper's completions are visible; entries that ended
+are trimmed as new ones come in.
+"""
+
+import json
+import threading
+from bisect import bisect_left, bisect_right
+from collections.abc import Iterable
+from datetime import date, datetime
+from typing import Optional
+
+from ...application.interfaces.availability_index import (
+    AvailabilityIndexInterface,
+    IndexedSchedule,
+)
+from ...domain.entities.reservation import Reservation, ReservationStatus
+from ...domain.entities.reservation_series import Recurrence, ReservationSeries
+from ...domain.entities.user import User
+from ...domain.value_objects.contact_info import ContactInfo
+from ...domain.value_objects.time_slot import MAX_DURATION, TimeSlot
+
+# Bumped whenever the member encoding changes: sets written by another
+# version are ignored until rebuilt.
+READ_MODEL_VERSION = "2"
+
+_EPOCH = datetime(1970, 1, 1)
+
+
+def office_key(office_id: int) -> str:
+    return f"availability:office:{office_id}"
+
+
+def series_key(office_id: int) -> str:
+    return f"availability:office:{office_id}:series"
+
+
+def version_key(office_id: int) -> str:
+    return f"availability:office:{office_id}:version"
+
+
+VERSION_KEY_PATTERN = "availability:office:*:version"
+
+
+def score(moment: datetime) -> float:
+    # Naive local times throughout; independent of each node's time zone.
+    return (moment - _EPOCH).total_seconds()
+
+
+def score_range(time_slot: TimeSlot) -> tuple[float, float]:
+    """Exclusive bounds on the scores of members that may overlap ``time_slot``."""
+    return score(time_slot.start_time - MAX_DURATION), score(time_slot.end_time)
+
+
+def expired_below(now: datetime) -> float:
+    """Members scored below this ended before ``now``."""
+    return score(now - MAX_DURATION)
+
+
+def covers(time_slot: TimeSlot, now: Optional[datetime] = None) -> bool:
+    return time_slot.start_time >= (now or datetime.now())
+
+
+def encode(reservation: Reservation) -> str:
+    return json.dumps(
+        {
+            "id": reservation.reservation_id,
+            "start": reservation.time_slot.start_time.isoformat(),
+            "end": reservation.time_slot.end_time.isoformat(),
+            "seats": reservation.seats,
+            "status": reservation.status.value,
+            "created": reservation.created_at.isoformat(),
+            "name": reservation.user.name,
+            "email": reservation.user.contact_info.email,
+            "phone": reservation.user.contact_info.phone,
+        },
+        ensure_ascii=False,
+        separators=(",", ":"),
+        sort_keys=True,
+    )
+
+
+def decode(office_id: int, member: str) -> Reservation:
+    fields = json.loads(member)
+    return Reservation.from_trusted(
+        reservation_id=fields["id"],
+        office_id=office_id,
+        status=ReservationStatus(fields["status"]),
+        created_at=datetime.fromisoformat(fields["created"]),
+        seats=fields["seats"],
+        user=User.from_trusted(
+            user_id=None,
+            name=fields["name"],
+            contact_info=ContactInfo.from_trusted(email=fields["email"], phone=fields["phone"]),
+        ),
+        time_slot=TimeSlot.from_trusted(
+            start_time=datetime.fromisoformat(fields["start"]),
+            end_time=datetime.fromisoformat(fields["end"]),
+        ),
+    )
+
+
+def encode_series(series: ReservationSeries) -> str:
+    return json.dumps(
+        {
+            "id": series.series_id,
+            "start": series.first_slot.start_time.isoformat(),
+            "end": series.first_slot.end_time.isoformat(),
+            "recurrence": series.recurrence.value,
+            "interval": series.interval,
+            "until": series.until.isoformat() if series.until else None,
+            "count": series.count,
+            "exceptions": sorted(day.isoformat() for day in series.exceptions),
+            "seats": series.seats,
+            "created": series.created_at.isoformat(),
+            "name": series.user.name,
+            "email": series.user.contact_info.email,
+            "phone": series.user.contact_info.phone,
+        },
+        ensure_ascii=False,
+        separators=(",", ":"),
+        sort_keys=True,
+    )
+
+
+def decode_series(office_id: int, entry: str) -> ReservationSeries:
+    fields = json.loads(entry)
+    return ReservationSeries.from_trusted(
+        series_id=fields["id"],
+        office_id=office_id,
+        user=User.from_trusted(
+            user_id=None,
+            name=fields["name"],
+            contact_info=ContactInfo.from_trusted(email=fields["email"], phone=fields["phone"]),
+        ),
+        first_slot=TimeSlot.from_trusted(
+            start_time=datetime.fromisoformat(fields["start"]),
+            end_time=datetime.fromisoformat(fields["end"]),
+        ),
+        recurrence=Recurrence(fields["recurrence"]),
+        interval=fields["interval"],
+        until=date.fromisoformat(fields["until"]) if fields["until"] else None,
+        count=fields["count"],
+        exceptions={date.fromisoformat(day) for day in fields["exceptions"]},
+        seats=fields["seats"],
+        created_at=datetime.fromisoformat(fields["created"]),
+    )
+
+
+def schedule(
+    office_id: int, time_slot: TimeSlot, members: Iterable[str], series_entries: Iterable[str]
+) -> IndexedSchedule:
+    """Decode one lookup's reservations and series, keeping what touches ``time_slot``."""
+    series = (decode_series(office_id, entry) for entry in series_entries)
+    return IndexedSchedule(
+        reservations=overlapping(office_id, time_slot, members),
+        series=[
+            item
+            for item in series
+            if item.last_end > time_slot.start_time
+            and item.first_slot.start_time < time_slot.end_time
+        ],
+    )
+
+
+def overlapping(office_id: int, time_slot: TimeSlot, members: Iterable[str]) -> list[Reservation]:
+    """Decode ``members`` of the score range and keep those still running at the start."""
+    reservations = (decode(office_id, member) for member in members)
+    return [
+        reservation
+        for reservation in reservations
+        if reservation.time_slot.end_time > time_slot.start_time
+    ]
+
+
+class InMemoryAvailabilityIndex(AvailabilityIndexInterface):
+    """Process-local stand-in for RedisAvailabilityIndex (single process only)."""
+
+    def __init__(self) -> None:
+        # Per office: scores and members in score order, and each member's score.
+        self._scores: dict[int, list[float]] = {}
+        self._members: dict[int, list[str]] = {}
+        self._scored: dict[int, dict[str, float]] = {}
+        self._series: dict[int, dict[int, str]] = {}
+        self._versions: dict[int, str] = {}
+        self._lock = threading.Lock()
+
+    def find_overlapping(self, office_id: int, time_slot: TimeSlot) -> Optional[IndexedSchedule]:
+        if not covers(time_slot):
+            return None
+        low, high = score_range(time_slot)
+        with self._lock:
+            if self._versions.get(office_id) != READ_MODEL_VERSION:
+                return None
+            scores = self._scores.get(office_id, [])
+            members = self._members.get(office_id, [])[
+                bisect_right(scores, low) : bisect_left(scores, high)
+            ]
+            series_entries = list(self._series.get(office_id, {}).values())
+        return schedule(office_id, time_slot, members, series_entries)
+
+    def add(self, reservation: Reservation) -> None:
+        with self._lock:
+            self._trim(reservation.office_id, expired_below(datetime.now()))
+            self._insert(reservation.office_id, reservation)
+
+    def remove(self, reservation: Reservation) -> None:
+        with self._lock:
+            self._discard(reservation.office_id, encode(reservation))
+
+    def put_series(self, series: ReservationSeries) -> None:
+        if series.series_id is None:
+            return
+        with self._lock:
+            self._series.setdefault(series.office_id, {})[series.series_id] = encode_series(
+                series
+            )
+
+    def rebuild(
+        self,
+        office_id: int,
+        reservations: Iterable[Reservation],
+        series: Iterable[ReservationSeries],
+    ) -> None:
+        with self._lock:
+            self._scores[office_id] = []
+            self._members[office_id] = []
+            self._scored[office_id] = {}
+            for reservation in reservations:
+                self._insert(office_id, reservation)
+            self._series[office_id] = {
+                item.series_id: encode_series(item)
+                for item in series
+                if item.series_id is not None
+            }
+            self._versions[office_id] = READ_MODEL_VERSION
+
+    def invalidate(self, office_id: Optional[int] = None) -> None:
+        with self._lock:
+            if office_id is None:
+                self._versions.clear()
+            else:
+                self._versions.pop(office_id, None)
+
+    def _insert(self, office_id: int, reservation: Reservation) -> None:
+        member = encode(reservation)
+        member_score = score(reservation.time_slot.start_time)
+        scored = self._scored.setdefault(office_id, {})
+        if member in scored:
+            return
+        scores = self._scores.setdefault(office_id, [])
+        position = bisect_right(scores, member_score)
+        scores.insert(position, member_score)
+        self._members.setdefault(office_id, []).insert(position, member)
+        scored[member] = member_score
+
+    def _discard(self, office_id: int, member: str) -> None:
+        member_score = self._scored.get(office_id, {}).pop(member, None)
+        if member_score is None:
+            return
+        scores = self._scores[office_id]
+        members = self._members[office_id]
+        position = bisect_left(scores, member_score)
+        while members[position] != member:
+            position += 1
+        del scores[position]
+        del members[position]
+
+    def _trim(self, office_id: int, below: float) -> None:
+        scores = self._scores.get(office_id)
+        if not scores:
+            return
+        count = bisect_left(scores, below)
+        if count:
+            for member in self._members[office_id][:count]:
+                del self._scored[office_id][member]
+            del scores[:count]
+            del self._members[office_id][:count]
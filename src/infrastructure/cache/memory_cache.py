@@ -0,0 +1,69 @@
+import fnmatch
+import json
+import threading
+import time
+from typing import Any, Optional
+
+from ...application.interfaces.cache import CacheInterface
+
+
+class InMemoryCache(CacheInterface):
+    """Process-local stand-in for RedisCache, used by benchmarks and local runs.
+
+    Values are stored JSON-encoded so callers observe the same copy semantics
+    as with Redis.
+    """
+
+    def __init__(self) -> None:
+        self._entries: dict[str, tuple[str, Optional[float]]] = {}
+        self._lock = threading.Lock()
+
+    def get(self, key: str) -> Optional[Any]:
+        with self._lock:
+            value = self._get_live(key)
+        if value is None:
+            return None
+        return json.loads(value)
+
+    def set(self, key: str, value: Any, ttl_seconds: int = 300) -> bool:
+        try:
+            serialized = json.dumps(value, ensure_ascii=False, default=str)
+        except TypeError:
+            return False
+
+        with self._lock:
+            self._entries[key] = (serialized, time.monotonic() + ttl_seconds)
+        return True
+
+    def delete(self, key: str) -> bool:
+        with self._lock:
+            return self._entries.pop(key, None) is not None
+
+    def delete_pattern(self, pattern: str) -> int:
+        with self._lock:
+            keys = [key for key in self._entries if fnmatch.fnmatchcase(key, pattern)]
+            for key in keys:
+                del self._entries[key]
+        return len(keys)
+
+    def increment(self, key: str, ttl_seconds: int = 60) -> int:
+        with self._lock:
+            current = self._get_live(key)
+            count = int(current) + 1 if current is not None else 1
+            self._entries[key] = (str(count), time.monotonic() + ttl_seconds)
+        return count
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+    def _get_live(self, key: str) -> Optional[str]:
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+
+        value, expires_at = entry
+        if expires_at is not None and expires_at <= time.monotonic():
+            del self._entries[key]
+            return None
+        return value
@@ -0,0 +1,155 @@
+from collections.abc import Callable, Iterable
+from datetime import datetime
+from typing import Any, Optional
+
+import redis
+from redis.typing import EncodableT, FieldT
+
+from config.logging import get_logger
+
+from ...application.interfaces.availability_index import (
+    AvailabilityIndexInterface,
+    IndexedSchedule,
+)
+from ...domain.entities.reservation import Reservation
+from ...domain.entities.reservation_series import ReservationSeries
+from ...domain.value_objects.time_slot import TimeSlot
+from ..monitoring.metrics import AVAILABILITY_INDEX_READS
+from .availability_index import (
+    READ_MODEL_VERSION,
+    VERSION_KEY_PATTERN,
+    covers,
+    encode,
+    encode_series,
+    expired_below,
+    office_key,
+    schedule,
+    score,
+    score_range,
+    series_key,
+    version_key,
+)
+
+logger = get_logger(__name__)
+
+
+class RedisAvailabilityIndex(AvailabilityIndexInterface):
+    """Availability read model shared by every node through Redis.
+
+    A lookup is one pipelined round trip: the office's version key, a
+    ZRANGEBYSCORE over its sorted set and the values of its series hash. Any failure, or a version other than
+    this code's, sends the caller to the database. A write that cannot be
+    applied drops the office's version so no node answers from a stale set.
+    """
+
+    def __init__(self, redis_url: str) -> None:
+        self._client: Optional[redis.Redis] = None
+        self._redis_url = redis_url
+        self._connect()
+
+    def _connect(self) -> None:
+        try:
+            self._client = redis.from_url(self._redis_url, decode_responses=True)
+            self._client.ping()
+        except redis.ConnectionError as e:
+            logger.warning("Redis connection failed: %s. Availability index disabled.", e)
+            self._client = None
+
+    def find_overlapping(self, office_id: int, time_slot: TimeSlot) -> Optional[IndexedSchedule]:
+        if not self._client:
+            return None
+        if not covers(time_slot):
+            AVAILABILITY_INDEX_READS.inc(result="past")
+            return None
+
+        low, high = score_range(time_slot)
+        try:
+            pipe = self._client.pipeline(transaction=False)
+            pipe.get(version_key(office_id))
+            pipe.zrangebyscore(office_key(office_id), f"({low}", f"({high}")
+            pipe.hvals(series_key(office_id))
+            version, members, series_entries = pipe.execute()
+        except redis.RedisError as e:
+            AVAILABILITY_INDEX_READS.inc(result="error")
+            logger.error("Availability index read error: %s", e)
+            return None
+
+        if version != READ_MODEL_VERSION:
+            AVAILABILITY_INDEX_READS.inc(result="stale")
+            return None
+        AVAILABILITY_INDEX_READS.inc(result="hit")
+        return schedule(office_id, time_slot, members, series_entries)
+
+    def add(self, reservation: Reservation) -> None:
+        key = office_key(reservation.office_id)
+
+        def apply(pipe: Any) -> None:
+            pipe.zadd(key, {encode(reservation): score(reservation.time_slot.start_time)})
+            pipe.zremrangebyscore(key, "-inf", f"({expired_below(datetime.now())}")
+
+        self._write(reservation.office_id, apply)
+
+    def remove(self, reservation: Reservation) -> None:
+        key = office_key(reservation.office_id)
+        self._write(reservation.office_id, lambda pipe: pipe.zrem(key, encode(reservation)))
+
+    def put_series(self, series: ReservationSeries) -> None:
+        if series.series_id is None:
+            return
+        key = series_key(series.office_id)
+        self._write(
+            series.office_id,
+            lambda pipe: pipe.hset(key, str(series.series_id), encode_series(series)),
+        )
+
+    def rebuild(
+        self,
+        office_id: int,
+        reservations: Iterable[Reservation],
+        series: Iterable[ReservationSeries],
+    ) -> None:
+        if not self._client:
+            return
+        entries = {
+            encode(reservation): score(reservation.time_slot.start_time)
+            for reservation in reservations
+        }
+        series_entries: dict[FieldT, EncodableT] = {
+            str(item.series_id): encode_series(item) for item in series if item.series_id
+        }
+        try:
+            # MULTI/EXEC: readers see the old set or the whole new one.
+            pipe = self._client.pipeline(transaction=True)
+            pipe.delete(office_key(office_id), series_key(office_id))
+            if entries:
+                pipe.zadd(office_key(office_id), entries)
+            if series_entries:
+                pipe.hset(series_key(office_id), mapping=series_entries)
+            pipe.set(version_key(office_id), READ_MODEL_VERSION)
+            pipe.execute()
+        except redis.RedisError as e:
+            logger.error("Availability index rebuild of office %s failed: %s", office_id, e)
+
+    def invalidate(self, office_id: Optional[int] = None) -> None:
+        if not self._client:
+            return
+        try:
+            if office_id is not None:
+                self._client.delete(version_key(office_id))
+                return
+            keys = list(self._client.scan_iter(VERSION_KEY_PATTERN))
+            if keys:
+                self._client.delete(*keys)
+        except redis.RedisError as e:
+            logger.error("Availability index invalidation failed: %s", e)
+
+    def _write(self, office_id: int, apply: Callable[[Any], None]) -> None:
+        if not self._client:
+            return
+        try:
+            pipe = self._client.pipeline(transaction=False)
+            apply(pipe)
+            pipe.execute()
+        except redis.RedisError as e:
+            logger.error("Availability index write failed for office %s: %s", office_id, e)
+            self.invalidate(office_id)
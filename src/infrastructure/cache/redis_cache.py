@@ -6,6 +6,7 @@ import redis
 from config.logging import get_logger
 
 from ...application.interfaces.cache import CacheInterface
+from ..monitoring.metrics import CACHE_OPERATIONS
 
 logger = get_logger(__name__)
 
@@ -22,7 +23,7 @@ class RedisCache(CacheInterface):
             self._client.ping()
             logger.info("Redis connection established")
         except redis.ConnectionError as e:
-            logger.warning(f"Redis connection failed: {e}. Caching disabled.")
+            logger.warning("Redis connection failed: %s. Caching disabled.", e)
             self._client = None
 
     def get(self, key: str) -> Optional[Any]:
@@ -32,12 +33,15 @@ class RedisCache(CacheInterface):
         try:
             value = self._client.get(key)
             if value:
-                logger.debug(f"Cache HIT: {key}")
+                CACHE_OPERATIONS.inc(operation="get", result="hit")
+                logger.debug("Cache HIT: %s", key)
                 return json.loads(value)
-            logger.debug(f"Cache MISS: {key}")
+            CACHE_OPERATIONS.inc(operation="get", result="miss")
+            logger.debug("Cache MISS: %s", key)
             return None
         except (redis.RedisError, json.JSONDecodeError) as e:
-            logger.error(f"Cache get error: {e}")
+            CACHE_OPERATIONS.inc(operation="get", result="error")
+            logger.error("Cache get error: %s", e)
             return None
 
     def set(self, key: str, value: Any, ttl_seconds: int = 300) -> bool:
@@ -47,10 +51,11 @@ class RedisCache(CacheInterface):
         try:
             serialized = json.dumps(value, ensure_ascii=False, default=str)
             self._client.setex(key, ttl_seconds, serialized)
-            logger.debug(f"Cache SET: {key} (TTL: {ttl_seconds}s)")
+            logger.debug("Cache SET: %s (TTL: %ss)", key, ttl_seconds)
             return True
         except (redis.RedisError, TypeError) as e:
-            logger.error(f"Cache set error: {e}")
+            CACHE_OPERATIONS.inc(operation="set", result="error")
+            logger.error("Cache set error: %s", e)
             return False
 
     def delete(self, key: str) -> bool:
@@ -59,10 +64,11 @@ class RedisCache(CacheInterface):
 
         try:
             result = self._client.delete(key)
-            logger.debug(f"Cache DELETE: {key}")
+            logger.debug("Cache DELETE: %s", key)
             return result > 0
         except redis.RedisError as e:
-            logger.error(f"Cache delete error: {e}")
+            CACHE_OPERATIONS.inc(operation="delete", result="error")
+            logger.error("Cache delete error: %s", e)
             return False
 
     def delete_pattern(self, pattern: str) -> int:
@@ -73,11 +79,12 @@ class RedisCache(CacheInterface):
             keys = self._client.keys(pattern)
             if keys:
                 deleted = self._client.delete(*keys)
-                logger.debug(f"Cache DELETE pattern '{pattern}': {deleted} keys")
+                logger.debug("Cache DELETE pattern '%s': %s keys", pattern, deleted)
                 return deleted
             return 0
         except redis.RedisError as e:
-            logger.error(f"Cache delete pattern error: {e}")
+            CACHE_OPERATIONS.inc(operation="delete_pattern", result="error")
+            logger.error("Cache delete pattern error: %s", e)
             return 0
 
     def increment(self, key: str, ttl_seconds: int = 60) -> int:
@@ -91,5 +98,6 @@ class RedisCache(CacheInterface):
             result = pipe.execute()
             return result[0]
         except redis.RedisError as e:
-            logger.error(f"Cache increment error: {e}")
+            CACHE_OPERATIONS.inc(operation="increment", result="error")
+            logger.error("Cache increment error: %s", e)
             return 0
@@ -0,0 +1,151 @@
+"""Completion sweep and archival of finished reservations."""
+
+import threading
+import time
+from collections.abc import Callable
+from dataclasses import dataclass
+from datetime import datetime, timedelta
+from typing import Optional, cast
+
+from sqlalchemy import Table, literal, select
+from sqlalchemy.orm import Session
+
+from config.logging import get_logger
+
+from ..monitoring.metrics import RESERVATIONS_SWEPT
+from .connection import DatabaseConnection
+from .models import ReservationArchiveModel, ReservationModel
+from .partitions import ReservationPartitions
+from .repositories.reservation_repository import ACTIVE_STATUSES
+
+logger = get_logger(__name__)
+
+FINISHED_STATUSES = ("completed", "cancelled")
+
+_HOT = cast(Table, ReservationModel.__table__)
+_ARCHIVE = cast(Table, ReservationArchiveModel.__table__)
+_ARCHIVED_COLUMNS = [column.name for column in _HOT.columns]
+
+
+@dataclass
+class SweepResult:
+    completed: int = 0
+    archived: int = 0
+    elapsed: float = 0.0
+
+
+class ReservationSweeper:
+    """Marks past reservations completed and archives old finished ones.
+
+    Both steps work in transactions of at most ``batch_size`` rows and sleep
+    ``pause_seconds`` between them, so the hot table is never locked for
+    long. Completed and cancelled reservations that ended more than
+    ``retention_days`` ago move to ``reservations_archive``. With
+    ``partitions`` each sweep also rotates the monthly partitions, dropping
+    the months archiving has emptied.
+    """
+
+    def __init__(
+        self,
+        db: DatabaseConnection,
+        *,
+        retention_days: int = 90,
+        batch_size: int = 500,
+        pause_seconds: float = 0.1,
+        partitions: Optional[ReservationPartitions] = None,
+    ) -> None:
+        self._db = db
+        self._retention = timedelta(days=retention_days)
+        self._batch_size = batch_size
+        self._pause = pause_seconds
+        self._partitions = partitions
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    def start(self, interval: float) -> None:
+        if self._thread is not None:
+            return
+        self._thread = threading.Thread(
+            target=self._run, args=(interval,), name="reservation-sweeper", daemon=True
+        )
+        self._thread.start()
+
+    def stop(self) -> None:
+        self._stop.set()
+
+    def sweep(self, now: Optional[datetime] = None) -> SweepResult:
+        started = time.perf_counter()
+        now = now or datetime.now()
+        result = SweepResult()
+        result.completed = self._drain(self._complete_batch, now)
+        result.archived = self._drain(self._archive_batch, now - self._retention)
+        if self._partitions is not None:
+            self._partitions.rotate(now, drop_before=now - self._retention)
+        result.elapsed = time.perf_counter() - started
+        return result
+
+    def _drain(self, run_batch: Callable[[datetime], int], before: datetime) -> int:
+        total = 0
+        while not self._stop.is_set():
+            count = run_batch(before)
+            total += count
+            if count < self._batch_size or self._stop.wait(self._pause):
+                break
+        return total
+
+    def _complete_batch(self, before: datetime) -> int:
+        with self._db.session_scope() as session:
+            ids = self._claim(session, ACTIVE_STATUSES, before)
+            if ids:
+                session.execute(
+                    _HOT.update()
+                    .where(_HOT.c.reservation_id.in_(ids))
+                    .values(status="completed")
+                )
+        RESERVATIONS_SWEPT.inc(len(ids), action="completed")
+        return len(ids)
+
+    def _archive_batch(self, before: datetime) -> int:
+        with self._db.session_scope() as session:
+            ids = self._claim(session, FINISHED_STATUSES, before)
+            if ids:
+                session.execute(
+                    _ARCHIVE.insert().from_select(
+                        [*_ARCHIVED_COLUMNS, "archived_at"],
+                        select(
+                            *(_HOT.c[name] for name in _ARCHIVED_COLUMNS),
+                            literal(datetime.now()),
+                        ).where(_HOT.c.reservation_id.in_(ids)),
+                    )
+                )
+                session.execute(_HOT.delete().where(_HOT.c.reservation_id.in_(ids)))
+        RESERVATIONS_SWEPT.inc(len(ids), action="archived")
+        return len(ids)
+
+    def _claim(self, session: Session, statuses: tuple[str, ...], before: datetime) -> list[int]:
+        # SKIP LOCKED lets several server processes sweep without colliding;
+        # SQLite has no row locks and drops the clause.
+        return list(
+            session.scalars(
+                select(_HOT.c.reservation_id)
+                .where(_HOT.c.status.in_(statuses), _HOT.c.end_time <= before)
+                .order_by(_HOT.c.reservation_id)
+                .limit(self._batch_size)
+                .with_for_update(skip_locked=True)
+            )
+        )
+
+    def _run(self, interval: float) -> None:
+        while not self._stop.wait(interval):
+            try:
+                result = self.sweep()
+            except Exception:
+                logger.exception("Reservation sweep failed")
+                continue
+            if result.completed or result.archived:
+                logger.info(
+                    "Sweep completed %s and archived %s reservations in %.2fs",
+                    result.completed,
+                    result.archived,
+                    result.elapsed,
+                )
@@ -0,0 +1,47 @@
+"""Rebuilding the availability read model from the database."""
+
+from collections.abc import Iterable
+from datetime import datetime
+from typing import Optional
+
+from sqlalchemy import select
+
+from config.logging import get_logger
+
+from ...application.interfaces.availability_index import AvailabilityIndexInterface
+from .booking_lock import office_locked
+from .connection import DatabaseConnection
+from .models import OfficeModel
+from .repositories.reservation_repository import ReservationRepository
+from .repositories.series_repository import ReservationSeriesRepository
+
+logger = get_logger(__name__)
+
+
+def rebuild_availability_index(
+    db: DatabaseConnection,
+    index: AvailabilityIndexInterface,
+    office_ids: Optional[Iterable[int]] = None,
+    now: Optional[datetime] = None,
+) -> int:
+    """Reload the given offices (default: all) from the primary; returns how many.
+
+    Each office is read and swapped in while holding its booking lock, so no
+    booking can commit between the snapshot and the swap and then be lost.
+    """
+    if office_ids is None:
+        with db.session_scope() as session:
+            office_ids = list(session.scalars(select(OfficeModel.office_id)))
+
+    rebuilt = 0
+    for office_id in office_ids:
+        with db.session_scope() as session, office_locked(session, office_id):
+            moment = now or datetime.now()
+            index.rebuild(
+                office_id,
+                ReservationRepository(session).find_upcoming(office_id, moment),
+                ReservationSeriesRepository(session).find_upcoming(office_id, moment),
+            )
+        rebuilt += 1
+    logger.info("Rebuilt the availability index for %s offices", rebuilt)
+    return rebuilt
@@ -0,0 +1,92 @@
+import threading
+from collections import defaultdict
+from collections.abc import Callable, Iterator
+from contextlib import AbstractContextManager, contextmanager
+from typing import Optional
+
+from sqlalchemy import select, update
+from sqlalchemy.orm import Session
+
+from ...application.interfaces.availability_index import AvailabilityIndexInterface
+from ...application.interfaces.repository import BookingLockInterface, BookingScope
+from .models import OfficeModel
+from .repositories.reservation_repository import ReservationRepository
+from .repositories.series_repository import ReservationSeriesRepository
+
+# Shared by every booking in the process; the database lock alone does not
+# separate threads that open their sessions on the same SQLite file.
+_office_locks: defaultdict[int, threading.Lock] = defaultdict(threading.Lock)
+_office_locks_guard = threading.Lock()
+
+
+@contextmanager
+def office_locked(session: Session, office_id: int) -> Iterator[None]:
+    """Hold the office's booking lock in this process and in ``session``'s transaction."""
+    with _office_locks_guard:
+        office_lock = _office_locks[office_id]
+    with office_lock:
+        _lock_office_row(session, office_id)
+        yield
+
+
+def _lock_office_row(session: Session, office_id: int) -> None:
+    if session.get_bind().dialect.name == "sqlite":
+        # SQLite has no row locks; a no-op write takes the database write
+        # lock, which other processes wait on until commit.
+        session.execute(
+            update(OfficeModel.__table__)
+            .where(OfficeModel.office_id == office_id)
+            .values(capacity=OfficeModel.capacity)
+        )
+    else:
+        session.execute(
+            select(OfficeModel.office_id).where(OfficeModel.office_id == office_id).with_for_update()
+        )
+
+
+@contextmanager
+def joined_session(session: Session) -> Iterator[Session]:
+    """Run bookings on a session the caller owns, e.g. one from ``transaction_scope``."""
+    try:
+        yield session
+    except BaseException:
+        session.rollback()
+        raise
+
+
+class SessionBookingLock(BookingLockInterface):
+    """Each booking takes its lock, checks and saves in a session of its own.
+
+    The HTTP server's threads share the repositories' session, where another
+    thread's commit or rollback would end the transaction holding the lock.
+    ``session_scope`` is usually ``DatabaseConnection.session_scope``.
+    """
+
+    def __init__(
+        self,
+        session_scope: Callable[[], AbstractContextManager[Session]],
+        range_overlap: bool = False,
+        availability_index: Optional[AvailabilityIndexInterface] = None,
+    ) -> None:
+        self._session_scope = session_scope
+        self._range_overlap = range_overlap
+        self._availability_index = availability_index
+
+    @contextmanager
+    def lock_office(self, office_id: int) -> Iterator[BookingScope]:
+        with self._session_scope() as session, office_locked(session, office_id):
+            # The repositories only flush: one commit at the end keeps every
+            # write of the booking inside the transaction holding the lock.
+            reservations = ReservationRepository(
+                session,
+                range_overlap=self._range_overlap,
+                availability_index=self._availability_index,
+                commit=False,
+            )
+            series = ReservationSeriesRepository(
+                session, availability_index=self._availability_index, commit=False
+            )
+            yield BookingScope(reservations=reservations, series=series)
+            session.commit()
+            reservations.sync_index()
+            series.sync_index()
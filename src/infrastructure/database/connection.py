@@ -1,31 +1,242 @@
-from collections.abc import Generator
+import time
+from collections.abc import Generator, Sequence
 from contextlib import contextmanager
+from typing import Any, Optional
 
-from sqlalchemy import create_engine
-from sqlalchemy.ext.declarative import declarative_base
-from sqlalchemy.orm import Session, sessionmaker
+from sqlalchemy import create_engine, event, text
+from sqlalchemy.engine import Connection, Engine
+from sqlalchemy.orm import ORMExecuteState, Session, declarative_base, sessionmaker
+
+from config.logging import get_logger
+
+from ..monitoring.metrics import DB_QUERIES, DB_QUERY_DURATION, DB_READ_ROUTES
+from ..monitoring.query_tracking import record_query
+from .replicas import ReplicaSet, ReplicationHeartbeat, primary_reads_requested
+
+logger = get_logger(__name__)
 
 Base = declarative_base()
 
 
+class ReplicaReadSession(Session):
+    """Session for read-only use cases; every statement picks its engine.
+
+    Replica (or primary fallback) connections run in autocommit, so the
+    long-lived session never leaves a transaction open, and SELECTs refresh
+    already loaded objects instead of serving stale identity-map state.
+    """
+
+    def __init__(self, *, database: "DatabaseConnection", **kwargs: Any) -> None:
+        super().__init__(**kwargs)
+        self._database = database
+
+    def get_bind(self, *_args: Any, **_kwargs: Any) -> Engine:
+        return self._database.read_engine()
+
+
+@event.listens_for(ReplicaReadSession, "do_orm_execute")
+def _refresh_loaded_objects(state: ORMExecuteState) -> None:
+    if state.is_select:
+        state.update_execution_options(populate_existing=True)
+
+
 class DatabaseConnection:
-    def __init__(self, database_url: str) -> None:
-        self._engine = create_engine(database_url, echo=False)
+    def __init__(
+        self,
+        database_url: str,
+        slow_query_threshold_ms: float = 0,
+        explain_slow_queries: bool = False,
+        *,
+        replica_urls: Sequence[str] = (),
+        replica_max_lag: float = 5.0,
+    ) -> None:
+        self._slow_query_threshold = slow_query_threshold_ms / 1000
+        self._explain_slow_queries = explain_slow_queries
+        self._engine = self._create_engine(database_url)
         self._session_factory = sessionmaker(
             bind=self._engine,
             autocommit=False,
             autoflush=False,
         )
 
+        self._replicas: Optional[ReplicaSet] = None
+        self._heartbeat: Optional[ReplicationHeartbeat] = None
+        if replica_urls:
+            self._replicas = ReplicaSet(
+                [
+                    self._create_engine(url, isolation_level="AUTOCOMMIT")
+                    for url in replica_urls
+                ],
+                max_lag=replica_max_lag,
+            )
+            self._primary_reads = self._engine.execution_options(isolation_level="AUTOCOMMIT")
+            self._read_session_factory = sessionmaker(
+                class_=ReplicaReadSession, database=self, autoflush=False
+            )
+
+    def _create_engine(self, url: str, **kwargs: Any) -> Engine:
+        engine = create_engine(url, echo=False, **kwargs)
+        event.listen(engine, "before_cursor_execute", self._before_cursor_execute)
+        event.listen(engine, "after_cursor_execute", self._after_cursor_execute)
+        return engine
+
+    @staticmethod
+    def _before_cursor_execute(
+        conn: Connection, _cursor: Any, _statement: str, *_args: Any
+    ) -> None:
+        conn.info.setdefault("query_start_time", []).append(time.perf_counter())
+
+    def _after_cursor_execute(
+        self,
+        conn: Connection,
+        _cursor: Any,
+        statement: str,
+        parameters: Any,
+        _context: Any,
+        executemany: bool,
+    ) -> None:
+        elapsed = time.perf_counter() - conn.info["query_start_time"].pop()
+        statement_type = statement.lstrip().split(None, 1)[0].upper() if statement else ""
+        DB_QUERIES.inc(statement=statement_type)
+        DB_QUERY_DURATION.observe(elapsed, statement=statement_type)
+        record_query(statement, elapsed)
+
+        if self._slow_query_threshold and elapsed >= self._slow_query_threshold:
+            logger.warning(
+                "Slow query (%.1f ms): %s | parameters: %r", elapsed * 1000, statement, parameters
+            )
+            if self._explain_slow_queries and statement_type == "SELECT" and not executemany:
+                self._log_query_plan(conn, statement, parameters)
+
+    @staticmethod
+    def _log_query_plan(conn: Connection, statement: str, parameters: Any) -> None:
+        prefix = "EXPLAIN QUERY PLAN " if conn.dialect.name == "sqlite" else "EXPLAIN "
+        # A fresh DBAPI cursor keeps the pending result set of the slow query intact
+        # and bypasses the engine events, so the EXPLAIN is not itself counted.
+        cursor = conn.connection.cursor()
+        try:
+            cursor.execute(prefix + statement, parameters)
+            plan = "\n".join(" ".join(str(column) for column in row) for row in cursor.fetchall())
+            logger.warning("Query plan:\n%s", plan)
+        except Exception as e:
+            logger.warning("Could not explain slow query: %s", e)
+        finally:
+            cursor.close()
+
     def create_tables(self) -> None:
         Base.metadata.create_all(bind=self._engine)
 
     def drop_tables(self) -> None:
         Base.metadata.drop_all(bind=self._engine)
 
+    def warm_up(self) -> int:
+        """Open the pools' connections up front so early requests skip the connect."""
+        opened = self._fill_pool(self._engine)
+        for engine in self._replicas.engines if self._replicas is not None else []:
+            try:
+                opened += self._fill_pool(engine)
+            except Exception as e:
+                # A lagging or down replica must not keep the server unready.
+                logger.warning("Could not warm up replica pool: %s", e)
+        return opened
+
+    @staticmethod
+    def _fill_pool(engine: Engine) -> int:
+        size = getattr(engine.pool, "size", lambda: 1)()
+        connections = []
+        try:
+            for _ in range(size):
+                connection = engine.connect()
+                connections.append(connection)
+                connection.execute(text("SELECT 1"))
+        finally:
+            for connection in connections:
+                connection.close()
+        return len(connections)
+
+    def dispose(self) -> None:
+        if self._heartbeat is not None:
+            self._heartbeat.stop()
+            self._heartbeat = None
+        self._engine.dispose()
+        if self._replicas is not None:
+            for engine in self._replicas.engines:
+                engine.dispose()
+
+    @property
+    def dialect_name(self) -> str:
+        return self._engine.dialect.name
+
+    @property
+    def has_replicas(self) -> bool:
+        return self._replicas is not None
+
+    def start_heartbeat(self, interval: float = 1.0) -> None:
+        """Keep the primary's heartbeat row fresh so replica lag can be measured.
+
+        Without it replicas look ever further behind and reads fall back to
+        the primary, so only long-running processes need to call this.
+        """
+        if self._replicas is None or self._heartbeat is not None:
+            return
+        self._heartbeat = ReplicationHeartbeat(self._engine, interval)
+        self._heartbeat.start()
+
+    def read_engine(self) -> Engine:
+        if self._replicas is None:
+            return self._engine
+        if primary_reads_requested():
+            DB_READ_ROUTES.inc(target="primary", reason="pinned")
+            return self._primary_reads
+        engine = self._replicas.choose()
+        if engine is None:
+            DB_READ_ROUTES.inc(target="primary", reason="lagging")
+            return self._primary_reads
+        DB_READ_ROUTES.inc(target="replica", reason="healthy")
+        return engine
+
     def get_session(self) -> Session:
         return self._session_factory()
 
+    def get_read_session(self) -> Session:
+        """Session for read-only work: replicas when healthy, else the primary."""
+        if self._replicas is None:
+            return self._session_factory()
+        return self._read_session_factory()
+
+    @contextmanager
+    def transaction_scope(self) -> Generator[Session, None, None]:
+        """Session whose commits only release savepoints inside one outer transaction.
+
+        Repositories keep calling ``commit()``; nothing is durable until the
+        block exits cleanly, and any exception rolls everything back.
+        """
+        with self._engine.connect() as connection:
+            # pysqlite neither emits BEGIN for SELECTs nor keeps SAVEPOINTs
+            # inside its implicit transaction, so SQLite is driven by hand.
+            manual = connection.dialect.name == "sqlite"
+            if manual:
+                connection.execution_options(isolation_level="AUTOCOMMIT")
+            transaction = connection.begin()
+            if manual:
+                connection.exec_driver_sql("BEGIN")
+            session = self._session_factory(
+                bind=connection, join_transaction_mode="create_savepoint"
+            )
+            try:
+                yield session
+                session.flush()
+                if manual:
+                    connection.exec_driver_sql("COMMIT")
+                transaction.commit()
+            except Exception:
+                if manual:
+                    connection.exec_driver_sql("ROLLBACK")
+                transaction.rollback()
+                raise
+            finally:
+                session.close()
+
     @contextmanager
     def session_scope(self) -> Generator[Session, None, None]:
         session = self.get_session()
@@ -1,17 +1,55 @@
 
-from sqlalchemy import Column, DateTime, Integer, String, Text
+from sqlalchemy import (
+    JSON,
+    Column,
+    Date,
+    DateTime,
+    Float,
+    Index,
+    Integer,
+    String,
+    Text,
+    literal_column,
+)
+from sqlalchemy.dialects.postgresql import TSRANGE, TSVECTOR
 from sqlalchemy.sql import func
 
 from .connection import Base
 
+# Bump whenever a model or the seed data changes so initialize_database runs
+# create_all and seeding again instead of trusting the stored version.
+SCHEMA_VERSION = 8
+
+
+class SchemaInfoModel(Base):
+    __tablename__ = "schema_info"
+
+    id = Column(Integer, primary_key=True, autoincrement=False)
+    version = Column(Integer, nullable=False)
+
+
+class ReplicaHeartbeatModel(Base):
+    """Written on the primary; how stale a replica's copy is gives its lag."""
+
+    __tablename__ = "replica_heartbeat"
+
+    id = Column(Integer, primary_key=True, autoincrement=False)
+    written_at = Column(Float, nullable=False)
+
 
 class OfficeModel(Base):
     __tablename__ = "offices"
+    # Listing pages by office_id, so each filter gets an index that ends in it.
+    __table_args__ = (
+        Index("ix_offices_building_id", "building", "office_id"),
+        Index("ix_offices_capacity_id", "capacity", "office_id"),
+    )
 
     office_id = Column(Integer, primary_key=True, autoincrement=False)
     name = Column(String(100), nullable=False)
     capacity = Column(Integer, nullable=False, default=1)
     description = Column(Text, nullable=True)
+    building = Column(String(100), nullable=True)
 
     def __repr__(self) -> str:
         return f"<OfficeModel(id={self.office_id}, name='{self.name}')>"
@@ -32,9 +70,92 @@ class ReservationModel(Base):
 
     status = Column(String(20), nullable=False, default="pending")
     created_at = Column(DateTime, nullable=False, server_default=func.now())
+    # NULL books the whole office, as every reservation did before seats.
+    seats = Column(Integer, nullable=True)
 
     def __repr__(self) -> str:
         return (
             f"<ReservationModel(id={self.reservation_id}, "
             f"office_id={self.office_id}, status='{self.status}')>"
         )
+
+
+class ReservationArchiveModel(Base):
+    """Finished reservations moved out of the hot table by the sweeper."""
+
+    __tablename__ = "reservations_archive"
+
+    reservation_id = Column(Integer, primary_key=True, autoincrement=False)
+    office_id = Column(Integer, nullable=False)
+
+    user_name = Column(String(200), nullable=False)
+    user_email = Column(String(200), nullable=False)
+    user_phone = Column(String(50), nullable=False)
+
+    start_time = Column(DateTime, nullable=False)
+    end_time = Column(DateTime, nullable=False)
+
+    status = Column(String(20), nullable=False)
+    created_at = Column(DateTime, nullable=False)
+    seats = Column(Integer, nullable=True)
+    archived_at = Column(DateTime, nullable=False)
+
+
+class ReservationSeriesModel(Base):
+    """One row per recurring booking; occurrences are never stored."""
+
+    __tablename__ = "reservation_series"
+    # Conflict checks fetch the series of an office still running in a window.
+    __table_args__ = (Index("ix_reservation_series_office_last_end", "office_id", "last_end"),)
+
+    series_id = Column(Integer, primary_key=True, autoincrement=True)
+    office_id = Column(Integer, nullable=False)
+
+    user_name = Column(String(200), nullable=False)
+    user_email = Column(String(200), nullable=False)
+    user_phone = Column(String(50), nullable=False)
+
+    # The first occurrence.
+    start_time = Column(DateTime, nullable=False)
+    end_time = Column(DateTime, nullable=False)
+    # End of the last occurrence, derived from the rule.
+    last_end = Column(DateTime, nullable=False)
+
+    recurrence = Column(String(10), nullable=False)
+    repeat_interval = Column(Integer, nullable=False, default=1)
+    until = Column(Date, nullable=True)
+    count = Column(Integer, nullable=True)
+    # ISO dates of skipped or materialized occurrences.
+    exceptions = Column(JSON, nullable=False, default=list)
+
+    seats = Column(Integer, nullable=True)
+    created_at = Column(DateTime, nullable=False, server_default=func.now())
+
+
+class UtilizationRollupModel(Base):
+    """Booked seconds per office and hour/day/week bucket.
+
+    Kept current by the reservation repository on every write, so reports
+    read a few rows per bucket instead of scanning reservation history.
+    Whole-office bookings add to ``whole_seconds``; shared ones add
+    seats * seconds to ``seat_seconds``, scaled by capacity when read.
+    """
+
+    __tablename__ = "utilization_rollups"
+
+    office_id = Column(Integer, primary_key=True, autoincrement=False)
+    granularity = Column(String(10), primary_key=True)
+    bucket_start = Column(DateTime, primary_key=True)
+    whole_seconds = Column(Integer, nullable=False, default=0)
+    seat_seconds = Column(Integer, nullable=False, default=0)
+
+
+# PostgreSQL only: a generated tsrange over [start_time, end_time) with a GiST
+# index, added by schema.ensure_reservation_periods. It is left unmapped so
+# writes never touch it and SQLite keeps the plain column pair.
+RESERVATION_PERIOD = literal_column(f"{ReservationModel.__tablename__}.period", TSRANGE)
+
+# PostgreSQL only, like RESERVATION_PERIOD: a generated tsvector over an
+# office's name, building and description with a GIN index, added by
+# schema.ensure_office_catalog.
+OFFICE_SEARCH = literal_column(f"{OfficeModel.__tablename__}.search", TSVECTOR)
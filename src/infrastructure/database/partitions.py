@@ -0,0 +1,177 @@
+"""Monthly range partitioning of ``reservations`` by ``start_time`` (PostgreSQL)."""
+
+import re
+from datetime import datetime
+from typing import Optional, cast
+
+from sqlalchemy import MetaData, PrimaryKeyConstraint, Table, text
+from sqlalchemy.schema import CreateTable
+
+from config.logging import get_logger
+
+from .connection import DatabaseConnection
+from .models import ReservationModel
+
+logger = get_logger(__name__)
+
+PARENT = ReservationModel.__tablename__
+DEFAULT_PARTITION = f"{PARENT}_default"
+_PARTITION_NAME = re.compile(rf"^{PARENT}_p(\d{{4}})_(\d{{2}})$")
+
+
+def month_start(moment: datetime, offset: int = 0) -> datetime:
+    index = moment.year * 12 + moment.month - 1 + offset
+    return datetime(index // 12, index % 12 + 1, 1)
+
+
+def partition_name(month: datetime) -> str:
+    return f"{PARENT}_p{month.year:04d}_{month.month:02d}"
+
+
+def partitioned_table() -> Table:
+    """``reservations`` as a range-partitioned parent.
+
+    PostgreSQL requires the partition key in every unique constraint, so the
+    primary key widens to (reservation_id, start_time); the sequence still
+    keeps reservation_id unique on its own.
+    """
+    table = cast(Table, ReservationModel.__table__).to_metadata(MetaData())
+    table.c.start_time.primary_key = True
+    table.append_constraint(PrimaryKeyConstraint(table.c.reservation_id, table.c.start_time))
+    table.dialect_kwargs["postgresql_partition_by"] = "RANGE (start_time)"
+    return table
+
+
+class ReservationPartitions:
+    """Creates the partitioned table and keeps its monthly partitions rotated.
+
+    ``rotate`` makes sure partitions exist from the current month through
+    ``months_ahead`` months ahead, and drops months that ended before
+    ``drop_before`` once the sweeper has archived them empty. Rows outside
+    every monthly range land in a default partition until their month's
+    partition is created, which moves them across.
+    """
+
+    def __init__(self, db: DatabaseConnection, months_ahead: int = 3) -> None:
+        self._db = db
+        self._months_ahead = months_ahead
+
+    def create_table(self) -> bool:
+        """Create ``reservations`` partitioned unless it already exists."""
+        with self._db.session_scope() as session:
+            exists = session.execute(
+                text("SELECT to_regclass(:name) IS NOT NULL"), {"name": PARENT}
+            ).scalar()
+            if exists:
+                return False
+            session.execute(CreateTable(partitioned_table()))
+            session.execute(
+                text(f"CREATE TABLE {DEFAULT_PARTITION} PARTITION OF {PARENT} DEFAULT")
+            )
+        logger.info("Created %s partitioned by month of start_time", PARENT)
+        return True
+
+    def is_partitioned(self) -> bool:
+        with self._db.session_scope() as session:
+            return bool(
+                session.execute(
+                    text(
+                        "SELECT EXISTS (SELECT 1 FROM pg_partitioned_table "
+                        "WHERE partrelid = to_regclass(:name))"
+                    ),
+                    {"name": PARENT},
+                ).scalar()
+            )
+
+    def existing(self) -> dict[str, datetime]:
+        with self._db.session_scope() as session:
+            names = session.scalars(
+                text(
+                    "SELECT child.relname FROM pg_inherits "
+                    "JOIN pg_class child ON child.oid = pg_inherits.inhrelid "
+                    "WHERE pg_inherits.inhparent = to_regclass(:name)"
+                ),
+                {"name": PARENT},
+            ).all()
+        months = {}
+        for name in names:
+            match = _PARTITION_NAME.match(name)
+            if match:
+                months[name] = datetime(int(match.group(1)), int(match.group(2)), 1)
+        return months
+
+    def rotate(
+        self, now: Optional[datetime] = None, drop_before: Optional[datetime] = None
+    ) -> tuple[list[str], list[str]]:
+        """Return the partitions created and dropped."""
+        if not self.is_partitioned():
+            return [], []
+
+        now = now or datetime.now()
+        existing = self.existing()
+        created = []
+        for offset in range(self._months_ahead + 1):
+            month = month_start(now, offset)
+            name = partition_name(month)
+            if name not in existing and self._create(name, month):
+                created.append(name)
+
+        dropped = []
+        if drop_before is not None:
+            for name, month in sorted(existing.items(), key=lambda item: item[1]):
+                if month_start(month, 1) <= drop_before and self._drop_if_empty(name):
+                    dropped.append(name)
+
+        if created or dropped:
+            logger.info("Partitions created: %s; dropped: %s", created, dropped)
+        return created, dropped
+
+    def _create(self, name: str, month: datetime) -> bool:
+        bounds = {"start": month, "end": month_start(month, 1)}
+        in_range = "start_time >= :start AND start_time < :end"
+        create = text(
+            f"CREATE TABLE {name} PARTITION OF {PARENT} "
+            f"FOR VALUES FROM ('{bounds['start']:%Y-%m-%d}') "
+            f"TO ('{bounds['end']:%Y-%m-%d}')"
+        )
+        try:
+            with self._db.session_scope() as session:
+                stranded = session.execute(
+                    text(f"SELECT EXISTS (SELECT 1 FROM {DEFAULT_PARTITION} WHERE {in_range})"),
+                    bounds,
+                ).scalar()
+                if not stranded:
+                    session.execute(create)
+                    return True
+                # Bookings made beyond months_ahead landed in the default
+                # partition, which would reject the new range. Move them
+                # across with the default detached; the whole swap is one
+                # transaction, so other writers wait instead of failing.
+                columns = ", ".join(column.name for column in partitioned_table().columns)
+                session.execute(text(f"ALTER TABLE {PARENT} DETACH PARTITION {DEFAULT_PARTITION}"))
+                session.execute(create)
+                session.execute(
+                    text(
+                        f"WITH moved AS (DELETE FROM {DEFAULT_PARTITION} WHERE {in_range} "
+                        f"RETURNING {columns}) "
+                        f"INSERT INTO {PARENT} ({columns}) SELECT {columns} FROM moved"
+                    ),
+                    bounds,
+                )
+                session.execute(
+                    text(f"ALTER TABLE {PARENT} ATTACH PARTITION {DEFAULT_PARTITION} DEFAULT")
+                )
+        except Exception as e:
+            logger.warning("Could not create partition %s: %s", name, e)
+            return False
+        logger.info("Moved the rows of %s out of %s", name, DEFAULT_PARTITION)
+        return True
+
+    def _drop_if_empty(self, name: str) -> bool:
+        with self._db.session_scope() as session:
+            # Held until the drop commits, so no late booking slips in between.
+            session.execute(text(f"LOCK TABLE {name} IN ACCESS EXCLUSIVE MODE"))
+            if session.execute(text(f"SELECT EXISTS (SELECT 1 FROM {name})")).scalar():
+                return False
+            session.execute(text(f"DROP TABLE {name}"))
+        return True
@@ -0,0 +1,162 @@
+"""Read-replica selection, replication heartbeat and read-your-writes pins."""
+
+import itertools
+import math
+import threading
+import time
+from collections.abc import Iterator, Sequence
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Optional
+
+from sqlalchemy import column, select, table
+from sqlalchemy.engine import Engine
+
+from config.logging import get_logger
+
+from ...application.interfaces.cache import CacheInterface
+from ..monitoring.metrics import DB_REPLICA_LAG
+
+logger = get_logger(__name__)
+
+HEARTBEAT_ROW_ID = 1
+
+# Lightweight mirror of ReplicaHeartbeatModel; models.py imports connection.py,
+# which imports this module.
+_heartbeat = table("replica_heartbeat", column("id"), column("written_at"))
+
+_primary_reads: ContextVar[bool] = ContextVar("primary_reads", default=False)
+
+
+@contextmanager
+def reads_from_primary(enabled: bool = True) -> Iterator[None]:
+    """Route read sessions to the primary for the duration of the block."""
+    token = _primary_reads.set(enabled)
+    try:
+        yield
+    finally:
+        _primary_reads.reset(token)
+
+
+def primary_reads_requested() -> bool:
+    return _primary_reads.get()
+
+
+class ReplicaSet:
+    """Round-robin over replicas whose heartbeat lag is within ``max_lag`` seconds.
+
+    Lag is re-measured at most every ``check_interval`` seconds per replica; a
+    replica that cannot be read counts as infinitely behind.
+    """
+
+    def __init__(
+        self, engines: Sequence[Engine], max_lag: float = 5.0, check_interval: float = 1.0
+    ) -> None:
+        self._engines = list(engines)
+        self._max_lag = max_lag
+        self._check_interval = check_interval
+        self._lags = [math.inf] * len(self._engines)
+        self._checked_at = [-math.inf] * len(self._engines)
+        self._next = itertools.count()
+
+    @property
+    def engines(self) -> list[Engine]:
+        return self._engines
+
+    def choose(self) -> Optional[Engine]:
+        start = next(self._next)
+        for offset in range(len(self._engines)):
+            index = (start + offset) % len(self._engines)
+            if self.lag(index) <= self._max_lag:
+                return self._engines[index]
+        return None
+
+    def lag(self, index: int) -> float:
+        now = time.monotonic()
+        if now - self._checked_at[index] >= self._check_interval:
+            self._checked_at[index] = now
+            self._lags[index] = self._measure_lag(index)
+            DB_REPLICA_LAG.set(
+                self._lags[index] if math.isfinite(self._lags[index]) else -1,
+                replica=str(index),
+            )
+        return self._lags[index]
+
+    def _measure_lag(self, index: int) -> float:
+        try:
+            with self._engines[index].connect() as connection:
+                written_at = connection.execute(
+                    select(_heartbeat.c.written_at).where(_heartbeat.c.id == HEARTBEAT_ROW_ID)
+                ).scalar_one_or_none()
+        except Exception as e:
+            logger.warning("Replica %s unavailable: %s", index, e)
+            return math.inf
+        if written_at is None:
+            return math.inf
+        return max(time.time() - float(written_at), 0.0)
+
+
+class ReplicationHeartbeat:
+    """Background writer of the heartbeat row on the primary."""
+
+    def __init__(self, engine: Engine, interval: float = 1.0) -> None:
+        self._engine = engine
+        self._interval = interval
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    def start(self) -> None:
+        if self._thread is not None:
+            return
+        self._thread = threading.Thread(
+            target=self._run, name="replication-heartbeat", daemon=True
+        )
+        self._thread.start()
+
+    def stop(self) -> None:
+        self._stop.set()
+
+    def beat(self) -> None:
+        now = time.time()
+        with self._engine.begin() as connection:
+            updated = connection.execute(
+                _heartbeat.update()
+                .where(_heartbeat.c.id == HEARTBEAT_ROW_ID)
+                .values(written_at=now)
+            ).rowcount
+            if not updated:
+                connection.execute(
+                    _heartbeat.insert().values(id=HEARTBEAT_ROW_ID, written_at=now)
+                )
+
+    def _run(self) -> None:
+        failing = False
+        while True:
+            try:
+                self.beat()
+                failing = False
+            except Exception as e:
+                if not failing:
+                    logger.warning("Replication heartbeat failed: %s", e)
+                failing = True
+            if self._stop.wait(self._interval):
+                return
+
+
+class ReadYourWritesPins:
+    """Remembers clients that just wrote so their reads go to the primary.
+
+    Pins live in the shared cache, so they hold across worker processes.
+    """
+
+    KEY_PREFIX = "ryw:"
+
+    def __init__(self, cache: CacheInterface, window_seconds: int = 5) -> None:
+        self._cache = cache
+        self._window = window_seconds
+
+    def pin(self, client: str) -> None:
+        self._cache.set(f"{self.KEY_PREFIX}{client}", 1, self._window)
+
+    def is_pinned(self, client: str) -> bool:
+        return self._cache.get(f"{self.KEY_PREFIX}{client}") is not None
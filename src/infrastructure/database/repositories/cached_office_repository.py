@@ -1,3 +1,5 @@
+import hashlib
+import json
 from typing import Optional
 
 from ....application.interfaces.cache import CacheInterface
@@ -6,8 +8,14 @@ from ....domain.entities.office import Office
 
 
 class CachedOfficeRepository(OfficeRepositoryInterface):
-    CACHE_KEY_ALL = "offices:all"
+    """Caches one entry per office plus listing pages.
+
+    There is no whole-catalog entry: ``find_all`` fills the per-office
+    entries, and pages are keyed by their query and dropped on any save.
+    """
+
     CACHE_KEY_PREFIX = "office:"
+    CACHE_KEY_PAGE_PREFIX = "offices:page:"
     DEFAULT_TTL = 300
 
     def __init__(
@@ -34,22 +42,47 @@ class CachedOfficeRepository(OfficeRepositoryInterface):
         return office
 
     def find_all(self) -> list[Office]:
-        cached = self._cache.get(self.CACHE_KEY_ALL)
-        if cached:
-            return [self._dict_to_office(item) for item in cached]
-
         offices = self._repository.find_all()
-        if offices:
-            cache_data = [self._office_to_dict(office) for office in offices]
-            self._cache.set(self.CACHE_KEY_ALL, cache_data, self._ttl)
+        for office in offices:
+            self._cache.set(
+                f"{self.CACHE_KEY_PREFIX}{office.office_id}",
+                self._office_to_dict(office),
+                self._ttl,
+            )
+        return offices
 
+    def find_page(
+        self,
+        *,
+        after_id: Optional[int] = None,
+        limit: int = 50,
+        min_capacity: Optional[int] = None,
+        building: Optional[str] = None,
+        text: Optional[str] = None,
+    ) -> list[Office]:
+        query = json.dumps([after_id, limit, min_capacity, building, text])
+        digest = hashlib.sha256(query.encode("utf-8")).hexdigest()
+        cache_key = f"{self.CACHE_KEY_PAGE_PREFIX}{digest}"
+
+        cached = self._cache.get(cache_key)
+        if cached is not None:
+            return [self._dict_to_office(item) for item in cached]
+
+        offices = self._repository.find_page(
+            after_id=after_id,
+            limit=limit,
+            min_capacity=min_capacity,
+            building=building,
+            text=text,
+        )
+        self._cache.set(cache_key, [self._office_to_dict(office) for office in offices], self._ttl)
         return offices
 
     def save(self, office: Office) -> Office:
         result = self._repository.save(office)
 
-        self._cache.delete(self.CACHE_KEY_ALL)
         self._cache.delete(f"{self.CACHE_KEY_PREFIX}{office.office_id}")
+        self._cache.delete_pattern(f"{self.CACHE_KEY_PAGE_PREFIX}*")
 
         return result
 
@@ -60,13 +93,15 @@ class CachedOfficeRepository(OfficeRepositoryInterface):
             "name": office.name,
             "capacity": office.capacity,
             "description": office.description,
+            "building": office.building,
         }
 
     @staticmethod
     def _dict_to_office(data: dict) -> Office:
-        return Office(
+        return Office.from_trusted(
             office_id=data["office_id"],
             name=data["name"],
             capacity=data["capacity"],
             description=data["description"],
+            building=data.get("building"),
         )
@@ -1,16 +1,30 @@
 
-from typing import Optional
+import re
+from typing import Any, Optional
 
+from sqlalchemy import and_, func, or_, select
 from sqlalchemy.orm import Session
 
 from ....application.interfaces.repository import OfficeRepositoryInterface
 from ....domain.entities.office import Office
-from ..models import OfficeModel
+from ..models import OFFICE_SEARCH, OfficeModel
+
+_WORD = re.compile(r"\w+")
+
+
+def search_terms(text: str) -> list[str]:
+    return [word.lower() for word in _WORD.findall(text)]
 
 
 class OfficeRepository(OfficeRepositoryInterface):
-    def __init__(self, session: Session) -> None:
+    """``full_text_search`` matches free text against the GIN-indexed tsvector
+    column, which only exists on PostgreSQL; otherwise every word must occur
+    in the name, building or description.
+    """
+
+    def __init__(self, session: Session, full_text_search: bool = False) -> None:
         self._session = session
+        self._full_text_search = full_text_search
 
     def get_by_id(self, office_id: int) -> Optional[Office]:
         model = self._session.query(OfficeModel).filter(OfficeModel.office_id == office_id).first()
@@ -24,6 +38,48 @@ class OfficeRepository(OfficeRepositoryInterface):
         models = self._session.query(OfficeModel).all()
         return [self._model_to_entity(model) for model in models]
 
+    def find_page(
+        self,
+        *,
+        after_id: Optional[int] = None,
+        limit: int = 50,
+        min_capacity: Optional[int] = None,
+        building: Optional[str] = None,
+        text: Optional[str] = None,
+    ) -> list[Office]:
+        # Keyset pagination: each page is an index range scan from after_id,
+        # however deep into the catalog it is.
+        conditions: list[Any] = []
+        if after_id is not None:
+            conditions.append(OfficeModel.office_id > after_id)
+        if min_capacity is not None:
+            conditions.append(OfficeModel.capacity >= min_capacity)
+        if building is not None:
+            conditions.append(OfficeModel.building == building)
+        terms = search_terms(text) if text else []
+        if terms:
+            conditions.append(self._text_condition(terms))
+
+        models = self._session.scalars(
+            select(OfficeModel).where(*conditions).order_by(OfficeModel.office_id).limit(limit)
+        ).all()
+        return [self._model_to_entity(model) for model in models]
+
+    def _text_condition(self, terms: list[str]) -> Any:
+        if self._full_text_search:
+            query = " & ".join(f"{term}:*" for term in terms)
+            return OFFICE_SEARCH.op("@@")(func.to_tsquery("simple", query))
+        return and_(
+            *(
+                or_(
+                    func.lower(OfficeModel.name).contains(term, autoescape=True),
+                    func.lower(OfficeModel.building).contains(term, autoescape=True),
+                    func.lower(OfficeModel.description).contains(term, autoescape=True),
+                )
+                for term in terms
+            )
+        )
+
     def save(self, office: Office) -> Office:
         existing_model = (
             self._session.query(OfficeModel)
@@ -35,6 +91,7 @@ class OfficeRepository(OfficeRepositoryInterface):
             existing_model.name = office.name  # type: ignore
             existing_model.capacity = office.capacity  # type: ignore
             existing_model.description = office.description  # type: ignore
+            existing_model.building = office.building  # type: ignore
         else:
             model = self._entity_to_model(office)
             self._session.add(model)
@@ -45,11 +102,12 @@ class OfficeRepository(OfficeRepositoryInterface):
 
     @staticmethod
     def _model_to_entity(model: OfficeModel) -> Office:
-        return Office(
+        return Office.from_trusted(
             office_id=model.office_id,  # type: ignore
             name=model.name,  # type: ignore
             capacity=model.capacity,  # type: ignore
             description=model.description,  # type: ignore
+            building=model.building,  # type: ignore
         )
 
     @staticmethod
@@ -59,5 +117,5 @@ class OfficeRepository(OfficeRepositoryInterface):
             name=entity.name,
             capacity=entity.capacity,
             description=entity.description,
+            building=entity.building,
         )
-
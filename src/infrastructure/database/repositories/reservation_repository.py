@@ -1,19 +1,44 @@
 
-from typing import Optional
+from datetime import datetime
+from typing import Optional, cast
 
+from sqlalchemy import ColumnElement, Select, Table, func, select
 from sqlalchemy.orm import Session
 
+from ....application.interfaces.availability_index import AvailabilityIndexInterface
 from ....application.interfaces.repository import ReservationRepositoryInterface
 from ....domain.entities.reservation import Reservation, ReservationStatus
 from ....domain.entities.user import User
 from ....domain.value_objects.contact_info import ContactInfo
-from ....domain.value_objects.time_slot import TimeSlot
-from ..models import ReservationModel
+from ....domain.value_objects.time_slot import MAX_DURATION, TimeSlot
+from ..models import RESERVATION_PERIOD, ReservationModel
+from ..rollups import BookedTime, booked_time, record_change
+
+ACTIVE_STATUSES = ("pending", "confirmed")
 
 
 class ReservationRepository(ReservationRepositoryInterface):
-    def __init__(self, session: Session) -> None:
+    """``range_overlap`` matches overlaps with ``&&`` on the GiST-indexed tsrange
+    column, which only exists on PostgreSQL; otherwise the start/end pair is
+    compared directly.
+
+    With an ``availability_index``, every committed write is mirrored into it.
+    With ``commit=False`` writes are only flushed into the caller's transaction
+    and reach the index when the caller calls ``sync_index`` after committing.
+    """
+
+    def __init__(
+        self,
+        session: Session,
+        range_overlap: bool = False,
+        availability_index: Optional[AvailabilityIndexInterface] = None,
+        commit: bool = True,
+    ) -> None:
         self._session = session
+        self._range_overlap = range_overlap
+        self._availability_index = availability_index
+        self._commit = commit
+        self._unsynced: list[tuple[Optional[Reservation], Optional[Reservation]]] = []
 
     def get_by_id(self, reservation_id: int) -> Optional[Reservation]:
         model = (
@@ -32,20 +57,47 @@ class ReservationRepository(ReservationRepositoryInterface):
         return [self._model_to_entity(model) for model in models]
 
     def find_by_office_and_time(self, office_id: int, time_slot: TimeSlot) -> list[Reservation]:
-        models = (
-            self._session.query(ReservationModel)
-            .filter(
-                ReservationModel.office_id == office_id,
-                ReservationModel.start_time < time_slot.end_time,
-                ReservationModel.end_time > time_slot.start_time,
-                ReservationModel.status.in_(["pending", "confirmed"]),
-            )
-            .all()
-        )
+        models = self._session.scalars(self._overlap_query(office_id, time_slot)).all()
+        return [self._model_to_entity(model) for model in models]
 
+    def find_upcoming(self, office_id: int, after: datetime) -> list[Reservation]:
+        """Active reservations of the office still running at ``after``."""
+        columns = cast(Table, ReservationModel.__table__).c
+        models = self._session.scalars(
+            select(ReservationModel)
+            .where(
+                columns.office_id == office_id,
+                columns.end_time > after,
+                columns.start_time > after - MAX_DURATION,
+                columns.status.in_(ACTIVE_STATUSES),
+            )
+            .order_by(columns.start_time)
+        ).all()
         return [self._model_to_entity(model) for model in models]
 
+    def _overlap_query(self, office_id: int, time_slot: TimeSlot) -> Select:
+        columns = cast(Table, ReservationModel.__table__).c
+        overlap: ColumnElement[bool]
+        if self._range_overlap:
+            overlap = RESERVATION_PERIOD.op("&&")(
+                func.tsrange(time_slot.start_time, time_slot.end_time, "[)")
+            )
+        else:
+            overlap = columns.end_time > time_slot.start_time
+        return select(ReservationModel).where(
+            columns.office_id == office_id,
+            overlap,
+            # No reservation outlasts MAX_DURATION, so overlapping ones start in
+            # this window; bounding start_time lets partitioned tables prune to
+            # the one or two months around the slot.
+            columns.start_time < time_slot.end_time,
+            columns.start_time > time_slot.start_time - MAX_DURATION,
+            columns.status.in_(ACTIVE_STATUSES),
+        )
+
     def save(self, reservation: Reservation) -> Reservation:
+        before: Optional[BookedTime] = None
+        previous: Optional[Reservation] = None
         if reservation.reservation_id:
             model = (
                 self._session.query(ReservationModel)
@@ -54,6 +106,8 @@ class ReservationRepository(ReservationRepositoryInterface):
             )
 
             if model:
+                before = self._booked_time(model)
+                previous = self._model_to_entity(model)
                 self._update_model_from_entity(model, reservation)
             else:
                 model = self._entity_to_model(reservation)
@@ -62,10 +116,13 @@ class ReservationRepository(ReservationRepositoryInterface):
             model = self._entity_to_model(reservation)
             self._session.add(model)
 
-        self._session.commit()
+        record_change(self._session, before, self._booked_time(model))
+        self._end_write()
         self._session.refresh(model)
 
-        return self._model_to_entity(model)
+        saved = self._model_to_entity(model)
+        self._sync_index(previous, saved)
+        return saved
 
     def delete(self, reservation_id: int) -> bool:
         model = (
@@ -77,27 +134,67 @@ class ReservationRepository(ReservationRepositoryInterface):
         if not model:
             return False
 
+        previous = self._model_to_entity(model)
+        record_change(self._session, self._booked_time(model), None)
         self._session.delete(model)
-        self._session.commit()
+        self._end_write()
 
+        self._sync_index(previous, None)
         return True
 
+    def sync_index(self) -> None:
+        """Mirror writes flushed with ``commit=False`` once they are committed."""
+        index = self._availability_index
+        if index is None:
+            return
+        unsynced, self._unsynced = self._unsynced, []
+        for previous, current in unsynced:
+            if previous is not None and previous.is_active():
+                index.remove(previous)
+            if current is not None and current.is_active():
+                index.add(current)
+
+    def _end_write(self) -> None:
+        if self._commit:
+            self._session.commit()
+        else:
+            self._session.flush()
+
+    def _sync_index(self, previous: Optional[Reservation], current: Optional[Reservation]) -> None:
+        # After the commit: the index never shows a write the database lost.
+        if self._availability_index is None or previous == current:
+            return
+        self._unsynced.append((previous, current))
+        if self._commit:
+            self.sync_index()
+
+    @staticmethod
+    def _booked_time(model: ReservationModel) -> Optional[BookedTime]:
+        return booked_time(
+            model.office_id,  # type: ignore[arg-type]
+            model.start_time,  # type: ignore[arg-type]
+            model.end_time,  # type: ignore[arg-type]
+            model.seats,  # type: ignore[arg-type]
+            model.status,  # type: ignore[arg-type]
+        )
+
     @staticmethod
     def _model_to_entity(model: ReservationModel) -> Reservation:
-        return Reservation(
+        return Reservation.from_trusted(
             reservation_id=model.reservation_id,  # type: ignore
             office_id=model.office_id,  # type: ignore
             status=ReservationStatus(model.status),  # type: ignore
             created_at=model.created_at,  # type: ignore
-            user=User(
+            seats=model.seats,  # type: ignore
+            user=User.from_trusted(
                 user_id=None,  # User ID not stored in this simple model
                 name=model.user_name,  # type: ignore
-                contact_info=ContactInfo(
+                contact_info=ContactInfo.from_trusted(
                     email=model.user_email,  # type: ignore
                     phone=model.user_phone,  # type: ignore
                 ),
             ),
-            time_slot=TimeSlot(
+            time_slot=TimeSlot.from_trusted(
                 start_time=model.start_time,  # type: ignore
                 end_time=model.end_time,  # type: ignore
             ),
@@ -115,6 +212,7 @@ class ReservationRepository(ReservationRepositoryInterface):
             end_time=reservation.time_slot.end_time,
             status=reservation.status.value,
             created_at=reservation.created_at,
+            seats=reservation.seats,
         )
 
     @staticmethod
@@ -126,3 +224,4 @@ class ReservationRepository(ReservationRepositoryInterface):
         model.start_time = entity.time_slot.start_time  # type: ignore
         model.end_time = entity.time_slot.end_time  # type: ignore
         model.status = entity.status.value  # type: ignore
+        model.seats = entity.seats  # type: ignore
@@ -0,0 +1,133 @@
+from datetime import date, datetime
+from typing import Optional, cast
+
+from sqlalchemy import Table, select
+from sqlalchemy.orm import Session
+
+from ....application.interfaces.availability_index import AvailabilityIndexInterface
+from ....application.interfaces.repository import ReservationSeriesRepositoryInterface
+from ....domain.entities.reservation_series import Recurrence, ReservationSeries
+from ....domain.entities.user import User
+from ....domain.value_objects.contact_info import ContactInfo
+from ....domain.value_objects.time_slot import TimeSlot
+from ..models import ReservationSeriesModel
+
+
+class ReservationSeriesRepository(ReservationSeriesRepositoryInterface):
+    """With an ``availability_index``, every committed save is mirrored into it.
+
+    With ``commit=False`` saves are only flushed into the caller's transaction
+    and reach the index when the caller calls ``sync_index`` after committing.
+    """
+
+    def __init__(
+        self,
+        session: Session,
+        availability_index: Optional[AvailabilityIndexInterface] = None,
+        commit: bool = True,
+    ) -> None:
+        self._session = session
+        self._availability_index = availability_index
+        self._commit = commit
+        self._unsynced: list[ReservationSeries] = []
+
+    def get_by_id(self, series_id: int) -> Optional[ReservationSeries]:
+        model = self._session.get(ReservationSeriesModel, series_id)
+        return self._model_to_entity(model) if model else None
+
+    def find_by_office_and_time(self, office_id: int, window: TimeSlot) -> list[ReservationSeries]:
+        columns = cast(Table, ReservationSeriesModel.__table__).c
+        models = self._session.scalars(
+            select(ReservationSeriesModel).where(
+                columns.office_id == office_id,
+                columns.last_end > window.start_time,
+                columns.start_time < window.end_time,
+            )
+        ).all()
+        return [self._model_to_entity(model) for model in models]
+
+    def find_upcoming(self, office_id: int, after: datetime) -> list[ReservationSeries]:
+        """Series of the office with occurrences still running at ``after``."""
+        columns = cast(Table, ReservationSeriesModel.__table__).c
+        models = self._session.scalars(
+            select(ReservationSeriesModel).where(
+                columns.office_id == office_id,
+                columns.last_end > after,
+            )
+        ).all()
+        return [self._model_to_entity(model) for model in models]
+
+    def save(self, series: ReservationSeries) -> ReservationSeries:
+        model = None
+        if series.series_id:
+            model = self._session.get(ReservationSeriesModel, series.series_id)
+        if model is None:
+            model = ReservationSeriesModel(series_id=series.series_id)
+            self._session.add(model)
+        self._update_model_from_entity(model, series)
+
+        if self._commit:
+            self._session.commit()
+        else:
+            self._session.flush()
+        self._session.refresh(model)
+
+        saved = self._model_to_entity(model)
+        if self._availability_index is not None:
+            self._unsynced.append(saved)
+            if self._commit:
+                self.sync_index()
+        return saved
+
+    def sync_index(self) -> None:
+        """Mirror saves flushed with ``commit=False`` once they are committed."""
+        index = self._availability_index
+        if index is None:
+            return
+        unsynced, self._unsynced = self._unsynced, []
+        for series in unsynced:
+            index.put_series(series)
+
+    @staticmethod
+    def _model_to_entity(model: ReservationSeriesModel) -> ReservationSeries:
+        return ReservationSeries.from_trusted(
+            series_id=model.series_id,  # type: ignore
+            office_id=model.office_id,  # type: ignore
+            user=User.from_trusted(
+                user_id=None,
+                name=model.user_name,  # type: ignore
+                contact_info=ContactInfo.from_trusted(
+                    email=model.user_email,  # type: ignore
+                    phone=model.user_phone,  # type: ignore
+                ),
+            ),
+            first_slot=TimeSlot.from_trusted(
+                start_time=model.start_time,  # type: ignore
+                end_time=model.end_time,  # type: ignore
+            ),
+            recurrence=Recurrence(model.recurrence),
+            interval=model.repeat_interval,  # type: ignore
+            until=model.until,  # type: ignore
+            count=model.count,  # type: ignore
+            exceptions={date.fromisoformat(day) for day in model.exceptions},  # type: ignore
+            seats=model.seats,  # type: ignore
+            created_at=model.created_at,  # type: ignore
+        )
+
+    @staticmethod
+    def _update_model_from_entity(model: ReservationSeriesModel, entity: ReservationSeries) -> None:
+        model.office_id = entity.office_id  # type: ignore
+        model.user_name = entity.user.name  # type: ignore
+        model.user_email = entity.user.contact_info.email  # type: ignore
+        model.user_phone = entity.user.contact_info.phone  # type: ignore
+        model.start_time = entity.first_slot.start_time  # type: ignore
+        model.end_time = entity.first_slot.end_time  # type: ignore
+        model.last_end = entity.last_end  # type: ignore
+        model.recurrence = entity.recurrence.value  # type: ignore
+        model.repeat_interval = entity.interval  # type: ignore
+        model.until = entity.until  # type: ignore
+        model.count = entity.count  # type: ignore
+        # A new list, so the JSON column is seen as changed.
+        model.exceptions = sorted(day.isoformat() for day in entity.exceptions)  # type: ignore
+        model.seats = entity.seats  # type: ignore
+        model.created_at = entity.created_at  # type: ignore
@@ -0,0 +1,53 @@
+from datetime import datetime
+from typing import Optional, cast
+
+from sqlalchemy import Table, select, union_all
+from sqlalchemy.orm import Session
+
+from ....application.interfaces.repository import UtilizationRepositoryInterface
+from ....domain.utilization import Granularity
+from ....domain.value_objects.time_slot import MAX_DURATION
+from ..models import ReservationArchiveModel, ReservationModel, UtilizationRollupModel
+from ..rollups import COUNTED_STATUSES
+
+
+class UtilizationRepository(UtilizationRepositoryInterface):
+    def __init__(self, session: Session) -> None:
+        self._session = session
+
+    def find_rollups(
+        self, office_id: int, granularity: Granularity, start: datetime, end: datetime
+    ) -> dict[datetime, tuple[int, int]]:
+        # A range scan over the primary key (office_id, granularity, bucket_start).
+        table = cast(Table, UtilizationRollupModel.__table__)
+        rows = self._session.execute(
+            select(table.c.bucket_start, table.c.whole_seconds, table.c.seat_seconds).where(
+                table.c.office_id == office_id,
+                table.c.granularity == granularity.value,
+                table.c.bucket_start >= start,
+                table.c.bucket_start < end,
+            )
+        )
+        return {bucket: (whole, seat) for bucket, whole, seat in rows}
+
+    def find_booked_times(
+        self, office_id: int, start: datetime, end: datetime
+    ) -> tuple[list[datetime], list[datetime], list[Optional[int]]]:
+        # Plain columns, no ORM objects: the caller only needs three arrays.
+        queries = []
+        for model in (ReservationModel, ReservationArchiveModel):
+            table = cast(Table, model.__table__)
+            queries.append(
+                select(table.c.start_time, table.c.end_time, table.c.seats).where(
+                    table.c.office_id == office_id,
+                    table.c.status.in_(COUNTED_STATUSES),
+                    table.c.end_time > start,
+                    table.c.start_time < end,
+                    table.c.start_time > start - MAX_DURATION,
+                )
+            )
+        rows = self._session.execute(union_all(*queries)).all()
+        if not rows:
+            return [], [], []
+        starts, ends, seats = zip(*rows)
+        return list(starts), list(ends), list(seats)
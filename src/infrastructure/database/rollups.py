@@ -0,0 +1,131 @@
+"""Incremental maintenance of the utilization rollup table."""
+
+from collections import defaultdict
+from datetime import datetime
+from typing import NamedTuple, Optional, cast
+
+from sqlalchemy import CompoundSelect, Table, select, union_all
+from sqlalchemy.dialects import postgresql, sqlite
+from sqlalchemy.orm import Session
+
+from config.logging import get_logger
+
+from ...domain.utilization import Granularity, split_by_bucket
+from .connection import DatabaseConnection
+from .models import ReservationArchiveModel, ReservationModel, UtilizationRollupModel
+
+logger = get_logger(__name__)
+
+# Completed bookings were used; only cancelled ones stop counting.
+COUNTED_STATUSES = ("pending", "confirmed", "completed")
+
+_BACKFILL_BATCH = 5000
+# Rows per upsert, well under SQLite's bound parameter limit.
+_UPSERT_ROWS = 1000
+
+_RollupKey = tuple[int, str, datetime]
+
+
+class BookedTime(NamedTuple):
+    office_id: int
+    start_time: datetime
+    end_time: datetime
+    seats: Optional[int]
+
+
+def booked_time(
+    office_id: int, start_time: datetime, end_time: datetime, seats: Optional[int], status: str
+) -> Optional[BookedTime]:
+    """What a reservation in ``status`` contributes to the rollups, if anything."""
+    if status not in COUNTED_STATUSES:
+        return None
+    return BookedTime(office_id, start_time, end_time, seats)
+
+
+def record_change(
+    session: Session, removed: Optional[BookedTime], added: Optional[BookedTime]
+) -> None:
+    """Move one reservation's contribution from ``removed`` to ``added``.
+
+    Runs in the caller's transaction, so the rollups commit with the write.
+    """
+    if removed == added:
+        return
+    deltas: dict[_RollupKey, list[int]] = defaultdict(lambda: [0, 0])
+    if removed is not None:
+        _accumulate(deltas, removed, -1)
+    if added is not None:
+        _accumulate(deltas, added, 1)
+    _apply(session, deltas)
+
+
+def backfill_rollups(db: DatabaseConnection) -> None:
+    """Build the rollups from live and archived reservations if they are empty."""
+    with db.session_scope() as session:
+        if session.scalar(select(UtilizationRollupModel.office_id).limit(1)) is not None:
+            return
+
+        deltas: dict[_RollupKey, list[int]] = defaultdict(lambda: [0, 0])
+        rows = 0
+        for row in session.execute(_counted_rows()).yield_per(_BACKFILL_BATCH):
+            _accumulate(deltas, BookedTime(*row), 1)
+            rows += 1
+        _apply(session, deltas)
+    if rows:
+        logger.info("Built utilization rollups from %s reservations", rows)
+
+
+def _counted_rows() -> CompoundSelect:
+    columns = ("office_id", "start_time", "end_time", "seats")
+    hot = cast(Table, ReservationModel.__table__)
+    archive = cast(Table, ReservationArchiveModel.__table__)
+    return union_all(
+        *(
+            select(*(table.c[name] for name in columns)).where(
+                table.c.status.in_(COUNTED_STATUSES)
+            )
+            for table in (hot, archive)
+        )
+    )
+
+
+def _accumulate(deltas: dict[_RollupKey, list[int]], booked: BookedTime, sign: int) -> None:
+    for granularity in Granularity:
+        for bucket, seconds in split_by_bucket(booked.start_time, booked.end_time, granularity):
+            totals = deltas[(booked.office_id, granularity.value, bucket)]
+            if booked.seats is None:
+                totals[0] += sign * seconds
+            else:
+                totals[1] += sign * seconds * booked.seats
+
+
+def _apply(session: Session, deltas: dict[_RollupKey, list[int]]) -> None:
+    rows = [
+        {
+            "office_id": office_id,
+            "granularity": granularity,
+            "bucket_start": bucket,
+            "whole_seconds": whole,
+            "seat_seconds": seat,
+        }
+        for (office_id, granularity, bucket), (whole, seat) in deltas.items()
+        if whole or seat
+    ]
+    if not rows:
+        return
+
+    # A single reservation touches at most a day of hours plus the
+    # surrounding days and weeks, so a write is one upsert statement.
+    table = cast(Table, UtilizationRollupModel.__table__)
+    dialect = postgresql if session.get_bind().dialect.name == "postgresql" else sqlite
+    for offset in range(0, len(rows), _UPSERT_ROWS):
+        statement = dialect.insert(table).values(rows[offset : offset + _UPSERT_ROWS])
+        session.execute(
+            statement.on_conflict_do_update(
+                index_elements=[table.c.office_id, table.c.granularity, table.c.bucket_start],
+                set_={
+                    "whole_seconds": table.c.whole_seconds + statement.excluded.whole_seconds,
+                    "seat_seconds": table.c.seat_seconds + statement.excluded.seat_seconds,
+                },
+            )
+        )
@@ -0,0 +1,78 @@
+from typing import Optional, cast
+
+from sqlalchemy import Table, inspect, select, text
+from sqlalchemy.engine import Connection
+from sqlalchemy.exc import SQLAlchemyError
+
+from .connection import DatabaseConnection
+from .models import OfficeModel, SchemaInfoModel
+
+_ROW_ID = 1
+
+_RESERVATION_PERIOD_DDL = (
+    "ALTER TABLE reservations ADD COLUMN IF NOT EXISTS period tsrange "
+    "GENERATED ALWAYS AS (tsrange(start_time, end_time, '[)')) STORED",
+    "CREATE INDEX IF NOT EXISTS ix_reservations_period ON reservations USING gist (period)",
+)
+
+_OFFICE_SEARCH_DDL = (
+    "ALTER TABLE offices ADD COLUMN IF NOT EXISTS search tsvector GENERATED ALWAYS AS "
+    "(to_tsvector('simple', coalesce(name, '') || ' ' || coalesce(building, '') || ' ' "
+    "|| coalesce(description, ''))) STORED",
+    "CREATE INDEX IF NOT EXISTS ix_offices_search ON offices USING gin (search)",
+)
+
+
+def get_schema_version(db: DatabaseConnection) -> Optional[int]:
+    try:
+        with db.session_scope() as session:
+            return session.execute(
+                select(SchemaInfoModel.version).where(SchemaInfoModel.id == _ROW_ID)
+            ).scalar_one_or_none()
+    except SQLAlchemyError:
+        # Table missing: the database predates version tracking or is empty.
+        return None
+
+
+def set_schema_version(db: DatabaseConnection, version: int) -> None:
+    with db.session_scope() as session:
+        session.merge(SchemaInfoModel(id=_ROW_ID, version=version))
+
+
+def ensure_reservation_periods(db: DatabaseConnection) -> None:
+    """Add the tsrange column and its GiST index on PostgreSQL; no-op elsewhere."""
+    if db.dialect_name != "postgresql":
+        return
+    with db.session_scope() as session:
+        for statement in _RESERVATION_PERIOD_DDL:
+            session.execute(text(statement))
+
+
+def ensure_office_catalog(db: DatabaseConnection) -> None:
+    """Bring an offices table created before buildings existed up to date.
+
+    create_all neither adds columns nor indexes to existing tables. On
+    PostgreSQL this also adds the full-text search column and its GIN index.
+    """
+    with db.session_scope() as session:
+        connection = session.connection()
+        _add_missing_column(connection, "offices", "building", "VARCHAR(100)")
+        for index in cast(Table, OfficeModel.__table__).indexes:
+            index.create(connection, checkfirst=True)
+        if db.dialect_name == "postgresql":
+            for statement in _OFFICE_SEARCH_DDL:
+                connection.execute(text(statement))
+
+
+def ensure_reservation_seats(db: DatabaseConnection) -> None:
+    """Add the nullable seats column to reservation tables that predate it."""
+    with db.session_scope() as session:
+        connection = session.connection()
+        for table in ("reservations", "reservations_archive"):
+            _add_missing_column(connection, table, "seats", "INTEGER")
+
+
+def _add_missing_column(connection: Connection, table: str, column: str, ddl_type: str) -> None:
+    # create_all only creates missing tables, never missing columns.
+    if column not in {existing["name"] for existing in inspect(connection).get_columns(table)}:
+        connection.execute(text(f"ALTER TABLE {table} ADD COLUMN {column} {ddl_type}"))
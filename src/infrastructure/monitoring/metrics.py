@@ -0,0 +1,245 @@
+import bisect
+import threading
+from abc import ABC, abstractmethod
+from collections.abc import Iterable
+from typing import Optional
+
+LabelValues = tuple[str, ...]
+
+DEFAULT_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def _format_labels(names: Iterable[str], values: Iterable[str]) -> str:
+    pairs = [f'{name}="{_escape(value)}"' for name, value in zip(names, values)]
+    return "{" + ",".join(pairs) + "}" if pairs else ""
+
+
+def _format_value(value: float) -> str:
+    if value == float("inf"):
+        return "+Inf"
+    if float(value).is_integer():
+        return str(int(value))
+    return repr(float(value))
+
+
+class _Metric(ABC):
+    metric_type = ""
+
+    def __init__(self, name: str, documentation: str, labels: tuple[str, ...] = ()) -> None:
+        self.name = name
+        self.documentation = documentation
+        self.label_names = labels
+        # A single short critical section per update keeps recording cheap and
+        # safe for the multi-threaded server.
+        self._lock = threading.Lock()
+
+    def _key(self, labels: dict[str, str]) -> LabelValues:
+        return tuple(labels.get(name, "") for name in self.label_names)
+
+    def _header(self) -> list[str]:
+        return [
+            f"# HELP {self.name} {self.documentation}",
+            f"# TYPE {self.name} {self.metric_type}",
+        ]
+
+    @abstractmethod
+    def collect(self) -> list[str]:
+        pass
+
+
+class Counter(_Metric):
+    metric_type = "counter"
+
+    def __init__(self, name: str, documentation: str, labels: tuple[str, ...] = ()) -> None:
+        super().__init__(name, documentation, labels)
+        self._values: dict[LabelValues, float] = {}
+
+    def inc(self, amount: float = 1.0, **labels: str) -> None:
+        key = self._key(labels)
+        with self._lock:
+            self._values[key] = self._values.get(key, 0.0) + amount
+
+    def value(self, **labels: str) -> float:
+        return self._values.get(self._key(labels), 0.0)
+
+    def collect(self) -> list[str]:
+        with self._lock:
+            values = list(self._values.items())
+        lines = self._header()
+        for key, value in values:
+            lines.append(
+                f"{self.name}{_format_labels(self.label_names, key)} {_format_value(value)}"
+            )
+        return lines
+
+
+class Gauge(Counter):
+    metric_type = "gauge"
+
+    def dec(self, amount: float = 1.0, **labels: str) -> None:
+        self.inc(-amount, **labels)
+
+    def set(self, value: float, **labels: str) -> None:
+        key = self._key(labels)
+        with self._lock:
+            self._values[key] = value
+
+
+class Histogram(_Metric):
+    metric_type = "histogram"
+
+    def __init__(
+        self,
+        name: str,
+        documentation: str,
+        labels: tuple[str, ...] = (),
+        buckets: tuple[float, ...] = DEFAULT_BUCKETS,
+    ) -> None:
+        super().__init__(name, documentation, labels)
+        self._buckets = tuple(sorted(buckets))
+        # Per label set: [count per bucket (+Inf last)..., sum]
+        self._values: dict[LabelValues, list[float]] = {}
+
+    def observe(self, value: float, **labels: str) -> None:
+        key = self._key(labels)
+        index = bisect.bisect_left(self._buckets, value)
+        with self._lock:
+            state = self._values.get(key)
+            if state is None:
+                state = self._values[key] = [0.0] * (len(self._buckets) + 2)
+            state[index] += 1
+            state[-1] += value
+
+    def count(self, **labels: str) -> int:
+        state = self._values.get(self._key(labels))
+        return int(sum(state[:-1])) if state else 0
+
+    def collect(self) -> list[str]:
+        with self._lock:
+            values = [(key, list(state)) for key, state in self._values.items()]
+
+        lines = self._header()
+        bucket_names = (*self.label_names, "le")
+        bounds = (*self._buckets, float("inf"))
+        for key, state in values:
+            cumulative = 0.0
+            for bound, bucket_count in zip(bounds, state[:-1]):
+                cumulative += bucket_count
+                labels = _format_labels(bucket_names, (*key, _format_value(bound)))
+                lines.append(f"{self.name}_bucket{labels} {_format_value(cumulative)}")
+            labels = _format_labels(self.label_names, key)
+            lines.append(f"{self.name}_sum{labels} {_format_value(state[-1])}")
+            lines.append(f"{self.name}_count{labels} {_format_value(cumulative)}")
+        return lines
+
+
+class MetricsRegistry:
+    def __init__(self) -> None:
+        self._metrics: dict[str, _Metric] = {}
+        self._lock = threading.Lock()
+
+    def counter(self, name: str, documentation: str, labels: tuple[str, ...] = ()) -> Counter:
+        return self._register(Counter(name, documentation, labels))  # type: ignore[return-value]
+
+    def gauge(self, name: str, documentation: str, labels: tuple[str, ...] = ()) -> Gauge:
+        return self._register(Gauge(name, documentation, labels))  # type: ignore[return-value]
+
+    def histogram(
+        self,
+        name: str,
+        documentation: str,
+        labels: tuple[str, ...] = (),
+        buckets: Optional[tuple[float, ...]] = None,
+    ) -> Histogram:
+        metric = Histogram(name, documentation, labels, buckets or DEFAULT_BUCKETS)
+        return self._register(metric)  # type: ignore[return-value]
+
+    def _register(self, metric: _Metric) -> _Metric:
+        with self._lock:
+            existing = self._metrics.get(metric.name)
+            if existing is not None:
+                return existing
+            self._metrics[metric.name] = metric
+            return metric
+
+    def render(self) -> str:
+        with self._lock:
+            metrics = list(self._metrics.values())
+
+        lines: list[str] = []
+        for metric in metrics:
+            lines.extend(metric.collect())
+        return "\n".join(lines) + "\n"
+
+
+registry = MetricsRegistry()
+
+HTTP_REQUEST_DURATION = registry.histogram(
+    "http_request_duration_seconds",
+    "HTTP request latency by route",
+    labels=("method", "route"),
+)
+HTTP_REQUESTS = registry.counter(
+    "http_requests_total", "HTTP requests by route and status", labels=("method", "route", "status")
+)
+HTTP_REQUESTS_IN_FLIGHT = registry.gauge(
+    "http_requests_in_flight", "HTTP requests currently being served"
+)
+HTTP_QUEUE_DEPTH = registry.gauge(
+    "http_queue_depth", "Accepted connections waiting for a worker thread"
+)
+HTTP_REQUESTS_SHED = registry.counter(
+    "http_requests_shed_total",
+    "Connections answered with 503 by load shedding",
+    labels=("reason",),
+)
+RATE_LIMIT_REJECTIONS = registry.counter(
+    "rate_limit_rejections_total", "Requests rejected by the rate limiter"
+)
+CACHE_OPERATIONS = registry.counter(
+    "cache_operations_total",
+    "Cache operations by outcome (hit, miss, error)",
+    labels=("operation", "result"),
+)
+DB_QUERIES = registry.counter(
+    "db_queries_total", "Database statements executed", labels=("statement",)
+)
+DB_QUERY_DURATION = registry.histogram(
+    "db_query_duration_seconds",
+    "Database statement execution time",
+    labels=("statement",),
+    buckets=(0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0),
+)
+DB_READ_ROUTES = registry.counter(
+    "db_read_routes_total",
+    "Read sessions' statement routing (replica, or primary and why)",
+    labels=("target", "reason"),
+)
+DB_REPLICA_LAG = registry.gauge(
+    "db_replica_lag_seconds", "Last measured replica lag from the heartbeat", labels=("replica",)
+)
+RESERVATIONS_SWEPT = registry.counter(
+    "reservations_swept_total",
+    "Reservations marked completed or moved to the archive by the sweeper",
+    labels=("action",),
+)
+DB_QUERIES_PER_REQUEST = registry.histogram(
+    "db_queries_per_request",
+    "Database statements issued per HTTP request",
+    labels=("route",),
+    buckets=(0, 1, 2, 3, 4, 5, 8, 13, 21),
+)
+NOTIFICATION_DURATION = registry.histogram(
+    "notification_send_duration_seconds",
+    "Notification send latency by channel",
+    labels=("channel", "result"),
+)
+AVAILABILITY_INDEX_READS = registry.counter(
+    "availability_index_reads_total",
+    "Availability read model lookups by outcome (hit, or why the database answered)",
+    labels=("result",),
+)
@@ -0,0 +1,124 @@
+import cProfile
+import io
+import pstats
+import random
+import threading
+import tracemalloc
+from collections.abc import Callable
+from typing import Optional, TypeVar
+
+from config.logging import get_logger
+
+logger = get_logger(__name__)
+
+T = TypeVar("T")
+
+SORT_KEYS = frozenset({"cumulative", "tottime", "calls", "ncalls", "time"})
+
+
+class RequestProfiler:
+    """Samples requests through cProfile and aggregates the results.
+
+    Only one request is profiled at a time: cProfile hooks are process-wide on
+    newer interpreters, and serialising keeps the overhead bounded.
+    """
+
+    def __init__(self, sample_rate: float = 0.0) -> None:
+        self._sample_rate = sample_rate
+        self._stats: Optional[pstats.Stats] = None
+        self._profiled_requests = 0
+        self._busy = threading.Lock()
+        self._stats_lock = threading.Lock()
+
+    @property
+    def sample_rate(self) -> float:
+        return self._sample_rate
+
+    @sample_rate.setter
+    def sample_rate(self, value: float) -> None:
+        self._sample_rate = min(max(value, 0.0), 1.0)
+
+    def should_profile(self, forced: bool = False) -> bool:
+        if forced:
+            return True
+        rate = self._sample_rate
+        return rate > 0.0 and random.random() < rate  # nosec B311
+
+    def run(self, func: Callable[[], T]) -> T:
+        if not self._busy.acquire(blocking=False):
+            return func()
+
+        profile = cProfile.Profile()
+        try:
+            profile.enable()
+            try:
+                result = func()
+            finally:
+                profile.disable()
+        finally:
+            self._busy.release()
+
+        with self._stats_lock:
+            if self._stats is None:
+                self._stats = pstats.Stats(profile)
+            else:
+                self._stats.add(profile)
+            self._profiled_requests += 1
+        return result
+
+    def report(self, sort: str = "cumulative", limit: int = 40) -> str:
+        sort_key = sort if sort in SORT_KEYS else "cumulative"
+        with self._stats_lock:
+            if self._stats is None:
+                return "No requests profiled yet.\n"
+
+            buffer = io.StringIO()
+            buffer.write(f"Profiled requests: {self._profiled_requests}\n")
+            self._stats.stream = buffer  # type: ignore[attr-defined]
+            self._stats.sort_stats(sort_key).print_stats(limit)
+            return buffer.getvalue()
+
+    def reset(self) -> None:
+        with self._stats_lock:
+            self._stats = None
+            self._profiled_requests = 0
+
+
+class MemorySnapshots:
+    def __init__(self, frames: int = 10) -> None:
+        self._frames = frames
+        self._previous: Optional[tracemalloc.Snapshot] = None
+        self._lock = threading.Lock()
+
+    def take(self, limit: int = 20) -> str:
+        with self._lock:
+            if not tracemalloc.is_tracing():
+                tracemalloc.start(self._frames)
+                logger.info("tracemalloc started")
+
+            snapshot = tracemalloc.take_snapshot().filter_traces(
+                (
+                    tracemalloc.Filter(False, tracemalloc.__file__),
+                    tracemalloc.Filter(False, "<frozen importlib._bootstrap>"),
+                )
+            )
+            previous, self._previous = self._previous, snapshot
+
+        current, peak = tracemalloc.get_traced_memory()
+        lines = [f"Traced memory: current={current} bytes, peak={peak} bytes"]
+
+        if previous is None:
+            lines.append(f"Baseline snapshot taken; top {limit} allocation sites:")
+            lines.extend(str(stat) for stat in snapshot.statistics("lineno")[:limit])
+        else:
+            lines.append(f"Top {limit} differences since previous snapshot:")
+            lines.extend(str(stat) for stat in snapshot.compare_to(previous, "lineno")[:limit])
+
+        return "\n".join(lines) + "\n"
+
+    def stop(self) -> None:
+        with self._lock:
+            self._previous = None
+            if tracemalloc.is_tracing():
+                tracemalloc.stop()
+                logger.info("tracemalloc stopped")
@@ -0,0 +1,36 @@
+from ...application.interfaces.notification import (
+    NotificationData,
+    NotificationServiceInterface,
+)
+
+
+class BufferedNotificationService(NotificationServiceInterface):
+    """Holds notifications until ``flush``, e.g. until a batch transaction commits.
+
+    Sends report success as soon as they are queued, so nobody hears about a
+    booking that is rolled back afterwards.
+    """
+
+    def __init__(self, service: NotificationServiceInterface) -> None:
+        self._service = service
+        self._pending: list[tuple[str, NotificationData]] = []
+
+    def send_email(self, notification_data: NotificationData) -> bool:
+        self._pending.append(("email", notification_data))
+        return True
+
+    def send_sms(self, notification_data: NotificationData) -> bool:
+        self._pending.append(("sms", notification_data))
+        return True
+
+    def flush(self) -> int:
+        pending, self._pending = self._pending, []
+        for channel, notification_data in pending:
+            if channel == "email":
+                self._service.send_email(notification_data)
+            else:
+                self._service.send_sms(notification_data)
+        return len(pending)
+
+    def discard(self) -> None:
+        self._pending.clear()
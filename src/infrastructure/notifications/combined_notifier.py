@@ -1,7 +1,10 @@
+import time
+
 from ...application.interfaces.notification import (
     NotificationData,
     NotificationServiceInterface,
 )
+from ..monitoring.metrics import NOTIFICATION_DURATION
 from .email_notifier import EmailNotifier
 from .sms_notifier import SMSNotifier
 
@@ -12,7 +15,21 @@ class CombinedNotificationService(NotificationServiceInterface):
         self._sms_notifier = sms_notifier
 
     def send_email(self, notification_data: NotificationData) -> bool:
-        return self._email_notifier.send_email(notification_data)
+        started = time.perf_counter()
+        sent = self._email_notifier.send_email(notification_data)
+        self._record("email", started, sent)
+        return sent
 
     def send_sms(self, notification_data: NotificationData) -> bool:
-        return self._sms_notifier.send_sms(notification_data)
+        started = time.perf_counter()
+        sent = self._sms_notifier.send_sms(notification_data)
+        self._record("sms", started, sent)
+        return sent
+
+    @staticmethod
+    def _record(channel: str, started: float, sent: bool) -> None:
+        NOTIFICATION_DURATION.observe(
+            time.perf_counter() - started,
+            channel=channel,
+            result="success" if sent else "failure",
+        )
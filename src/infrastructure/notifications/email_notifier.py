@@ -34,31 +34,31 @@ class EmailNotifier(NotificationServiceInterface):
             return self._send_to_console(notification_data)
 
         try:
-            logger.info(f"Sending email to {notification_data.recipient_email}")
-            logger.debug(f"SMTP Host: {self._smtp_host}:{self._smtp_port}")
-            logger.debug(f"From: {self._from_email}")
+            logger.info("Sending email to %s", notification_data.recipient_email)
+            logger.debug("SMTP Host: %s:%s", self._smtp_host, self._smtp_port)
+            logger.debug("From: %s", self._from_email)
 
             message = self._build_message(notification_data)
             self._send_via_smtp(message, notification_data.recipient_email)
 
-            logger.info(f"Email sent successfully to {notification_data.recipient_email}")
+            logger.info("Email sent successfully to %s", notification_data.recipient_email)
             return True
 
         except smtplib.SMTPAuthenticationError as e:
-            logger.error(f"SMTP Authentication failed: {e}")
+            logger.error("SMTP Authentication failed: %s", e)
             logger.error("Check SMTP_USERNAME and SMTP_PASSWORD in .env")
             return False
 
         except smtplib.SMTPRecipientsRefused as e:
-            logger.error(f"Recipient refused: {e}")
+            logger.error("Recipient refused: %s", e)
             return False
 
         except smtplib.SMTPException as e:
-            logger.error(f"SMTP error: {type(e).__name__}: {e}")
+            logger.error("SMTP error: %s: %s", type(e).__name__, e)
             return False
 
         except OSError as e:
-            logger.error(f"Network error: {e}")
+            logger.error("Network error: %s", e)
             return False
 
     def send_sms(self, _notification_data: NotificationData) -> bool:
@@ -73,10 +73,11 @@ class EmailNotifier(NotificationServiceInterface):
         )
         if not configured:
             logger.debug(
-                f"Email config check - host: {bool(self._smtp_host)}, "
-                f"username: {bool(self._smtp_username)}, "
-                f"password: {bool(self._smtp_password)}, "
-                f"from_email: {bool(self._from_email)}"
+                "Email config check - host: %s, username: %s, password: %s, from_email: %s",
+                bool(self._smtp_host),
+                bool(self._smtp_username),
+                bool(self._smtp_password),
+                bool(self._from_email),
             )
         return configured
 
@@ -106,16 +107,16 @@ class EmailNotifier(NotificationServiceInterface):
     def _send_via_smtp(self, message: MIMEMultipart, recipient: str) -> None:
         context = ssl.create_default_context()
 
-        logger.debug(f"Connecting to {self._smtp_host}:{self._smtp_port}")
+        logger.debug("Connecting to %s:%s", self._smtp_host, self._smtp_port)
 
         with smtplib.SMTP(self._smtp_host, self._smtp_port, timeout=30) as server:
             logger.debug("Starting TLS")
             server.starttls(context=context)
 
-            logger.debug(f"Logging in as {self._smtp_username}")
+            logger.debug("Logging in as %s", self._smtp_username)
             server.login(self._smtp_username, self._smtp_password)
 
-            logger.debug(f"Sending message to {recipient}")
+            logger.debug("Sending message to %s", recipient)
             server.sendmail(self._from_email, recipient, message.as_string())
 
     @staticmethod
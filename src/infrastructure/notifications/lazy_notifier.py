@@ -0,0 +1,33 @@
+import threading
+from collections.abc import Callable
+from typing import Optional
+
+from ...application.interfaces.notification import (
+    NotificationData,
+    NotificationServiceInterface,
+)
+
+
+class LazyNotificationService(NotificationServiceInterface):
+    """Builds the real notifier on the first send.
+
+    Keeps smtplib, ssl and the HTTP client out of processes that never book.
+    """
+
+    def __init__(self, factory: Callable[[], NotificationServiceInterface]) -> None:
+        self._factory = factory
+        self._service: Optional[NotificationServiceInterface] = None
+        self._lock = threading.Lock()
+
+    def _get_service(self) -> NotificationServiceInterface:
+        if self._service is None:
+            with self._lock:
+                if self._service is None:
+                    self._service = self._factory()
+        return self._service
+
+    def send_email(self, notification_data: NotificationData) -> bool:
+        return self._get_service().send_email(notification_data)
+
+    def send_sms(self, notification_data: NotificationData) -> bool:
+        return self._get_service().send_sms(notification_data)
@@ -0,0 +1,14 @@
+from ...application.interfaces.notification import (
+    NotificationData,
+    NotificationServiceInterface,
+)
+
+
+class NullNotificationService(NotificationServiceInterface):
+    """Accepts every notification without sending it (benchmarks, tests, replays)."""
+
+    def send_email(self, _notification_data: NotificationData) -> bool:
+        return True
+
+    def send_sms(self, _notification_data: NotificationData) -> bool:
+        return True
@@ -1,5 +1,6 @@
 import hashlib
 import json
+import logging
 import urllib.error
 import urllib.parse
 import urllib.request
@@ -38,33 +39,34 @@ class SMSNotifier(NotificationServiceInterface):
             return self._send_to_console(notification_data)
 
         try:
-            logger.info(f"Sending SMS to {notification_data.recipient_phone}")
-            logger.debug(f"OsonSMS Server: {self._server}")
-            logger.debug(f"Sender: {self._sender}, Login: {self._login}")
+            logger.info("Sending SMS to %s", notification_data.recipient_phone)
+            logger.debug("OsonSMS Server: %s", self._server)
+            logger.debug("Sender: %s, Login: %s", self._sender, self._login)
 
             response = self._send_via_api(notification_data)
 
-            logger.debug(f"OsonSMS Response: {json.dumps(response, ensure_ascii=False)}")
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug("OsonSMS Response: %s", json.dumps(response, ensure_ascii=False))
 
             if response.get("status") == "ok":
                 msg_id = response.get("msg_id", "unknown")
-                logger.info(f"SMS sent successfully. Message ID: {msg_id}")
+                logger.info("SMS sent successfully. Message ID: %s", msg_id)
                 return True
 
             error_msg = response.get("error", {})
-            logger.error(f"OsonSMS error response: {error_msg}")
+            logger.error("OsonSMS error response: %s", error_msg)
             return False
 
         except urllib.error.HTTPError as e:
-            logger.error(f"OsonSMS HTTP error {e.code}: {e.reason}")
+            logger.error("OsonSMS HTTP error %s: %s", e.code, e.reason)
             try:
                 error_body = e.read().decode("utf-8")
-                logger.error(f"Response body: {error_body}")
+                logger.error("Response body: %s", error_body)
             except Exception:
                 pass
 
         except (urllib.error.URLError, json.JSONDecodeError, OSError) as e:
-            logger.error(f"SMS sending error: {type(e).__name__}: {e}")
+            logger.error("SMS sending error: %s: %s", type(e).__name__, e)
 
         return False
 
@@ -72,9 +74,10 @@ class SMSNotifier(NotificationServiceInterface):
         configured = bool(self._login and self._hash_key and self._sender)
         if not configured:
             logger.debug(
-                f"SMS config check - login: {bool(self._login)}, "
-                f"hash: {bool(self._hash_key)}, "
-                f"sender: {bool(self._sender)}"
+                "SMS config check - login: %s, hash: %s, sender: %s",
+                bool(self._login),
+                bool(self._hash_key),
+                bool(self._sender),
             )
         return configured
 
@@ -106,12 +109,12 @@ class SMSNotifier(NotificationServiceInterface):
         }
 
         url = f"{self._server}?{urllib.parse.urlencode(params)}"
-        logger.debug(f"Request URL: {self._server}")
-        logger.debug(f"Request params (without hash): phone={phone}, txn_id={txn_id}")
+        logger.debug("Request URL: %s", self._server)
+        logger.debug("Request params (without hash): phone=%s, txn_id=%s", phone, txn_id)
 
         with urllib.request.urlopen(url, timeout=30) as response:
             data = response.read().decode("utf-8")
-            logger.debug(f"Raw response: {data}")
+            logger.debug("Raw response: %s", data)
             result: dict[str, Any] = json.loads(data)
             return result
 
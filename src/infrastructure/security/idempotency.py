@@ -0,0 +1,73 @@
+import hashlib
+import json
+from dataclasses import dataclass
+from typing import Any, Optional
+
+from config.logging import get_logger
+
+from ...application.interfaces.cache import CacheInterface
+from ...domain.slots import DATACLASS_SLOTS
+
+logger = get_logger(__name__)
+
+MAX_KEY_LENGTH = 255
+
+
+@dataclass(**DATACLASS_SLOTS)
+class StoredResponse:
+    fingerprint: str
+    status: int
+    body: bytes
+
+
+class IdempotencyKeys:
+    """First responses to requests sent with an ``Idempotency-Key``.
+
+    A key is claimed with an atomic increment before the request runs, so a
+    retry arriving while the original is still in flight is told to wait
+    instead of booking twice. The response is then kept for ``ttl_seconds``
+    and replayed to every retry. Entries live in the shared cache and hold
+    across worker processes; when the cache is down, requests simply run.
+    """
+
+    KEY_PREFIX = "idempotency:"
+
+    def __init__(
+        self, cache: CacheInterface, ttl_seconds: int = 86400, claim_seconds: int = 60
+    ) -> None:
+        self._cache = cache
+        self._ttl = ttl_seconds
+        self._claim_ttl = claim_seconds
+
+    @staticmethod
+    def fingerprint(path: str, data: dict[str, Any]) -> str:
+        """Identifies the request a key was first used for, whatever its field order."""
+        canonical = json.dumps([path, data], sort_keys=True, ensure_ascii=False, default=str)
+        return hashlib.sha256(canonical.encode("utf-8")).hexdigest()
+
+    def get(self, key: str) -> Optional[StoredResponse]:
+        stored = self._cache.get(f"{self.KEY_PREFIX}{key}")
+        if not isinstance(stored, dict):
+            return None
+        try:
+            return StoredResponse(
+                fingerprint=stored["fingerprint"],
+                status=int(stored["status"]),
+                body=stored["body"].encode("utf-8"),
+            )
+        except (KeyError, TypeError, ValueError, AttributeError):
+            return None
+
+    def claim(self, key: str) -> bool:
+        """Whether this request may run; False while another holds the key."""
+        count = self._cache.increment(f"{self.KEY_PREFIX}{key}:claim", self._claim_ttl)
+        # 0: the cache is unavailable, which must not block bookings.
+        return count <= 1
+
+    def save(self, key: str, fingerprint: str, status: int, body: bytes) -> None:
+        stored = {"fingerprint": fingerprint, "status": status, "body": body.decode("utf-8")}
+        if not self._cache.set(f"{self.KEY_PREFIX}{key}", stored, self._ttl):
+            logger.warning("Could not store the response for idempotency key %s", key)
+
+    def release(self, key: str) -> None:
+        self._cache.delete(f"{self.KEY_PREFIX}{key}:claim")
@@ -24,7 +24,7 @@ class RateLimiter:
             return True
 
         if count > self._max_requests:
-            logger.warning(f"Rate limit exceeded for IP: {client_ip} ({count} requests)")
+            logger.warning("Rate limit exceeded for IP: %s (%s requests)", client_ip, count)
             return False
 
         return True
@@ -0,0 +1,111 @@
+"""JSON-lines batch mode for the CLI.
+
+Each input line is one command object, for example::
+
+    {"command": "book", "id": "r1", "office_id": 1, "date": "2025-12-03",
+     "start_time": "10:00", "end_time": "12:00",
+     "name": "Farrukh Rahimov", "email": "farrukh@example.tj", "phone": "+992901234567"}
+
+``command`` is ``check-availability``, ``book`` or ``info``; ``id`` is optional
+and echoed back. Every line produces one JSON result line on the output.
+"""
+
+import json
+import time
+from collections.abc import Callable, Iterable
+from dataclasses import dataclass
+from typing import Any, TextIO
+
+from ...domain.slots import DATACLASS_SLOTS
+from ..controllers.reservation_controller import ReservationController
+
+SLOT_FIELDS = ("office_id", "date", "start_time", "end_time")
+REQUIRED_FIELDS: dict[str, tuple[str, ...]] = {
+    "check-availability": SLOT_FIELDS,
+    "book": (*SLOT_FIELDS, "name", "email", "phone"),
+    "info": SLOT_FIELDS,
+}
+OPTIONAL_FIELDS: dict[str, tuple[str, ...]] = {
+    "check-availability": ("seats",),
+    "book": ("seats",),
+    "info": (),
+}
+
+
+class BatchAbortedError(Exception):
+    """A command failed inside a single-transaction batch."""
+
+
+@dataclass(**DATACLASS_SLOTS)
+class BatchSummary:
+    processed: int = 0
+    failed: int = 0
+    elapsed: float = 0.0
+
+    @property
+    def rate(self) -> float:
+        return self.processed / self.elapsed if self.elapsed else 0.0
+
+
+class BatchRunner:
+    def __init__(self, controller: ReservationController, stop_on_failure: bool = False) -> None:
+        self._stop_on_failure = stop_on_failure
+        self._handlers: dict[str, Callable[..., dict]] = {
+            "check-availability": controller.check_office_availability,
+            "book": controller.book_office,
+            "info": controller.get_office_info,
+        }
+
+    def run(self, lines: Iterable[str], output: TextIO) -> BatchSummary:
+        summary = BatchSummary()
+        started = time.perf_counter()
+
+        for line_number, raw_line in enumerate(lines, 1):
+            line = raw_line.strip()
+            if not line or line.startswith("#"):
+                continue
+
+            record = {"line": line_number, **self._execute(line)}
+            output.write(json.dumps(record, ensure_ascii=False) + "\n")
+            output.flush()
+
+            summary.processed += 1
+            if not record["result"].get("success"):
+                summary.failed += 1
+                if self._stop_on_failure:
+                    break
+
+        summary.elapsed = time.perf_counter() - started
+        return summary
+
+    def _execute(self, line: str) -> dict[str, Any]:
+        try:
+            command = json.loads(line)
+        except ValueError:
+            return {"result": {"success": False, "error": "Invalid JSON"}}
+        if not isinstance(command, dict):
+            return {"result": {"success": False, "error": "Expected a JSON object"}}
+
+        record: dict[str, Any] = {"command": command.get("command")}
+        if "id" in command:
+            record["id"] = command["id"]
+
+        name = command.get("command")
+        if not isinstance(name, str) or name not in self._handlers:
+            record["result"] = {"success": False, "error": f"Unknown command: {name}"}
+            return record
+        handler = self._handlers[name]
+
+        missing = [field for field in REQUIRED_FIELDS[name] if field not in command]
+        if missing:
+            record["result"] = {
+                "success": False,
+                "error": f"Missing required fields: {', '.join(missing)}",
+            }
+            return record
+
+        fields = REQUIRED_FIELDS[name] + tuple(
+            field for field in OPTIONAL_FIELDS[name] if field in command
+        )
+        record["result"] = handler(**{field: command[field] for field in fields})
+        return record
@@ -1,15 +1,52 @@
 
 import argparse
-from typing import Optional
+import sys
+from collections.abc import Callable
+from contextlib import AbstractContextManager, nullcontext
+from pathlib import Path
+from typing import TYPE_CHECKING, Optional, TextIO
 
 from ..controllers.reservation_controller import ReservationController
+from .batch import BatchAbortedError, BatchRunner
+
+if TYPE_CHECKING:
+    from ...infrastructure.database.archival import ReservationSweeper
+
+# Called with ``transaction=`` and ``notify=`` keywords; yields a controller
+# bound to one session for the whole batch.
+BatchControllerFactory = Callable[..., AbstractContextManager[ReservationController]]
+# Called with ``retention_days=``, ``batch_size=`` and ``pause_seconds=``
+# overrides; ``None`` keeps the configured value.
+SweeperFactory = Callable[..., "ReservationSweeper"]
+# Rebuilds the availability index for one office (or all with ``None``) and
+# returns how many offices it rebuilt.
+AvailabilityRebuilder = Callable[[Optional[int]], int]
 
 
 class CLI:
-    def __init__(self, controller: ReservationController) -> None:
-        self._controller = controller
+    def __init__(
+        self,
+        controller_factory: Callable[[], ReservationController],
+        batch_controller_factory: Optional[BatchControllerFactory] = None,
+        sweeper_factory: Optional[SweeperFactory] = None,
+        availability_rebuilder: Optional[AvailabilityRebuilder] = None,
+    ) -> None:
+        # The controller (and with it the database and cache) is only built
+        # once a command actually needs it, so --help and argument errors
+        # return without touching any infrastructure.
+        self._controller_factory = controller_factory
+        self._batch_controller_factory = batch_controller_factory
+        self._sweeper_factory = sweeper_factory
+        self._availability_rebuilder = availability_rebuilder
+        self._controller: Optional[ReservationController] = None
         self._parser = self._create_parser()
 
+    @property
+    def controller(self) -> ReservationController:
+        if self._controller is None:
+            self._controller = self._controller_factory()
+        return self._controller
+
     def _create_parser(self) -> argparse.ArgumentParser:
         parser = argparse.ArgumentParser(
             description="Office Reservation System",
@@ -20,6 +57,9 @@ Examples:
   python main.py book --office-id 1 --date 2025-12-03 --start-time 10:00 --end-time 12:00 \\
       --name "Farrukh Rahimov" --email "farrukh@example.tj" --phone "+992901234567"
   python main.py info --office-id 1 --date 2025-12-03 --start-time 10:00 --end-time 12:00
+  python main.py batch --file commands.jsonl --transaction > results.jsonl
+  python main.py sweep --retention-days 30
+  python main.py rebuild-availability
             """,
         )
 
@@ -29,9 +69,11 @@ Examples:
             "check-availability", help="Check if an office is available"
         )
         self._add_common_args(check_parser)
+        self._add_seats_arg(check_parser)
 
         book_parser = subparsers.add_parser("book", help="Book an office")
         self._add_common_args(book_parser)
+        self._add_seats_arg(book_parser)
         book_parser.add_argument("--name", required=True, help="Your name")
         book_parser.add_argument("--email", required=True, help="Your email address")
         book_parser.add_argument(
@@ -43,17 +85,60 @@ Examples:
         info_parser = subparsers.add_parser("info", help="Get information about office occupancy")
         self._add_common_args(info_parser)
 
+        batch_parser = subparsers.add_parser(
+            "batch", help="Run JSON-lines commands over one database session"
+        )
+        batch_parser.add_argument(
+            "--file", default="-", help="JSON-lines input file (default: stdin)"
+        )
+        batch_parser.add_argument(
+            "--transaction",
+            action="store_true",
+            help="Run everything in one transaction; the first failure rolls it all back",
+        )
+        batch_parser.add_argument(
+            "--no-notify",
+            action="store_true",
+            help="Do not send email/SMS notifications (replays)",
+        )
+
+        sweep_parser = subparsers.add_parser(
+            "sweep", help="Complete past reservations and archive old finished ones"
+        )
+        sweep_parser.add_argument(
+            "--retention-days",
+            type=int,
+            help="Archive completed/cancelled reservations older than this (default: config)",
+        )
+        sweep_parser.add_argument(
+            "--batch-size", type=int, help="Rows per transaction (default: config)"
+        )
+        sweep_parser.add_argument(
+            "--pause", type=float, help="Seconds to sleep between batches (default: config)"
+        )
+
+        rebuild_parser = subparsers.add_parser(
+            "rebuild-availability", help="Reload the availability index from the database"
+        )
+        rebuild_parser.add_argument(
+            "--office-id", type=int, help="Only this office (default: all offices)"
+        )
+
         return parser
 
     @staticmethod
     def _add_common_args(parser: argparse.ArgumentParser) -> None:
-        parser.add_argument(
-            "--office-id", type=int, required=True, choices=[1, 2, 3, 4, 5], help="Office ID (1-5)"
-        )
+        parser.add_argument("--office-id", type=int, required=True, help="Office ID")
         parser.add_argument("--date", required=True, help="Date (YYYY-MM-DD)")
         parser.add_argument("--start-time", required=True, help="Start time (HH:MM)")
         parser.add_argument("--end-time", required=True, help="End time (HH:MM)")
 
+    @staticmethod
+    def _add_seats_arg(parser: argparse.ArgumentParser) -> None:
+        parser.add_argument(
+            "--seats", type=int, help="Seats in a shared office (default: the whole office)"
+        )
+
     def run(self, args: Optional[list[str]] = None) -> int:
         parsed_args = self._parser.parse_args(args)
 
@@ -61,21 +146,27 @@ Examples:
             self._parser.print_help()
             return 1
 
-        if parsed_args.command == "check-availability":
-            return self._handle_check_availability(parsed_args)
-        if parsed_args.command == "book":
-            return self._handle_book(parsed_args)
-        if parsed_args.command == "info":
-            return self._handle_info(parsed_args)
-        print(f"Unknown command: {parsed_args.command}")
-        return 1
+        handlers = {
+            "check-availability": self._handle_check_availability,
+            "book": self._handle_book,
+            "info": self._handle_info,
+            "batch": self._handle_batch,
+            "sweep": self._handle_sweep,
+            "rebuild-availability": self._handle_rebuild_availability,
+        }
+        handler = handlers.get(parsed_args.command)
+        if handler is None:
+            print(f"Unknown command: {parsed_args.command}")
+            return 1
+        return handler(parsed_args)
 
     def _handle_check_availability(self, args: argparse.Namespace) -> int:
-        result = self._controller.check_office_availability(
+        result = self.controller.check_office_availability(
             office_id=args.office_id,
             date=args.date,
             start_time=args.start_time,
             end_time=args.end_time,
+            seats=args.seats,
         )
 
         if not result["success"]:
@@ -102,7 +193,7 @@ Examples:
         return 0
 
     def _handle_book(self, args: argparse.Namespace) -> int:
-        result = self._controller.book_office(
+        result = self.controller.book_office(
             office_id=args.office_id,
             date=args.date,
             start_time=args.start_time,
@@ -110,6 +201,7 @@ Examples:
             name=args.name,
             email=args.email,
             phone=args.phone,
+            seats=args.seats,
         )
 
         if not result["success"]:
@@ -124,7 +216,7 @@ Examples:
         return 0
 
     def _handle_info(self, args: argparse.Namespace) -> int:
-        result = self._controller.get_office_info(
+        result = self.controller.get_office_info(
             office_id=args.office_id,
             date=args.date,
             start_time=args.start_time,
@@ -153,3 +245,66 @@ Examples:
 
         print("=" * 70 + "\n")
         return 0
+
+    @staticmethod
+    def _open_input(path: str) -> AbstractContextManager[TextIO]:
+        if path == "-":
+            return nullcontext(sys.stdin)
+        return Path(path).open(encoding="utf-8")
+
+    def _handle_batch(self, args: argparse.Namespace) -> int:
+        if self._batch_controller_factory is None:
+            print("Error: batch mode is not available")
+            return 1
+
+        try:
+            with self._open_input(args.file) as stream, self._batch_controller_factory(
+                transaction=args.transaction, notify=not args.no_notify
+            ) as controller:
+                summary = BatchRunner(controller, stop_on_failure=args.transaction).run(
+                    stream, sys.stdout
+                )
+                if args.transaction and summary.failed:
+                    # Leaving the block with an exception rolls the transaction back.
+                    raise BatchAbortedError
+        except BatchAbortedError:
+            pass
+
+        rolled_back = args.transaction and summary.failed > 0
+        print(
+            f"{summary.processed} commands, {summary.failed} failed in "
+            f"{summary.elapsed:.2f}s ({summary.rate:.0f}/s)"
+            + ("; transaction rolled back" if rolled_back else ""),
+            file=sys.stderr,
+        )
+        return 1 if summary.failed else 0
+
+    def _handle_sweep(self, args: argparse.Namespace) -> int:
+        if self._sweeper_factory is None:
+            print("Error: sweeping is not available")
+            return 1
+
+        sweeper = self._sweeper_factory(
+            retention_days=args.retention_days,
+            batch_size=args.batch_size,
+            pause_seconds=args.pause,
+        )
+        result = sweeper.sweep()
+        print(
+            f"Completed {result.completed} and archived {result.archived} "
+            f"reservations in {result.elapsed:.2f}s"
+        )
+        return 0
+
+    def _handle_rebuild_availability(self, args: argparse.Namespace) -> int:
+        if self._availability_rebuilder is None:
+            print("Error: the availability index is not available")
+            return 1
+
+        try:
+            rebuilt = self._availability_rebuilder(args.office_id)
+        except ValueError as e:
+            print(f"Error: {e}")
+            return 1
+        print(f"Rebuilt the availability index for {rebuilt} office(s)")
+        return 0
@@ -1,25 +1,100 @@
-from datetime import datetime
+from datetime import date, datetime, timedelta
+from typing import Optional
 
 from ...application.use_cases.check_availability import CheckAvailabilityUseCase
 from ...application.use_cases.create_reservation import CreateReservationUseCase
+from ...application.use_cases.create_reservation_series import (
+    CreateReservationSeriesUseCase,
+)
 from ...application.use_cases.get_reservation_info import GetReservationInfoUseCase
+from ...application.use_cases.get_utilization import GetUtilizationUseCase
+from ...application.use_cases.override_occurrence import OverrideOccurrenceUseCase
+from ...domain.entities.reservation_series import Recurrence
 from ...domain.exceptions.domain_exceptions import (
     OfficeNotFoundError,
     ReservationConflictError,
+    ReservationSeriesNotFoundError,
 )
+from ...domain.time_format import parse_date_time
+from ...domain.utilization import Granularity
 from ...domain.value_objects.time_slot import TimeSlot
+from .serializers import build_serializer
+
+_OFFICE_SUMMARY = build_serializer(
+    {
+        "office_id": "office_id",
+        "office_name": "office_name",
+        "capacity": "capacity",
+        "peak_occupancy": "peak_occupancy",
+    }
+)
+_CONFLICT = build_serializer(
+    {"user": "user_name", "email": "user_email", "phone": "user_phone", "until": "end_time"}
+)
+_BOOKING = build_serializer(
+    {
+        "reservation_id": "reservation_id",
+        "office_id": "office_id",
+        "office_name": "office_name",
+        "start_time": "start_time",
+        "end_time": "end_time",
+        "seats": "seats",
+    }
+)
+_SERIES = build_serializer(
+    {
+        "series_id": "series_id",
+        "office_id": "office_id",
+        "office_name": "office_name",
+        "recurrence": "recurrence",
+        "interval": "interval",
+        "first_start_time": "first_start_time",
+        "first_end_time": "first_end_time",
+        "last_end_time": "last_end_time",
+        "until": "until",
+        "count": "count",
+        "occurrences": "occurrence_count",
+        "exceptions": "exceptions",
+        "seats": "seats",
+    }
+)
+_UTILIZATION_BUCKET = build_serializer(
+    {
+        "start_time": "start_time",
+        "occupied_hours": "occupied_hours",
+        "utilization": "utilization",
+    }
+)
+_OCCUPANCY = build_serializer(
+    {
+        "office_id": "office_id",
+        "office_name": "office_name",
+        "occupied_by": "occupied_by",
+        "occupant_email": "occupant_email",
+        "occupant_phone": "occupant_phone",
+        "from_time": "from_time",
+        "until_time": "until_time",
+    }
+)
 
 
 class ReservationController:
-    def __init__(
+    def __init__(  # noqa: PLR0913
         self,
+        *,
         check_availability_use_case: CheckAvailabilityUseCase,
         create_reservation_use_case: CreateReservationUseCase,
         get_reservation_info_use_case: GetReservationInfoUseCase,
+        create_series_use_case: CreateReservationSeriesUseCase,
+        override_occurrence_use_case: OverrideOccurrenceUseCase,
+        get_utilization_use_case: GetUtilizationUseCase,
     ) -> None:
         self._check_availability = check_availability_use_case
         self._create_reservation = create_reservation_use_case
         self._get_info = get_reservation_info_use_case
+        self._create_series = create_series_use_case
+        self._override_occurrence = override_occurrence_use_case
+        self._get_utilization = get_utilization_use_case
 
     def check_office_availability(
         self,
@@ -27,43 +102,35 @@ class ReservationController:
         date: str,
         start_time: str,
         end_time: str,
+        *,
+        seats: Optional[int] = None,
     ) -> dict:
         try:
             time_slot = self._parse_time_slot(date, start_time, end_time)
-            result = self._check_availability.execute(office_id, time_slot)
+            result = self._check_availability.execute(
+                office_id, time_slot, self._parse_positive(seats, "seats")
+            )
 
             if result.is_available:
                 return {
                     "success": True,
                     "available": True,
                     "message": result.message,
-                    "data": {
-                        "office_id": result.office_id,
-                        "office_name": result.office_name,
-                    },
+                    "data": _OFFICE_SUMMARY(result),
                 }
-            conflicts_info = []
-            for conflict in result.conflicting_reservations:
-                conflicts_info.append(
-                    {
-                        "user": conflict.user_name,
-                        "email": conflict.user_email,
-                        "phone": conflict.user_phone,
-                        "until": conflict.end_time,
-                    }
-                )
 
             return {
                 "success": True,
                 "available": False,
                 "message": result.message,
-                "conflicts": conflicts_info,
+                "data": _OFFICE_SUMMARY(result),
+                "conflicts": [_CONFLICT(conflict) for conflict in result.conflicting_reservations],
             }
 
         except OfficeNotFoundError:
             return {
                 "success": False,
-                "error": f"Office {office_id} not found. Please use office ID 1-5.",
+                "error": f"Office {office_id} not found. See GET /api/offices for the catalog.",
             }
         except ValueError as e:
             return {
@@ -85,6 +152,8 @@ class ReservationController:
         name: str,
         email: str,
         phone: str,
+        *,
+        seats: Optional[int] = None,
     ) -> dict:
         try:
             time_slot = self._parse_time_slot(date, start_time, end_time)
@@ -94,6 +163,7 @@ class ReservationController:
                 user_email=email,
                 user_phone=phone,
                 time_slot=time_slot,
+                seats=self._parse_positive(seats, "seats"),
             )
 
             return {
@@ -105,13 +175,7 @@ class ReservationController:
                     f"   Reservation ID: {result.reservation_id}\n"
                     f"   Notifications sent to {result.user_email} and {result.user_phone}"
                 ),
-                "data": {
-                    "reservation_id": result.reservation_id,
-                    "office_id": result.office_id,
-                    "office_name": result.office_name,
-                    "start_time": result.start_time,
-                    "end_time": result.end_time,
-                },
+                "data": _BOOKING(result),
             }
 
         except ReservationConflictError as e:
@@ -126,8 +190,121 @@ class ReservationController:
         except OfficeNotFoundError:
             return {
                 "success": False,
-                "error": f"[ERROR] Office {office_id} not found. Please use office ID 1-5.",
+                "error": f"[ERROR] Office {office_id} not found. See GET /api/offices for the catalog.",
+            }
+        except ValueError as e:
+            return {
+                "success": False,
+                "error": f"[ERROR] Invalid input: {e!s}",
+            }
+        except Exception as e:
+            return {
+                "success": False,
+                "error": f"[ERROR] Unexpected error: {e!s}",
+            }
+
+    def book_series(  # noqa: PLR0913
+        self,
+        *,
+        office_id: int,
+        date: str,
+        start_time: str,
+        end_time: str,
+        name: str,
+        email: str,
+        phone: str,
+        recurrence: str,
+        interval: int = 1,
+        until: Optional[str] = None,
+        count: Optional[int] = None,
+        exceptions: Optional[list[str]] = None,
+        seats: Optional[int] = None,
+    ) -> dict:
+        try:
+            result = self._create_series.execute(
+                office_id=office_id,
+                user_name=name,
+                user_email=email,
+                user_phone=phone,
+                first_slot=self._parse_time_slot(date, start_time, end_time),
+                recurrence=Recurrence(recurrence),
+                interval=self._parse_positive(interval, "interval") or 1,
+                until=self._parse_date(until) if until is not None else None,
+                count=self._parse_positive(count, "count"),
+                exceptions=[self._parse_date(day) for day in exceptions or ()],
+                seats=self._parse_positive(seats, "seats"),
+            )
+
+            return {
+                "success": True,
+                "message": (
+                    f"[SUCCESS] Booked {result.office_name} (Office #{result.office_id}) "
+                    f"{result.recurrence} from {result.first_start_time}: "
+                    f"{result.occurrence_count} occurrence(s), series ID {result.series_id}"
+                ),
+                "data": _SERIES(result),
+            }
+
+        except ReservationConflictError as e:
+            return {
+                "success": False,
+                "error": (
+                    f"[ERROR] {e.message}\n"
+                    f"   Contact: {e.details.get('conflicting_email')}, "
+                    f"{e.details.get('conflicting_phone')}"
+                ),
+            }
+        except OfficeNotFoundError:
+            return {
+                "success": False,
+                "error": f"[ERROR] Office {office_id} not found. See GET /api/offices for the catalog.",
+            }
+        except ValueError as e:
+            return {
+                "success": False,
+                "error": f"[ERROR] Invalid input: {e!s}",
+            }
+        except Exception as e:
+            return {
+                "success": False,
+                "error": f"[ERROR] Unexpected error: {e!s}",
+            }
+
+    def override_occurrence(
+        self,
+        *,
+        series_id: int,
+        date: str,
+        start_time: Optional[str] = None,
+        end_time: Optional[str] = None,
+    ) -> dict:
+        """Move the occurrence on ``date`` to new times, or cancel it without them."""
+        try:
+            day = self._parse_date(date)
+            time_slot = None
+            if start_time is not None or end_time is not None:
+                time_slot = self._parse_time_slot(date, start_time or "", end_time or "")
+            result = self._override_occurrence.execute(series_id, day, time_slot)
+
+            if result is None:
+                return {
+                    "success": True,
+                    "message": f"Occurrence on {day.isoformat()} of series {series_id} cancelled",
+                }
+            return {
+                "success": True,
+                "message": (
+                    f"Occurrence on {day.isoformat()} of series {series_id} moved to "
+                    f"{result.start_time} - {result.end_time}, reservation ID "
+                    f"{result.reservation_id}"
+                ),
+                "data": _BOOKING(result),
             }
+
+        except ReservationConflictError as e:
+            return {"success": False, "error": f"[ERROR] {e.message}"}
+        except ReservationSeriesNotFoundError as e:
+            return {"success": False, "error": f"[ERROR] {e.message}"}
         except ValueError as e:
             return {
                 "success": False,
@@ -155,15 +332,7 @@ class ReservationController:
                     "success": True,
                     "occupied": True,
                     "message": result.message,
-                    "data": {
-                        "office_id": result.office_id,
-                        "office_name": result.office_name,
-                        "occupied_by": result.occupied_by,
-                        "occupant_email": result.occupant_email,
-                        "occupant_phone": result.occupant_phone,
-                        "from_time": result.from_time,
-                        "until_time": result.until_time,
-                    },
+                    "data": _OCCUPANCY(result),
                 }
             return {
                 "success": True,
@@ -174,7 +343,7 @@ class ReservationController:
         except OfficeNotFoundError:
             return {
                 "success": False,
-                "error": f"Office {office_id} not found. Please use office ID 1-5.",
+                "error": f"Office {office_id} not found. See GET /api/offices for the catalog.",
             }
         except ValueError as e:
             return {
@@ -187,11 +356,82 @@ class ReservationController:
                 "error": f"Unexpected error: {e!s}",
             }
 
+    def get_utilization(
+        self,
+        office_id: int,
+        start: str,
+        end: str,
+        granularity: str = "day",
+        bucket_minutes: Optional[int] = None,
+    ) -> dict:
+        """Utilization from ``start`` to ``end`` (YYYY-MM-DD or YYYY-MM-DDTHH:MM)."""
+        try:
+            minutes = self._parse_positive(bucket_minutes, "bucket_minutes")
+            result = self._get_utilization.execute(
+                office_id,
+                self._parse_moment(start),
+                self._parse_moment(end),
+                Granularity(granularity),
+                timedelta(minutes=minutes) if minutes else None,
+            )
+
+            return {
+                "success": True,
+                "data": {
+                    "office_id": result.office_id,
+                    "office_name": result.office_name,
+                    "start_time": result.start_time,
+                    "end_time": result.end_time,
+                    "bucket": result.bucket,
+                    "source": result.source,
+                    "utilization": result.utilization,
+                    "buckets": [_UTILIZATION_BUCKET(bucket) for bucket in result.buckets],
+                },
+            }
+
+        except OfficeNotFoundError:
+            return {
+                "success": False,
+                "error": f"Office {office_id} not found. See GET /api/offices for the catalog.",
+            }
+        except ValueError as e:
+            return {
+                "success": False,
+                "error": f"Invalid input: {e!s}",
+            }
+        except Exception as e:
+            return {
+                "success": False,
+                "error": f"Unexpected error: {e!s}",
+            }
+
+    @staticmethod
+    def _parse_moment(value: str) -> datetime:
+        try:
+            return datetime.fromisoformat(value)
+        except (TypeError, ValueError) as e:
+            raise ValueError(f"Invalid time {value!r}. Use YYYY-MM-DD or YYYY-MM-DDTHH:MM") from e
+
+    @staticmethod
+    def _parse_positive(value: object, name: str) -> Optional[int]:
+        if value is None:
+            return None
+        if isinstance(value, bool) or not isinstance(value, int) or value < 1:
+            raise ValueError(f"{name} must be a positive integer")
+        return value
+
+    @staticmethod
+    def _parse_date(value: str) -> date:
+        try:
+            return date.fromisoformat(value)
+        except (TypeError, ValueError) as e:
+            raise ValueError(f"Invalid date {value!r}. Use YYYY-MM-DD") from e
+
     @staticmethod
     def _parse_time_slot(date: str, start_time: str, end_time: str) -> TimeSlot:
         try:
-            start_datetime = datetime.strptime(f"{date} {start_time}", "%Y-%m-%d %H:%M")
-            end_datetime = datetime.strptime(f"{date} {end_time}", "%Y-%m-%d %H:%M")
+            start_datetime = parse_date_time(date, start_time)
+            end_datetime = parse_date_time(date, end_time)
 
             return TimeSlot(start_time=start_datetime, end_time=end_datetime)
 
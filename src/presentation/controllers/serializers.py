@@ -0,0 +1,17 @@
+from collections.abc import Callable, Mapping
+from operator import attrgetter
+from typing import Any
+
+
+def build_serializer(fields: Mapping[str, str]) -> Callable[[Any], dict]:
+    """Compile a DTO-to-dict converter once for a fixed key -> attribute mapping."""
+    keys = tuple(fields)
+    attributes = tuple(fields.values())
+
+    if len(attributes) == 1:
+        key = keys[0]
+        single_getter = attrgetter(attributes[0])
+        return lambda obj: {key: single_getter(obj)}
+
+    getter = attrgetter(*attributes)
+    return lambda obj: dict(zip(keys, getter(obj)))
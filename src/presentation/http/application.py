@@ -0,0 +1,588 @@
+"""Server-independent request handling for the HTTP API.
+
+``Application.handle`` maps a plain ``Request`` to a ``Response``. The stdlib
+server, the WSGI adapter and the ASGI adapter only translate between their
+own request format and these two types, so routing, rate limiting, metrics
+and profiling behave the same behind every server.
+"""
+
+import hmac
+import time
+from collections.abc import Callable
+from dataclasses import dataclass, field
+from http import HTTPStatus
+from pathlib import Path
+from typing import Any, Optional
+from urllib.parse import parse_qs
+
+from config.logging import get_logger
+from config.settings import settings
+from src.application.interfaces.repository import OfficeRepositoryInterface
+from src.domain.slots import DATACLASS_SLOTS
+from src.infrastructure.database.replicas import ReadYourWritesPins, reads_from_primary
+from src.infrastructure.monitoring.metrics import (
+    DB_QUERIES_PER_REQUEST,
+    HTTP_REQUEST_DURATION,
+    HTTP_REQUESTS,
+    HTTP_REQUESTS_IN_FLIGHT,
+    RATE_LIMIT_REJECTIONS,
+    registry,
+)
+from src.infrastructure.monitoring.profiling import MemorySnapshots, RequestProfiler
+from src.infrastructure.monitoring.query_tracking import track_queries
+from src.infrastructure.security.idempotency import MAX_KEY_LENGTH, IdempotencyKeys
+from src.infrastructure.security.rate_limiter import RateLimiter
+from src.presentation.controllers.reservation_controller import ReservationController
+from src.presentation.http.codec import JSONCodec, create_codec
+
+logger = get_logger(__name__)
+
+ADMIN_TOKEN_HEADER = "X-Admin-Token"
+PROFILE_HEADER = "X-Profile"
+IDEMPOTENCY_KEY_HEADER = "Idempotency-Key"
+IDEMPOTENT_REPLAY_HEADER = "Idempotent-Replayed"
+
+# POST routes whose responses are replayed to retries with the same key.
+IDEMPOTENT_ROUTES = frozenset({"/api/reservations"})
+
+# POST routes that write bookings; a client that succeeded on one reads
+# from the primary for a while after.
+WRITE_ROUTES = frozenset(
+    {
+        "/api/reservations",
+        "/api/reservations/series",
+        "/api/reservations/series/occurrence",
+    }
+)
+
+JSON_CONTENT_TYPE = "application/json"
+TEXT_CONTENT_TYPE = "text/plain; charset=utf-8"
+METRICS_CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+OPENAPI_SPEC_PATH = Path(__file__).parent / "openapi.json"
+
+DEFAULT_PAGE_SIZE = 50
+MAX_PAGE_SIZE = 200
+
+KNOWN_ROUTES = frozenset(
+    {
+        "/",
+        "/docs",
+        "/docs/",
+        "/openapi.json",
+        "/metrics",
+        "/health/live",
+        "/health/ready",
+        "/api/offices",
+        "/api/offices/availability",
+        "/api/offices/info",
+        "/api/analytics/utilization",
+        "/api/reservations",
+        "/api/reservations/series",
+        "/api/reservations/series/occurrence",
+        "/admin/profile",
+        "/admin/memory/snapshot",
+        "/admin/memory/stop",
+    }
+)
+
+SWAGGER_UI_HTML = """
+<!DOCTYPE html>
+<html>
+<head>
+    <meta charset="UTF-8">
+    <title>Office Reservation API - Swagger UI</title>
+    <link rel="stylesheet" type="text/css" href="https://unpkg.com/swagger-ui-dist@5.10.3/swagger-ui.css">
+</head>
+<body>
+    <div id="swagger-ui"></div>
+    <script src="https://unpkg.com/swagger-ui-dist@5.10.3/swagger-ui-bundle.js"></script>
+    <script src="https://unpkg.com/swagger-ui-dist@5.10.3/swagger-ui-standalone-preset.js"></script>
+    <script>
+        window.onload = function() {
+            SwaggerUIBundle({
+                url: "/openapi.json",
+                dom_id: '#swagger-ui',
+                deepLinking: true,
+                presets: [
+                    SwaggerUIBundle.presets.apis,
+                    SwaggerUIStandalonePreset
+                ],
+                layout: "StandaloneLayout"
+            });
+        };
+    </script>
+</body>
+</html>
+"""
+
+
+@dataclass(**DATACLASS_SLOTS)
+class Request:
+    method: str
+    path: str
+    query_string: str = ""
+    # Header names are lower-cased by the adapters.
+    headers: dict[str, str] = field(default_factory=dict)
+    body: bytes = b""
+    client_ip: str = ""
+
+    def header(self, name: str, default: str = "") -> str:
+        return self.headers.get(name.lower(), default)
+
+    @property
+    def query(self) -> dict[str, list[str]]:
+        return parse_qs(self.query_string)
+
+
+@dataclass(**DATACLASS_SLOTS)
+class Response:
+    status: int
+    body: bytes = b""
+    content_type: str = JSON_CONTENT_TYPE
+    headers: list[tuple[str, str]] = field(default_factory=list)
+
+    @property
+    def reason(self) -> str:
+        try:
+            return HTTPStatus(self.status).phrase
+        except ValueError:
+            return ""
+
+    def header_items(self) -> list[tuple[str, str]]:
+        return [
+            ("Content-Type", self.content_type),
+            ("Content-Length", str(len(self.body))),
+            *self.headers,
+        ]
+
+
+class Application:
+    def __init__(  # noqa: PLR0913
+        self,
+        reservation_controller: ReservationController,
+        office_repository: OfficeRepositoryInterface,
+        *,
+        rate_limiter: Optional[RateLimiter] = None,
+        codec: Optional[JSONCodec] = None,
+        profiler: Optional[RequestProfiler] = None,
+        memory_snapshots: Optional[MemorySnapshots] = None,
+        read_your_writes: Optional[ReadYourWritesPins] = None,
+        idempotency: Optional[IdempotencyKeys] = None,
+    ) -> None:
+        self.reservation_controller = reservation_controller
+        self.office_repository = office_repository
+        self.rate_limiter = rate_limiter
+        self.codec = codec or create_codec(settings.json_codec)
+        self.profiler = profiler or RequestProfiler(sample_rate=settings.profile_sample_rate)
+        self.memory_snapshots = memory_snapshots or MemorySnapshots()
+        self.read_your_writes = read_your_writes
+        self.idempotency = idempotency
+        self._ready = False
+        self._draining = False
+
+    @property
+    def ready(self) -> bool:
+        return self._ready and not self._draining
+
+    def warm_up(self) -> int:
+        """Load every office into its own cache entry."""
+        return len(self.office_repository.find_all())
+
+    def mark_ready(self) -> None:
+        self._ready = True
+
+    def start_draining(self) -> None:
+        self._draining = True
+
+    def handle(self, request: Request) -> Response:
+        # Unknown paths share one label so scanners cannot blow up cardinality.
+        route = request.path if request.path in KNOWN_ROUTES else "other"
+        status = 0
+
+        HTTP_REQUESTS_IN_FLIGHT.inc()
+        started = time.perf_counter()
+        with track_queries() as stats:
+            try:
+                forced = bool(request.header(PROFILE_HEADER)) and self._is_admin(request)
+                if self.profiler.should_profile(forced):
+                    response = self.profiler.run(lambda: self._route_with_pins(request))
+                else:
+                    response = self._route_with_pins(request)
+                status = response.status
+            finally:
+                elapsed = time.perf_counter() - started
+                HTTP_REQUESTS_IN_FLIGHT.dec()
+                HTTP_REQUEST_DURATION.observe(elapsed, method=request.method, route=route)
+                HTTP_REQUESTS.inc(method=request.method, route=route, status=str(status))
+                DB_QUERIES_PER_REQUEST.observe(stats.count, route=route)
+                logger.debug(
+                    "%s %s %s in %.1f ms (%s queries, %.1f ms in DB)",
+                    request.method,
+                    request.path,
+                    status,
+                    elapsed * 1000,
+                    stats.count,
+                    stats.total_time_ms,
+                )
+
+        response.headers.append(
+            ("Server-Timing", f'db;dur={stats.total_time_ms:.2f};desc="{stats.count} queries"')
+        )
+        return response
+
+    def _route_with_pins(self, request: Request) -> Response:
+        pins = self.read_your_writes
+        if pins is None:
+            return self._route(request)
+
+        # A client that just booked reads its own write from the primary.
+        with reads_from_primary(pins.is_pinned(request.client_ip)):
+            response = self._route(request)
+        if (
+            request.method == "POST"
+            and request.path in WRITE_ROUTES
+            and HTTPStatus.OK <= response.status < HTTPStatus.MULTIPLE_CHOICES
+        ):
+            pins.pin(request.client_ip)
+        return response
+
+    def _route(self, request: Request) -> Response:
+        if request.method == "GET":
+            return self._handle_get(request)
+        if request.method == "POST":
+            return self._handle_post(request)
+        return self.json_response(405, {"error": "Method not allowed"})
+
+    def _handle_get(self, request: Request) -> Response:  # noqa: PLR0911
+        path = request.path
+        if path == "/metrics":
+            return Response(200, registry.render().encode("utf-8"), METRICS_CONTENT_TYPE)
+
+        if path == "/health/live":
+            return self.json_response(200, {"status": "alive"})
+        if path == "/health/ready":
+            if self.ready:
+                return self.json_response(200, {"status": "ready"})
+            status = "draining" if self._draining else "starting"
+            return self.json_response(503, {"status": status})
+
+        # Admin paths count too, so the token cannot be guessed at full speed.
+        rejection = self._check_rate_limit(request)
+        if rejection is not None:
+            return rejection
+
+        if path.startswith("/admin/"):
+            return self.handle_admin(request, {})
+        if path == "/":
+            return self.json_response(
+                200, {"status": "ok", "message": "Office Reservation API", "swagger": "/docs"}
+            )
+        if path in {"/docs", "/docs/"}:
+            return Response(200, SWAGGER_UI_HTML.encode("utf-8"), "text/html; charset=utf-8")
+        if path == "/openapi.json":
+            return Response(200, OPENAPI_SPEC_PATH.read_bytes())
+        if path == "/api/offices":
+            return self.handle_list_offices(request)
+        if path == "/api/analytics/utilization":
+            return self.handle_utilization(request)
+        return self.json_response(404, {"error": "Not found"})
+
+    def _handle_post(self, request: Request) -> Response:
+        path = request.path
+        rejection = self._check_rate_limit(request)
+        if rejection is not None:
+            return rejection
+
+        try:
+            data = self.codec.decode(request.body) if request.body else {}
+        except ValueError:
+            return self.json_response(400, {"error": "Invalid JSON"})
+
+        if path.startswith("/admin/"):
+            return self.handle_admin(request, data)
+
+        handler: Optional[Callable[[dict[str, Any]], Response]] = {
+            "/api/offices/availability": self.handle_check_availability,
+            "/api/reservations": self.handle_create_reservation,
+            "/api/reservations/series": self.handle_create_series,
+            "/api/reservations/series/occurrence": self.handle_override_occurrence,
+            "/api/offices/info": self.handle_get_office_info,
+        }.get(path)
+        if handler is None:
+            return self.json_response(404, {"error": "Not found"})
+
+        key = request.header(IDEMPOTENCY_KEY_HEADER)
+        idempotency = self.idempotency
+        if key and idempotency is not None and path in IDEMPOTENT_ROUTES:
+            fingerprint = idempotency.fingerprint(path, data)
+            return self._handle_idempotent(idempotency, key, fingerprint, lambda: handler(data))
+        return handler(data)
+
+    def _handle_idempotent(
+        self,
+        idempotency: IdempotencyKeys,
+        key: str,
+        fingerprint: str,
+        handle: Callable[[], Response],
+    ) -> Response:
+        # Retries get the first response back without the booking running
+        # again: no conflict query against their own reservation, no second
+        # email or SMS.
+        if len(key) > MAX_KEY_LENGTH:
+            return self.json_response(
+                400, {"error": f"{IDEMPOTENCY_KEY_HEADER} is longer than {MAX_KEY_LENGTH}"}
+            )
+
+        stored = idempotency.get(key)
+        if stored is None and not idempotency.claim(key):
+            # Another copy is running; it may have finished meanwhile.
+            stored = idempotency.get(key)
+            if stored is None:
+                response = self.json_response(
+                    409,
+                    {"error": f"A request with this {IDEMPOTENCY_KEY_HEADER} is in progress"},
+                )
+                response.headers.append(("Retry-After", str(settings.http_retry_after)))
+                return response
+
+        if stored is not None:
+            if stored.fingerprint != fingerprint:
+                return self.json_response(
+                    422,
+                    {"error": f"{IDEMPOTENCY_KEY_HEADER} was used for a different request"},
+                )
+            return Response(
+                stored.status, stored.body, headers=[(IDEMPOTENT_REPLAY_HEADER, "true")]
+            )
+
+        try:
+            response = handle()
+        except BaseException:
+            idempotency.release(key)
+            raise
+        if response.status < HTTPStatus.INTERNAL_SERVER_ERROR:
+            idempotency.save(key, fingerprint, response.status, response.body)
+        else:
+            idempotency.release(key)
+        return response
+
+    def _check_rate_limit(self, request: Request) -> Optional[Response]:
+        if not self.rate_limiter or self.rate_limiter.is_allowed(request.client_ip):
+            return None
+
+        RATE_LIMIT_REJECTIONS.inc()
+        return self.json_response(
+            429,
+            {
+                "error": "Too Many Requests",
+                "message": f"Rate limit exceeded. Try again in {settings.rate_limit_window} seconds.",
+            },
+        )
+
+    def _is_admin(self, request: Request) -> bool:
+        if not settings.admin_token:
+            return False
+        token = request.header(ADMIN_TOKEN_HEADER)
+        return hmac.compare_digest(token.encode("utf-8"), settings.admin_token.encode("utf-8"))
+
+    def handle_admin(self, request: Request, data: Any) -> Response:  # noqa: PLR0911
+        if not settings.admin_token:
+            return self.json_response(404, {"error": "Not found"})
+        if not self._is_admin(request):
+            return self.json_response(401, {"error": "Unauthorized"})
+        if not isinstance(data, dict):
+            return self.json_response(400, {"error": "Expected a JSON object"})
+
+        path = request.path
+        query = request.query
+        try:
+            limit = int(query.get("limit", ["40"])[0])
+            sample_rate = float(data["sample_rate"]) if "sample_rate" in data else None
+        except (TypeError, ValueError):
+            return self.json_response(400, {"error": "Invalid limit or sample_rate"})
+
+        if path == "/admin/profile" and request.method == "GET":
+            sort = query.get("sort", ["cumulative"])[0]
+            report = self.profiler.report(sort=sort, limit=limit)
+            if query.get("reset", ["0"])[0] == "1":
+                self.profiler.reset()
+            return Response(200, report.encode("utf-8"), TEXT_CONTENT_TYPE)
+        if path == "/admin/profile" and request.method == "POST":
+            if sample_rate is not None:
+                self.profiler.sample_rate = sample_rate
+            if data.get("reset"):
+                self.profiler.reset()
+            return self.json_response(200, {"sample_rate": self.profiler.sample_rate})
+        if path == "/admin/memory/snapshot" and request.method == "POST":
+            snapshot = self.memory_snapshots.take(limit=limit)
+            return Response(200, snapshot.encode("utf-8"), TEXT_CONTENT_TYPE)
+        if path == "/admin/memory/stop" and request.method == "POST":
+            self.memory_snapshots.stop()
+            return self.json_response(200, {"tracing": False})
+        return self.json_response(404, {"error": "Not found"})
+
+    def handle_list_offices(self, request: Request) -> Response:
+        query = request.query
+        try:
+            limit = int(query.get("limit", [str(DEFAULT_PAGE_SIZE)])[0])
+            after_id = int(query["cursor"][0]) if "cursor" in query else None
+            min_capacity = int(query["min_capacity"][0]) if "min_capacity" in query else None
+        except ValueError:
+            return self.json_response(400, {"error": "limit, cursor and min_capacity must be integers"})
+        if not 1 <= limit <= MAX_PAGE_SIZE:
+            return self.json_response(400, {"error": f"limit must be between 1 and {MAX_PAGE_SIZE}"})
+
+        try:
+            # One extra row tells whether another page follows.
+            offices = self.office_repository.find_page(
+                after_id=after_id,
+                limit=limit + 1,
+                min_capacity=min_capacity,
+                building=query.get("building", [None])[0],
+                text=query.get("q", [None])[0],
+            )
+        except Exception as e:
+            return self.json_response(500, {"error": str(e)})
+
+        page = offices[:limit]
+        response = {
+            "success": True,
+            "offices": [
+                {
+                    "office_id": office.office_id,
+                    "name": office.name,
+                    "capacity": office.capacity,
+                    "description": office.description,
+                    "building": office.building,
+                }
+                for office in page
+            ],
+            "next_cursor": page[-1].office_id if len(offices) > limit else None,
+        }
+        return self.json_response(200, response)
+
+    def handle_utilization(self, request: Request) -> Response:
+        query = request.query
+        if not all(field in query for field in ("office_id", "from", "to")):
+            return self.json_response(400, {"error": "office_id, from and to are required"})
+        try:
+            office_id = int(query["office_id"][0])
+            bucket_minutes = (
+                int(query["bucket_minutes"][0]) if "bucket_minutes" in query else None
+            )
+        except ValueError:
+            return self.json_response(400, {"error": "office_id and bucket_minutes must be integers"})
+
+        result = self.reservation_controller.get_utilization(
+            office_id,
+            query["from"][0],
+            query["to"][0],
+            granularity=query.get("granularity", ["day"])[0],
+            bucket_minutes=bucket_minutes,
+        )
+        if result.get("success"):
+            return self.json_response(200, result)
+        status_code = 404 if "not found" in result.get("error", "") else 400
+        return self.json_response(status_code, result)
+
+    def handle_check_availability(self, data: dict[str, Any]) -> Response:
+        required_fields = ["office_id", "date", "start_time", "end_time"]
+        if not all(field in data for field in required_fields):
+            return self.json_response(400, {"error": "Missing required fields"})
+
+        result = self.reservation_controller.check_office_availability(
+            office_id=data["office_id"],
+            date=data["date"],
+            start_time=data["start_time"],
+            end_time=data["end_time"],
+            seats=data.get("seats"),
+        )
+
+        status_code = 200 if result.get("success") else 404
+        return self.json_response(status_code, result)
+
+    def handle_create_reservation(self, data: dict[str, Any]) -> Response:
+        required_fields = ["office_id", "name", "email", "phone", "date", "start_time", "end_time"]
+        if not all(field in data for field in required_fields):
+            return self.json_response(400, {"error": "Missing required fields"})
+
+        result = self.reservation_controller.book_office(
+            office_id=data["office_id"],
+            date=data["date"],
+            start_time=data["start_time"],
+            end_time=data["end_time"],
+            name=data["name"],
+            email=data["email"],
+            phone=data["phone"],
+            seats=data.get("seats"),
+        )
+
+        return self._booking_response(result, 201)
+
+    def handle_create_series(self, data: dict[str, Any]) -> Response:
+        required_fields = [
+            "office_id", "name", "email", "phone", "date", "start_time", "end_time", "recurrence"
+        ]
+        if not all(field in data for field in required_fields):
+            return self.json_response(400, {"error": "Missing required fields"})
+
+        result = self.reservation_controller.book_series(
+            office_id=data["office_id"],
+            date=data["date"],
+            start_time=data["start_time"],
+            end_time=data["end_time"],
+            name=data["name"],
+            email=data["email"],
+            phone=data["phone"],
+            recurrence=data["recurrence"],
+            interval=data.get("interval", 1),
+            until=data.get("until"),
+            count=data.get("count"),
+            exceptions=data.get("exceptions"),
+            seats=data.get("seats"),
+        )
+        return self._booking_response(result, 201)
+
+    def handle_override_occurrence(self, data: dict[str, Any]) -> Response:
+        if not all(field in data for field in ("series_id", "date")):
+            return self.json_response(400, {"error": "Missing required fields"})
+
+        result = self.reservation_controller.override_occurrence(
+            series_id=data["series_id"],
+            date=data["date"],
+            start_time=data.get("start_time"),
+            end_time=data.get("end_time"),
+        )
+        return self._booking_response(result, 200)
+
+    def _booking_response(self, result: dict, success_status: int) -> Response:
+        if result.get("success"):
+            return self.json_response(success_status, result)
+
+        error_msg = result.get("error", "").lower()
+        if "not found" in error_msg:
+            status_code = 404
+        elif "conflict" in error_msg or "occupied" in error_msg:
+            status_code = 409
+        else:
+            status_code = 400
+        return self.json_response(status_code, result)
+
+    def handle_get_office_info(self, data: dict[str, Any]) -> Response:
+        required_fields = ["office_id", "date", "start_time", "end_time"]
+        if not all(field in data for field in required_fields):
+            return self.json_response(400, {"error": "Missing required fields"})
+
+        result = self.reservation_controller.get_office_info(
+            office_id=data["office_id"],
+            date=data["date"],
+            start_time=data["start_time"],
+            end_time=data["end_time"],
+        )
+
+        status_code = 200 if result.get("success") else 404
+        return self.json_response(status_code, result)
+
+    def json_response(self, status_code: int, data: Any) -> Response:
+        return Response(status_code, self.codec.encode(data))
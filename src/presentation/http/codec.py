@@ -0,0 +1,59 @@
+import json
+from abc import ABC, abstractmethod
+from typing import Any
+
+from config.logging import get_logger
+
+logger = get_logger(__name__)
+
+try:
+    import orjson
+
+    _HAS_ORJSON = True
+except ImportError:
+    _HAS_ORJSON = False
+
+
+class JSONCodec(ABC):
+    name = ""
+
+    @abstractmethod
+    def decode(self, body: bytes) -> Any:
+        pass
+
+    @abstractmethod
+    def encode(self, data: Any) -> bytes:
+        pass
+
+
+class StdlibJSONCodec(JSONCodec):
+    name = "json"
+
+    def decode(self, body: bytes) -> Any:
+        return json.loads(body)
+
+    def encode(self, data: Any) -> bytes:
+        return json.dumps(data, ensure_ascii=False).encode("utf-8")
+
+
+class OrjsonCodec(JSONCodec):
+    name = "orjson"
+
+    def decode(self, body: bytes) -> Any:
+        return orjson.loads(body)
+
+    def encode(self, data: Any) -> bytes:
+        # orjson always emits UTF-8, which matches ensure_ascii=False.
+        return orjson.dumps(data)
+
+
+def create_codec(name: str = "auto") -> JSONCodec:
+    if name == "json":
+        return StdlibJSONCodec()
+
+    if _HAS_ORJSON:
+        return OrjsonCodec()
+
+    if name == "orjson":
+        logger.warning("orjson is not installed, falling back to the json module")
+    return StdlibJSONCodec()
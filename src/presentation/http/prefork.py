@@ -0,0 +1,191 @@
+import os
+import signal
+import socket
+import time
+from collections.abc import Callable
+from types import FrameType
+from typing import Optional
+
+from config.logging import get_logger
+
+logger = get_logger(__name__)
+
+WorkerMain = Callable[[socket.socket], None]
+
+RESPAWN_BACKOFF_SECONDS = 1.0
+MIN_WORKER_LIFETIME_SECONDS = 2.0
+
+
+def create_listen_socket(port: int, reuse_port: bool = False, backlog: int = 128) -> socket.socket:
+    sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+    sock.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+    if reuse_port:
+        sock.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEPORT, 1)
+    sock.bind(("", port))
+    sock.listen(backlog)
+    return sock
+
+
+class PreforkMaster:
+    """Forks worker processes that serve from a shared port.
+
+    With ``reuse_port`` every worker binds its own SO_REUSEPORT socket and the
+    kernel balances connections; otherwise the workers inherit one listening
+    socket created by the master. Dead workers are respawned, SIGHUP performs a
+    rolling restart and SIGTERM/SIGINT stop all workers.
+    """
+
+    def __init__(  # noqa: PLR0913
+        self,
+        port: int,
+        workers: int,
+        worker_main: WorkerMain,
+        *,
+        before_fork: Optional[Callable[[], None]] = None,
+        reuse_port: bool = False,
+        shutdown_timeout: float = 30.0,
+    ) -> None:
+        self._port = port
+        self._workers = workers
+        self._worker_main = worker_main
+        self._before_fork = before_fork
+        self._reuse_port = reuse_port and hasattr(socket, "SO_REUSEPORT")
+        self._shutdown_timeout = shutdown_timeout
+
+        self._socket: Optional[socket.socket] = None
+        self._children: dict[int, float] = {}
+        self._stopping = False
+        self._restart_requested = False
+
+    def run(self) -> None:
+        if not self._reuse_port:
+            self._socket = create_listen_socket(self._port)
+
+        signal.signal(signal.SIGTERM, self._handle_stop)
+        signal.signal(signal.SIGINT, self._handle_stop)
+        signal.signal(signal.SIGHUP, self._handle_restart)
+
+        mode = "SO_REUSEPORT" if self._reuse_port else "shared socket"
+        logger.info("Starting %s workers on port %s (%s)", self._workers, self._port, mode)
+
+        for _ in range(self._workers):
+            self._spawn()
+
+        while not self._stopping:
+            if self._restart_requested:
+                self._restart_requested = False
+                self._rolling_restart()
+            self._reap_and_respawn()
+            time.sleep(0.2)
+
+        self._stop_all()
+
+    def _handle_stop(self, _signum: int, _frame: Optional[FrameType]) -> None:
+        self._stopping = True
+
+    def _handle_restart(self, _signum: int, _frame: Optional[FrameType]) -> None:
+        self._restart_requested = True
+
+    def _spawn(self) -> int:
+        if self._before_fork:
+            self._before_fork()
+
+        pid = os.fork()
+        if pid == 0:
+            self._run_child()
+
+        self._children[pid] = time.monotonic()
+        logger.info("Worker %s started", pid)
+        return pid
+
+    def _run_child(self) -> None:
+        exit_code = 0
+        try:
+            for signum in (signal.SIGTERM, signal.SIGHUP):
+                signal.signal(signum, signal.SIG_DFL)
+            # Ctrl-C reaches the whole process group; the master turns it into
+            # SIGTERM so workers drain instead of dying mid-request.
+            signal.signal(signal.SIGINT, signal.SIG_IGN)
+            sock = self._socket or create_listen_socket(self._port, reuse_port=True)
+            self._worker_main(sock)
+        except BaseException:
+            logger.exception("Worker %s crashed", os.getpid())
+            exit_code = 1
+        finally:
+            # Never fall back into the master's loop from a child.
+            os._exit(exit_code)
+
+    def _reap_and_respawn(self) -> None:
+        while self._children:
+            try:
+                pid, status = os.waitpid(-1, os.WNOHANG)
+            except ChildProcessError:
+                return
+            if pid == 0:
+                return
+
+            started = self._children.pop(pid, None)
+            if started is None:
+                continue
+
+            logger.warning("Worker %s exited with status %s", pid, status)
+            if self._stopping:
+                continue
+            if time.monotonic() - started < MIN_WORKER_LIFETIME_SECONDS:
+                time.sleep(RESPAWN_BACKOFF_SECONDS)
+            self._spawn()
+
+    def _rolling_restart(self) -> None:
+        logger.info("Rolling restart of %s workers", len(self._children))
+        for old_pid in list(self._children):
+            self._spawn()
+            self._terminate(old_pid)
+            if self._stopping:
+                return
+
+    def _terminate(self, pid: int) -> None:
+        try:
+            os.kill(pid, signal.SIGTERM)
+        except ProcessLookupError:
+            self._children.pop(pid, None)
+            return
+
+        deadline = time.monotonic() + self._shutdown_timeout
+        while time.monotonic() < deadline:
+            finished, _ = os.waitpid(pid, os.WNOHANG)
+            if finished:
+                break
+            time.sleep(0.1)
+        else:
+            logger.warning("Worker %s did not stop in time, killing it", pid)
+            os.kill(pid, signal.SIGKILL)
+            os.waitpid(pid, 0)
+
+        self._children.pop(pid, None)
+
+    def _stop_all(self) -> None:
+        logger.info("Stopping %s workers...", len(self._children))
+        for pid in list(self._children):
+            try:
+                os.kill(pid, signal.SIGTERM)
+            except ProcessLookupError:
+                self._children.pop(pid, None)
+
+        deadline = time.monotonic() + self._shutdown_timeout
+        while self._children and time.monotonic() < deadline:
+            try:
+                pid, _ = os.waitpid(-1, os.WNOHANG)
+            except ChildProcessError:
+                break
+            if pid:
+                self._children.pop(pid, None)
+            else:
+                time.sleep(0.1)
+
+        for pid in list(self._children):
+            logger.warning("Worker %s did not stop in time, killing it", pid)
+            os.kill(pid, signal.SIGKILL)
+        self._children.clear()
+
+        if self._socket:
+            self._socket.close()
@@ -1,261 +1,210 @@
-import json
+import os
+import signal
+import socket
 import sys
-from http.server import BaseHTTPRequestHandler, HTTPServer
-from pathlib import Path
-from socketserver import ThreadingMixIn
+import threading
+import time
+from http.server import BaseHTTPRequestHandler
+from types import FrameType
 from typing import Any, Optional
-from urllib.parse import urlparse
+from urllib.parse import urlsplit
 
 sys.path.insert(0, str(__file__).rsplit("/src", 1)[0])
 
-from config.logging import get_logger, setup_logging
+from config.logging import get_logger
 from config.settings import settings
 from src.bootstrap import (
+    configure_logging,
+    create_application,
     create_cache,
-    create_dependency_container,
-    create_rate_limiter,
     get_database_connection,
     initialize_database,
+    warm_up,
 )
-from src.infrastructure.security.rate_limiter import RateLimiter
+from src.presentation.http.application import Application, Request
+from src.presentation.http.prefork import PreforkMaster
+from src.presentation.http.worker_pool import PooledHTTPServer
 
 logger = get_logger(__name__)
 
 db_connection = None
 cache = None
-rate_limiter: Optional[RateLimiter] = None
-reservation_controller = None
-office_repository = None
+application: Optional[Application] = None
 
-
-class ThreadedHTTPServer(ThreadingMixIn, HTTPServer):
-    daemon_threads = True
+WARM_UP_RETRY_SECONDS = 2.0
+PREFORK_KILL_GRACE_SECONDS = 5.0
 
 
 class APIHandler(BaseHTTPRequestHandler):
-    def do_GET(self) -> None:
-        if not self._check_rate_limit():
-            return
+    # Applied to the connection socket in setup(): bounds every read and write
+    # so a slow client cannot pin a worker thread indefinitely.
+    timeout = settings.http_connection_timeout
 
-        parsed_path = urlparse(self.path)
-        path = parsed_path.path
-
-        if path == "/":
-            self.send_json_response(
-                200, {"status": "ok", "message": "Office Reservation API", "swagger": "/docs"}
-            )
-        elif path in {"/docs", "/docs/"}:
-            self.serve_swagger_ui()
-        elif path == "/openapi.json":
-            self.serve_openapi_spec()
-        elif path == "/api/offices":
-            self.handle_list_offices()
-        else:
-            self.send_json_response(404, {"error": "Not found"})
+    def do_GET(self) -> None:
+        self._serve()
 
     def do_POST(self) -> None:
-        if not self._check_rate_limit():
-            return
+        self._serve()
 
+    def _serve(self) -> None:
         content_length = int(self.headers.get("Content-Length", 0))
-        body = self.rfile.read(content_length).decode("utf-8")
-
         try:
-            data = json.loads(body) if body else {}
-        except json.JSONDecodeError:
-            self.send_json_response(400, {"error": "Invalid JSON"})
+            body = self.rfile.read(content_length) if content_length > 0 else b""
+        except (socket.timeout, TimeoutError):
+            # socket.timeout only became an alias of TimeoutError in 3.10.
+            self.log_error("Request body timed out")
+            self.close_connection = True
             return
-
-        parsed_path = urlparse(self.path)
-        path = parsed_path.path
-
-        if path == "/api/offices/availability":
-            self.handle_check_availability(data)
-        elif path == "/api/reservations":
-            self.handle_create_reservation(data)
-        elif path == "/api/offices/info":
-            self.handle_get_office_info(data)
-        else:
-            self.send_json_response(404, {"error": "Not found"})
-
-    def _check_rate_limit(self) -> bool:
-        if not rate_limiter:
-            return True
-
-        client_ip = self.client_address[0]
-        if not rate_limiter.is_allowed(client_ip):
-            self.send_json_response(
-                429,
-                {
-                    "error": "Too Many Requests",
-                    "message": f"Rate limit exceeded. Try again in {settings.rate_limit_window} seconds.",
-                },
+        url = urlsplit(self.path)
+
+        response = application.handle(  # type: ignore
+            Request(
+                method=self.command,
+                path=url.path,
+                query_string=url.query,
+                headers={name.lower(): value for name, value in self.headers.items()},
+                body=body,
+                client_ip=self.client_address[0],
             )
-            return False
-        return True
+        )
 
-    def handle_list_offices(self) -> None:
-        try:
-            offices = office_repository.find_all()  # type: ignore
-            response = {
-                "success": True,
-                "offices": [
-                    {
-                        "office_id": office.office_id,
-                        "name": office.name,
-                        "capacity": office.capacity,
-                        "description": office.description,
-                    }
-                    for office in offices
-                ],
-            }
-            self.send_json_response(200, response)
-        except Exception as e:
-            self.send_json_response(500, {"error": str(e)})
-
-    def handle_check_availability(self, data: dict[str, Any]) -> None:
-        required_fields = ["office_id", "date", "start_time", "end_time"]
-        if not all(field in data for field in required_fields):
-            self.send_json_response(400, {"error": "Missing required fields"})
-            return
+        self.send_response(response.status)
+        for name, value in response.header_items():
+            self.send_header(name, value)
+        self.end_headers()
+        self.wfile.write(response.body)
 
-        result = reservation_controller.check_office_availability(  # type: ignore
-            office_id=data["office_id"],
-            date=data["date"],
-            start_time=data["start_time"],
-            end_time=data["end_time"],
-        )
+    def log_message(self, fmt: str, *args: Any) -> None:
+        logger.debug("%s - " + fmt, self.address_string(), *args)
 
-        status_code = 200 if result.get("success") else 404
-        self.send_json_response(status_code, result)
 
-    def handle_create_reservation(self, data: dict[str, Any]) -> None:
-        required_fields = ["office_id", "name", "email", "phone", "date", "start_time", "end_time"]
-        if not all(field in data for field in required_fields):
-            self.send_json_response(400, {"error": "Missing required fields"})
-            return
+def init_app() -> None:
+    global db_connection, cache, application  # noqa: PLW0603
 
-        result = reservation_controller.book_office(  # type: ignore
-            office_id=data["office_id"],
-            date=data["date"],
-            start_time=data["start_time"],
-            end_time=data["end_time"],
-            name=data["name"],
-            email=data["email"],
-            phone=data["phone"],
-        )
+    cache = create_cache()
+    db_connection = get_database_connection()
+    application = create_application(db_connection, cache)
 
-        if result.get("success"):
-            self.send_json_response(201, result)
-        else:
-            error_msg = result.get("error", "")
-            if "not found" in error_msg.lower():
-                status_code = 404
-            elif "conflict" in error_msg.lower():
-                status_code = 409
-            else:
-                status_code = 400
-            self.send_json_response(status_code, result)
-
-    def handle_get_office_info(self, data: dict[str, Any]) -> None:
-        required_fields = ["office_id", "date", "start_time", "end_time"]
-        if not all(field in data for field in required_fields):
-            self.send_json_response(400, {"error": "Missing required fields"})
-            return
 
-        result = reservation_controller.get_office_info(  # type: ignore
-            office_id=data["office_id"],
-            date=data["date"],
-            start_time=data["start_time"],
-            end_time=data["end_time"],
-        )
+def _start_warm_up() -> None:
+    # Runs beside the accept loop: liveness answers at once, readiness turns
+    # 200 once the office cache and DB pool are warm.
+    def run() -> None:
+        while application is not None and not application.ready:
+            try:
+                warm_up(application, db_connection)  # type: ignore
+            except Exception:
+                logger.exception("Warm-up failed, retrying in %ss", WARM_UP_RETRY_SECONDS)
+                time.sleep(WARM_UP_RETRY_SECONDS)
 
-        status_code = 200 if result.get("success") else 404
-        self.send_json_response(status_code, result)
-
-    def serve_swagger_ui(self) -> None:
-        html = """
-<!DOCTYPE html>
-<html>
-<head>
-    <meta charset="UTF-8">
-    <title>Office Reservation API - Swagger UI</title>
-    <link rel="stylesheet" type="text/css" href="https://unpkg.com/swagger-ui-dist@5.10.3/swagger-ui.css">
-</head>
-<body>
-    <div id="swagger-ui"></div>
-    <script src="https://unpkg.com/swagger-ui-dist@5.10.3/swagger-ui-bundle.js"></script>
-    <script src="https://unpkg.com/swagger-ui-dist@5.10.3/swagger-ui-standalone-preset.js"></script>
-    <script>
-        window.onload = function() {
-            SwaggerUIBundle({
-                url: "/openapi.json",
-                dom_id: '#swagger-ui',
-                deepLinking: true,
-                presets: [
-                    SwaggerUIBundle.presets.apis,
-                    SwaggerUIStandalonePreset
-                ],
-                layout: "StandaloneLayout"
-            });
-        };
-    </script>
-</body>
-</html>
-"""
-        self.send_response(200)
-        self.send_header("Content-Type", "text/html; charset=utf-8")
-        self.end_headers()
-        self.wfile.write(html.encode("utf-8"))
-
-    def serve_openapi_spec(self) -> None:
-        spec_path = Path(__file__).parent / "openapi.json"
-        with spec_path.open(encoding="utf-8") as f:
-            spec = f.read()
-        self.send_response(200)
-        self.send_header("Content-Type", "application/json")
-        self.end_headers()
-        self.wfile.write(spec.encode("utf-8"))
+    threading.Thread(target=run, name="warm-up", daemon=True).start()
 
-    def send_json_response(self, status_code: int, data: Any) -> None:
-        self.send_response(status_code)
-        self.send_header("Content-Type", "application/json")
-        self.end_headers()
-        self.wfile.write(json.dumps(data, ensure_ascii=False).encode("utf-8"))
 
-    def log_message(self, fmt: str, *args: Any) -> None:
-        logger.debug(f"{self.address_string()} - {fmt % args}")
+def _serve(httpd: PooledHTTPServer) -> None:
+    def drain(signum: int, _frame: Optional[FrameType]) -> None:
+        logger.info(
+            "Received signal %s, draining for up to %ss", signum, settings.shutdown_timeout
+        )
+        if application is not None:
+            application.start_draining()
+        threading.Thread(target=httpd.shutdown, daemon=True).start()
+
+    signal.signal(signal.SIGTERM, drain)
+    _start_warm_up()
+    try:
+        httpd.serve_forever()
+    except KeyboardInterrupt:
+        logger.info("Shutting down server...")
+        if application is not None:
+            application.start_draining()
+    finally:
+        # Finishes accepted requests, bounded by SHUTDOWN_TIMEOUT.
+        httpd.server_close()
+    logger.info("Server stopped")
+
+
+def _serve_worker(listen_socket: socket.socket) -> None:
+    # The log listener thread and any DB/Redis connections do not survive the
+    # fork, so every worker builds its own.
+    configure_logging()
+    init_app()
+
+    httpd = _create_http_server(listen_socket.getsockname(), bind_and_activate=False)
+    httpd.socket.close()
+    httpd.socket = listen_socket
+
+    logger.info("Worker %s serving requests", os.getpid())
+    _serve(httpd)
+
+
+def _create_http_server(
+    server_address: tuple[str, int], bind_and_activate: bool = True
+) -> PooledHTTPServer:
+    return PooledHTTPServer(
+        server_address,
+        APIHandler,
+        threads=settings.http_threads,
+        queue_size=settings.http_queue_size,
+        queue_timeout=settings.http_queue_timeout,
+        retry_after=settings.http_retry_after,
+        drain_timeout=settings.shutdown_timeout,
+        bind_and_activate=bind_and_activate,
+    )
+
+
+def _run_prefork(port: int) -> None:
+    def before_fork() -> None:
+        if db_connection is not None:
+            db_connection.dispose()
+
+    master = PreforkMaster(
+        port=port,
+        workers=settings.workers,
+        worker_main=_serve_worker,
+        before_fork=before_fork,
+        reuse_port=settings.reuse_port,
+        # Workers drain on their own; the master only kills stragglers.
+        shutdown_timeout=settings.shutdown_timeout + PREFORK_KILL_GRACE_SECONDS,
+    )
+    master.run()
 
 
 def run_server(port: int = 8000) -> None:
-    global db_connection, cache, rate_limiter  # noqa: PLW0603
-    global reservation_controller, office_repository
+    global db_connection  # noqa: PLW0603
 
-    setup_logging(debug=settings.debug)
+    configure_logging()
     logger.info("Starting Office Reservation API...")
 
-    cache = create_cache()
-    rate_limiter = create_rate_limiter(cache)
-
     db_connection = get_database_connection()
     initialize_database(db_connection)
-    reservation_controller, office_repository = create_dependency_container(db_connection, cache)
+    logger.info("Database initialized")
+    logger.info(
+        "Rate limit: %s requests per %ss", settings.rate_limit_requests, settings.rate_limit_window
+    )
+    logger.info("Server running on http://localhost:%s", port)
+    logger.info("Swagger documentation: http://localhost:%s/docs", port)
+    logger.info("Debug mode: %s", settings.debug)
+    if settings.admin_token:
+        logger.info(
+            "Admin endpoints enabled, profile sample rate: %s", settings.profile_sample_rate
+        )
 
-    server_address = ("", port)
-    httpd = ThreadedHTTPServer(server_address, APIHandler)
+    if settings.workers > 1 and hasattr(os, "fork"):
+        _run_prefork(port)
+        return
 
-    logger.info("Database initialized")
+    init_app()
     logger.info("Redis cache enabled" if cache else "Redis cache disabled")
-    logger.info(f"Rate limit: {settings.rate_limit_requests} requests per {settings.rate_limit_window}s")
-    logger.info(f"Server running on http://localhost:{port}")
-    logger.info(f"Swagger documentation: http://localhost:{port}/docs")
-    logger.info(f"Debug mode: {settings.debug}")
 
-    try:
-        httpd.serve_forever()
-    except KeyboardInterrupt:
-        logger.info("Shutting down server...")
-        httpd.server_close()
+    server_address = ("", port)
+    httpd = _create_http_server(server_address)
+    logger.info(
+        "HTTP pool: %s threads, queue of %s, %ss queue budget",
+        settings.http_threads,
+        settings.http_queue_size,
+        settings.http_queue_timeout,
+    )
+    _serve(httpd)
 
 
 if __name__ == "__main__":
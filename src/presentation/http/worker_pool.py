@@ -0,0 +1,120 @@
+import queue
+import socket
+import threading
+import time
+from http.server import HTTPServer
+from typing import Any, Optional
+
+from config.logging import get_logger
+from src.infrastructure.monitoring.metrics import HTTP_QUEUE_DEPTH, HTTP_REQUESTS_SHED
+
+logger = get_logger(__name__)
+
+_STOP = None
+
+
+class PooledHTTPServer(HTTPServer):
+    """HTTP server backed by a fixed set of worker threads.
+
+    Accepted connections wait in a bounded queue. A connection is answered
+    with 503 and Retry-After, without running the handler, when the queue is
+    full or when it waited longer than ``queue_timeout`` seconds.
+    ``server_close`` finishes accepted connections for up to
+    ``drain_timeout`` seconds before giving up on them.
+    """
+
+    def __init__(  # noqa: PLR0913
+        self,
+        server_address: tuple[str, int],
+        handler_class: Any,
+        *,
+        threads: int = 32,
+        queue_size: int = 64,
+        queue_timeout: float = 1.0,
+        retry_after: int = 1,
+        drain_timeout: float = 30.0,
+        bind_and_activate: bool = True,
+    ) -> None:
+        super().__init__(server_address, handler_class, bind_and_activate=bind_and_activate)
+        self._queue: queue.Queue[Optional[tuple[socket.socket, Any, float]]] = queue.Queue(
+            maxsize=queue_size
+        )
+        self._queue_timeout = queue_timeout
+        self._drain_timeout = drain_timeout
+        self._shed_response = self._build_shed_response(retry_after)
+        self._threads = [
+            threading.Thread(target=self._work, name=f"http-worker-{i}", daemon=True)
+            for i in range(threads)
+        ]
+        for thread in self._threads:
+            thread.start()
+
+    @staticmethod
+    def _build_shed_response(retry_after: int) -> bytes:
+        body = b'{"error":"Service Unavailable","message":"Server is overloaded, retry later."}'
+        head = (
+            "HTTP/1.0 503 Service Unavailable\r\n"
+            "Content-Type: application/json\r\n"
+            f"Content-Length: {len(body)}\r\n"
+            f"Retry-After: {retry_after}\r\n"
+            "Connection: close\r\n\r\n"
+        )
+        return head.encode("ascii") + body
+
+    def process_request(self, request: Any, client_address: Any) -> None:
+        try:
+            self._queue.put_nowait((request, client_address, time.monotonic()))
+        except queue.Full:
+            self._shed(request, "queue_full")
+            return
+        HTTP_QUEUE_DEPTH.set(self._queue.qsize())
+
+    def _work(self) -> None:
+        while True:
+            item = self._queue.get()
+            if item is _STOP:
+                return
+            request, client_address, enqueued_at = item
+            HTTP_QUEUE_DEPTH.set(self._queue.qsize())
+
+            if time.monotonic() - enqueued_at > self._queue_timeout:
+                self._shed(request, "queue_timeout")
+                continue
+
+            try:
+                self.finish_request(request, client_address)
+            except Exception:
+                self.handle_error(request, client_address)
+            finally:
+                self.shutdown_request(request)
+
+    def _shed(self, request: socket.socket, reason: str) -> None:
+        HTTP_REQUESTS_SHED.inc(reason=reason)
+        try:
+            # Never let a slow client hold the accept loop or a worker here.
+            request.settimeout(0.5)
+            request.sendall(self._shed_response)
+        except OSError:
+            pass
+        finally:
+            self.shutdown_request(request)
+
+    def server_close(self) -> None:
+        super().server_close()
+        deadline = time.monotonic() + self._drain_timeout
+        # Queued connections are still served; the stop markers come last.
+        try:
+            for _ in self._threads:
+                self._queue.put(_STOP, timeout=max(deadline - time.monotonic(), 0.001))
+        except queue.Full:
+            pass
+
+        for thread in self._threads:
+            thread.join(max(deadline - time.monotonic(), 0))
+        busy = sum(thread.is_alive() for thread in self._threads)
+        if busy:
+            logger.warning(
+                "Drain deadline of %ss passed with %s requests still running",
+                self._drain_timeout,
+                busy,
+            )
@@ -0,0 +1,53 @@
+"""WSGI entry point for the API.
+
+Any WSGI server can host the application through the factory, e.g.::
+
+    gunicorn --workers 4 --threads 8 'src.presentation.http.wsgi:create_wsgi_app()'
+"""
+
+from collections.abc import Callable, Iterable
+from typing import Any
+
+from src.bootstrap import load_application
+from src.presentation.http.application import Application, Request
+
+StartResponse = Callable[..., Any]
+
+
+class WSGIApplication:
+    def __init__(self, app: Application) -> None:
+        self.app = app
+
+    def __call__(self, environ: dict[str, Any], start_response: StartResponse) -> Iterable[bytes]:
+        response = self.app.handle(self.build_request(environ))
+        start_response(f"{response.status} {response.reason}", response.header_items())
+        return [response.body]
+
+    @staticmethod
+    def build_request(environ: dict[str, Any]) -> Request:
+        try:
+            content_length = int(environ.get("CONTENT_LENGTH") or 0)
+        except ValueError:
+            content_length = 0
+        body = environ["wsgi.input"].read(content_length) if content_length > 0 else b""
+
+        headers = {
+            key[5:].replace("_", "-").lower(): value
+            for key, value in environ.items()
+            if key.startswith("HTTP_")
+        }
+        if environ.get("CONTENT_TYPE"):
+            headers["content-type"] = environ["CONTENT_TYPE"]
+
+        return Request(
+            method=environ["REQUEST_METHOD"],
+            path=environ.get("PATH_INFO") or "/",
+            query_string=environ.get("QUERY_STRING", ""),
+            headers=headers,
+            body=body,
+            client_ip=environ.get("REMOTE_ADDR", ""),
+        )
+
+
+def create_wsgi_app() -> WSGIApplication:
+    return WSGIApplication(load_application())
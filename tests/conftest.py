@@ -0,0 +1,67 @@
+from pathlib import Path
+from typing import Optional
+
+import pytest
+
+from src.application.interfaces.availability_index import AvailabilityIndexInterface
+from src.application.interfaces.notification import NotificationServiceInterface
+from src.application.interfaces.repository import OfficeRepositoryInterface
+from src.bootstrap import create_dependency_container, initialize_database
+from src.infrastructure.cache.memory_cache import InMemoryCache
+from src.infrastructure.database.connection import DatabaseConnection
+from src.infrastructure.notifications.null_notifier import NullNotificationService
+from src.presentation.controllers.reservation_controller import ReservationController
+from src.presentation.http.application import Application
+
+
+@pytest.fixture
+def db_path(tmp_path: Path) -> Path:
+    return tmp_path / "test.db"
+
+
+@pytest.fixture
+def db(db_path: Path) -> DatabaseConnection:
+    """A seeded SQLite database of its own for every test."""
+    db = DatabaseConnection(f"sqlite:///{db_path}")
+    initialize_database(db)
+    return db
+
+
+@pytest.fixture
+def cache() -> InMemoryCache:
+    return InMemoryCache()
+
+
+@pytest.fixture
+def notifier() -> NotificationServiceInterface:
+    return NullNotificationService()
+
+
+@pytest.fixture
+def availability_index() -> Optional[AvailabilityIndexInterface]:
+    return None
+
+
+@pytest.fixture
+def container(
+    db: DatabaseConnection,
+    cache: InMemoryCache,
+    notifier: NotificationServiceInterface,
+    availability_index: Optional[AvailabilityIndexInterface],
+) -> tuple[ReservationController, OfficeRepositoryInterface]:
+    """Wired like the server: one container whose session all requests share."""
+    return create_dependency_container(
+        db, cache, notifier, availability_index=availability_index
+    )
+
+
+@pytest.fixture
+def controller(
+    container: tuple[ReservationController, OfficeRepositoryInterface],
+) -> ReservationController:
+    return container[0]
+
+
+@pytest.fixture
+def app(container: tuple[ReservationController, OfficeRepositoryInterface]) -> Application:
+    return Application(*container)
@@ -0,0 +1,15 @@
+from collections.abc import Iterator
+from contextlib import contextmanager
+
+from src.infrastructure.monitoring.query_tracking import QueryStats, track_queries
+
+
+@contextmanager
+def assert_max_queries(budget: int) -> Iterator[QueryStats]:
+    with track_queries(record_statements=True) as stats:
+        yield stats
+
+    statements = "\n".join(f"  {statement}" for statement in stats.statements)
+    assert stats.count <= budget, (
+        f"Expected at most {budget} queries, got {stats.count}:\n{statements}"
+    )
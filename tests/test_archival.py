@@ -0,0 +1,60 @@
+from datetime import datetime, timedelta
+from pathlib import Path
+from typing import Union
+
+from sqlalchemy import select
+
+from src.bootstrap import initialize_database
+from src.infrastructure.database.archival import ReservationSweeper
+from src.infrastructure.database.connection import DatabaseConnection
+from src.infrastructure.database.models import ReservationArchiveModel, ReservationModel
+
+NOW = datetime(2030, 6, 1, 12, 0)
+RETENTION_DAYS = 30
+
+
+def add(db: DatabaseConnection, ended_days_ago: float, status: str) -> None:
+    end = NOW - timedelta(days=ended_days_ago)
+    with db.session_scope() as session:
+        session.add(
+            ReservationModel(
+                office_id=1,
+                user_name="Sweep User",
+                user_email="sweep@example.tj",
+                user_phone="+992901234567",
+                start_time=end - timedelta(hours=1),
+                end_time=end,
+                status=status,
+                created_at=end - timedelta(days=1),
+            )
+        )
+
+
+def statuses(
+    db: DatabaseConnection, model: Union[type[ReservationModel], type[ReservationArchiveModel]]
+) -> list[str]:
+    with db.session_scope() as session:
+        return sorted(session.scalars(select(model.status)))
+
+
+def test_sweep_completes_past_and_archives_old_finished(tmp_path: Path) -> None:
+    db = DatabaseConnection(f"sqlite:///{tmp_path / 'sweep.db'}")
+    initialize_database(db)
+    add(db, -1, "confirmed")  # still ahead
+    for _ in range(3):
+        add(db, 1, "confirmed")
+    add(db, 2, "pending")
+    add(db, 60, "confirmed")  # completed, then archived in the same sweep
+    add(db, 45, "cancelled")
+    add(db, 40, "completed")
+    add(db, 10, "cancelled")  # inside the retention window
+
+    sweeper = ReservationSweeper(db, retention_days=RETENTION_DAYS, batch_size=2, pause_seconds=0)
+    result = sweeper.sweep(NOW)
+
+    assert (result.completed, result.archived) == (5, 3)
+    assert statuses(db, ReservationModel) == ["cancelled"] + ["completed"] * 4 + ["confirmed"]
+    assert statuses(db, ReservationArchiveModel) == ["cancelled", "completed", "completed"]
+
+    again = sweeper.sweep(NOW)
+    assert (again.completed, again.archived) == (0, 0)
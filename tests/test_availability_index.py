@@ -0,0 +1,130 @@
+from datetime import datetime, timedelta
+from typing import Any
+
+import pytest
+
+from src.application.interfaces.availability_index import IndexedSchedule
+from src.domain.entities.reservation import Reservation
+from src.domain.value_objects.time_slot import TimeSlot
+from src.infrastructure.cache import availability_index as index_module
+from src.infrastructure.cache.availability_index import InMemoryAvailabilityIndex
+from src.infrastructure.database.availability import rebuild_availability_index
+from src.infrastructure.database.connection import DatabaseConnection
+from src.infrastructure.database.repositories.reservation_repository import (
+    ReservationRepository,
+)
+from src.infrastructure.monitoring.query_tracking import track_queries
+from src.presentation.controllers.reservation_controller import ReservationController
+
+OFFICE_ID = 2
+DAY = "2031-04-07"
+START = datetime(2031, 4, 7, 10, 0)
+WINDOW = TimeSlot(start_time=START, end_time=START + timedelta(hours=1))
+BOOKINGS = 2
+
+
+@pytest.fixture
+def availability_index() -> InMemoryAvailabilityIndex:
+    return InMemoryAvailabilityIndex()
+
+
+def book(controller: ReservationController, start: str, end: str) -> dict[str, Any]:
+    return controller.book_office(
+        OFFICE_ID,
+        DAY,
+        start,
+        end,
+        "Farrukh Rahimov",
+        "farrukh@example.tj",
+        "+992901234567",
+    )
+
+
+def indexed_reservations(index: InMemoryAvailabilityIndex) -> list[Reservation]:
+    indexed = index.find_overlapping(OFFICE_ID, WINDOW)
+    assert indexed is not None
+    return indexed.reservations
+
+
+def test_reads_come_from_the_index_once_built(
+    db: DatabaseConnection,
+    controller: ReservationController,
+    availability_index: InMemoryAvailabilityIndex,
+) -> None:
+    index = availability_index
+    assert book(controller, "09:00", "10:30")["success"]
+    # Not built yet: the database answers.
+    assert index.find_overlapping(OFFICE_ID, WINDOW) is None
+
+    rebuild_availability_index(db, index, [OFFICE_ID])
+    assert book(controller, "12:00", "13:00")["success"]
+    series = controller.book_series(
+        office_id=OFFICE_ID,
+        date=DAY,
+        start_time="14:00",
+        end_time="15:00",
+        name="Dilnoza Karimova",
+        email="d@example.tj",
+        phone="+992901234567",
+        recurrence="daily",
+        count=3,
+    )
+    assert series["success"]
+
+    controller.check_office_availability(OFFICE_ID, DAY, "10:00", "11:00")
+    with track_queries(record_statements=True) as stats:
+        busy = controller.check_office_availability(OFFICE_ID, DAY, "10:00", "12:30")
+        info = controller.get_office_info(OFFICE_ID, DAY, "10:00", "11:00")
+        next_day = controller.get_office_info(OFFICE_ID, "2031-04-08", "14:30", "16:00")
+    assert stats.count == 0, stats.statements
+    assert len(busy["conflicts"]) == BOOKINGS
+    assert next_day["data"]["occupied_by"] == "Dilnoza Karimova"
+    assert info["data"]["from_time"] == f"{DAY} 09:00"
+    assert controller.check_office_availability(OFFICE_ID, DAY, "10:30", "12:00")["available"]
+
+
+def test_index_follows_updates_and_deletes(
+    db: DatabaseConnection,
+    controller: ReservationController,
+    availability_index: InMemoryAvailabilityIndex,
+) -> None:
+    index = availability_index
+    rebuild_availability_index(db, index, [OFFICE_ID])
+    booking = book(controller, "10:00", "11:00")["data"]
+
+    with db.session_scope() as session:
+        repository = ReservationRepository(session, availability_index=index)
+        reservation = repository.get_by_id(booking["reservation_id"])
+        assert reservation is not None
+        sql = repository.find_by_office_and_time(OFFICE_ID, WINDOW)
+        assert indexed_reservations(index) == sql
+
+        reservation.cancel()
+        repository.save(reservation)
+        assert indexed_reservations(index) == []
+
+        second = book(controller, "10:15", "10:45")["data"]
+        repository.delete(second["reservation_id"])
+        assert indexed_reservations(index) == []
+
+
+def test_falls_back_on_version_mismatch_and_past_windows(
+    db: DatabaseConnection,
+    availability_index: InMemoryAvailabilityIndex,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    index = availability_index
+    empty = IndexedSchedule(reservations=[], series=[])
+    rebuild_availability_index(db, index, [OFFICE_ID])
+    assert index.find_overlapping(OFFICE_ID, WINDOW) == empty
+
+    past = TimeSlot.from_trusted(datetime(2020, 1, 6, 10, 0), datetime(2020, 1, 6, 11, 0))
+    assert index.find_overlapping(OFFICE_ID, past) is None
+
+    monkeypatch.setattr(index_module, "READ_MODEL_VERSION", "next")
+    assert index.find_overlapping(OFFICE_ID, WINDOW) is None
+    rebuild_availability_index(db, index, [OFFICE_ID])
+    assert index.find_overlapping(OFFICE_ID, WINDOW) == empty
+
+    index.invalidate()
+    assert index.find_overlapping(OFFICE_ID, WINDOW) is None
@@ -0,0 +1,77 @@
+import io
+import json
+from typing import Any
+
+import pytest
+
+from src.bootstrap import create_dependency_container
+from src.infrastructure.cache.memory_cache import InMemoryCache
+from src.infrastructure.database.connection import DatabaseConnection
+from src.infrastructure.notifications.null_notifier import NullNotificationService
+from src.presentation.cli.batch import BatchAbortedError, BatchRunner, BatchSummary
+from src.presentation.controllers.reservation_controller import ReservationController
+
+SLOT = {"office_id": 1, "date": "2030-01-07", "start_time": "10:00", "end_time": "11:00"}
+BOOKING = {
+    "command": "book",
+    **SLOT,
+    "name": "Farrukh Rahimov",
+    "email": "farrukh@example.tj",
+    "phone": "+992901234567",
+}
+
+
+def run_batch(
+    controller: ReservationController, commands: list[Any], **kwargs: Any
+) -> tuple[list[dict[str, Any]], BatchSummary]:
+    lines = [c if isinstance(c, str) else json.dumps(c) for c in commands]
+    output = io.StringIO()
+    summary = BatchRunner(controller, **kwargs).run(lines, output)
+    return [json.loads(line) for line in output.getvalue().splitlines()], summary
+
+
+def test_batch_streams_one_result_per_command(controller: ReservationController) -> None:
+    results, summary = run_batch(
+        controller,
+        [
+            {**BOOKING, "id": "first"},
+            {"command": "check-availability", **SLOT},
+            "",
+            "not json",
+            {"command": "cancel"},
+            {"command": "info", "office_id": 1},
+            {"command": ["book"]},
+        ],
+    )
+
+    assert [r["line"] for r in results] == [1, 2, 4, 5, 6, 7]
+    assert results[0]["id"] == "first"
+    assert results[0]["result"]["success"] is True
+    assert results[1]["result"]["available"] is False
+    assert results[2]["result"]["error"] == "Invalid JSON"
+    assert results[3]["result"]["error"] == "Unknown command: cancel"
+    assert "date" in results[4]["result"]["error"]
+    assert results[5]["result"]["error"] == "Unknown command: ['book']"
+    assert (summary.processed, summary.failed) == (6, 4)
+
+
+def book_in_one_transaction(db: DatabaseConnection, commands: list[dict]) -> None:
+    with db.transaction_scope() as session:
+        controller, _ = create_dependency_container(
+            db, InMemoryCache(), NullNotificationService(), session=session
+        )
+        lines = [json.dumps(command) for command in commands]
+        summary = BatchRunner(controller, stop_on_failure=True).run(lines, io.StringIO())
+        if summary.failed:
+            raise BatchAbortedError
+
+
+def test_transaction_scope_rolls_back_failed_batch(
+    db: DatabaseConnection, controller: ReservationController
+) -> None:
+    later = {**BOOKING, "start_time": "14:00", "end_time": "15:00"}
+    with pytest.raises(BatchAbortedError):
+        book_in_one_transaction(db, [later, BOOKING, BOOKING])
+
+    results, _ = run_batch(controller, [{**later, "command": "check-availability"}])
+    assert results[0]["result"]["available"] is True
@@ -0,0 +1,79 @@
+import sys
+from datetime import datetime
+
+import pytest
+
+from src.domain.entities.reservation import Reservation, ReservationStatus
+from src.domain.entities.user import User
+from src.domain.time_format import format_date_time, parse_date_time
+from src.domain.value_objects.contact_info import ContactInfo
+from src.domain.value_objects.time_slot import TimeSlot
+
+START = datetime(2025, 12, 5, 10, 0)
+END = datetime(2025, 12, 5, 12, 0)
+
+
+def build_reservation() -> Reservation:
+    return Reservation(
+        office_id=1,
+        user=User(
+            user_id=None,
+            name="Farrukh Rahimov",
+            contact_info=ContactInfo(email="farrukh@example.tj", phone="+992901234567"),
+        ),
+        time_slot=TimeSlot(start_time=START, end_time=END),
+        reservation_id=7,
+        status=ReservationStatus.CONFIRMED,
+        created_at=START,
+    )
+
+
+def test_trusted_construction_matches_validated() -> None:
+    trusted = Reservation.from_trusted(
+        office_id=1,
+        user=User.from_trusted(
+            user_id=None,
+            name="Farrukh Rahimov",
+            contact_info=ContactInfo.from_trusted(
+                email="farrukh@example.tj", phone="+992901234567"
+            ),
+        ),
+        time_slot=TimeSlot.from_trusted(start_time=START, end_time=END),
+        reservation_id=7,
+        status=ReservationStatus.CONFIRMED,
+        created_at=START,
+    )
+
+    assert trusted == build_reservation()
+
+
+def test_validated_construction_still_rejects_bad_input() -> None:
+    with pytest.raises(ValueError, match="Invalid email"):
+        ContactInfo(email="not-an-email", phone="+992901234567")
+
+    with pytest.raises(ValueError, match="Invalid phone"):
+        ContactInfo(email="farrukh@example.tj", phone="12345")
+
+    with pytest.raises(ValueError, match="at least 15 minutes"):
+        TimeSlot(start_time=START, end_time=START.replace(minute=10))
+
+
+@pytest.mark.skipif(sys.version_info < (3, 10), reason="dataclass slots need Python 3.10")
+def test_domain_objects_are_slotted() -> None:
+    reservation = build_reservation()
+
+    for obj in (reservation, reservation.user, reservation.user.contact_info, reservation.time_slot):
+        assert not hasattr(obj, "__dict__")
+
+
+@pytest.mark.parametrize(("date", "time"), [("2025-12-05", "10:00"), ("2025-12-05", "9:30")])
+def test_parse_date_time_matches_strptime(date: str, time: str) -> None:
+    expected = datetime.strptime(f"{date} {time}", "%Y-%m-%d %H:%M")
+
+    assert parse_date_time(date, time) == expected
+    assert format_date_time(expected) == expected.strftime("%Y-%m-%d %H:%M")
+
+
+def test_parse_date_time_rejects_invalid_values() -> None:
+    with pytest.raises(ValueError, match="does not match format"):
+        parse_date_time("2025-13-05", "10:00")
@@ -0,0 +1,159 @@
+import asyncio
+import io
+import json
+from http import HTTPStatus
+from typing import Any, Optional
+
+import pytest
+
+from config.settings import settings
+from src.application.interfaces.repository import OfficeRepositoryInterface
+from src.infrastructure.cache.memory_cache import InMemoryCache
+from src.infrastructure.security.rate_limiter import RateLimiter
+from src.presentation.controllers.reservation_controller import ReservationController
+from src.presentation.http.application import Application, Request
+from src.presentation.http.asgi import ASGIApplication
+from src.presentation.http.wsgi import WSGIApplication
+
+BOOKING = {
+    "office_id": 2,
+    "name": "Farrukh Rahimov",
+    "email": "farrukh@example.tj",
+    "phone": "+992901234567",
+    "date": "2030-01-07",
+    "start_time": "10:00",
+    "end_time": "11:00",
+}
+SEEDED_OFFICES = 5
+ADMIN_GUESSES = 3
+
+
+def call_wsgi(
+    app: Application, method: str, path: str, payload: Optional[dict[str, Any]] = None
+) -> tuple[str, dict[str, str], bytes]:
+    body = json.dumps(payload).encode("utf-8") if payload is not None else b""
+    environ = {
+        "REQUEST_METHOD": method,
+        "PATH_INFO": path,
+        "QUERY_STRING": "",
+        "CONTENT_LENGTH": str(len(body)),
+        "CONTENT_TYPE": "application/json",
+        "REMOTE_ADDR": "127.0.0.1",
+        "wsgi.input": io.BytesIO(body),
+    }
+    captured: dict[str, Any] = {}
+
+    def start_response(status: str, headers: list[tuple[str, str]]) -> None:
+        captured["status"] = status
+        captured["headers"] = dict(headers)
+
+    chunks = WSGIApplication(app)(environ, start_response)
+    return captured["status"], captured["headers"], b"".join(chunks)
+
+
+def test_wsgi_booking_then_conflict(app: Application) -> None:
+    status, headers, body = call_wsgi(app, "POST", "/api/reservations", BOOKING)
+    assert status == "201 Created"
+    assert headers["Content-Length"] == str(len(body))
+    assert "Server-Timing" in headers
+    assert json.loads(body)["success"] is True
+
+    status, _, _ = call_wsgi(app, "POST", "/api/reservations", BOOKING)
+    assert status == "409 Conflict"
+
+
+def test_wsgi_errors(app: Application) -> None:
+    assert call_wsgi(app, "GET", "/missing")[0] == "404 Not Found"
+    assert call_wsgi(app, "DELETE", "/api/offices")[0] == "405 Method Not Allowed"
+    assert call_wsgi(app, "POST", "/api/offices/availability", {})[0] == "400 Bad Request"
+
+
+def test_asgi_lists_offices(app: Application) -> None:
+    sent: list[dict[str, Any]] = []
+
+    async def receive() -> dict:
+        return {"type": "http.request", "body": b"", "more_body": False}
+
+    async def send(message: dict) -> None:
+        sent.append(message)
+
+    scope = {
+        "type": "http",
+        "method": "GET",
+        "path": "/api/offices",
+        "query_string": b"",
+        "headers": [],
+        "client": ("127.0.0.1", 5000),
+    }
+    asyncio.run(ASGIApplication(app)(scope, receive, send))
+
+    assert sent[0]["status"] == HTTPStatus.OK
+    assert len(json.loads(sent[1]["body"])["offices"]) == SEEDED_OFFICES
+
+
+def test_readiness_follows_warm_up_and_drain(app: Application) -> None:
+    assert call_wsgi(app, "GET", "/health/live")[0] == "200 OK"
+    assert call_wsgi(app, "GET", "/health/ready")[0] == "503 Service Unavailable"
+
+    assert app.warm_up() == SEEDED_OFFICES
+    app.mark_ready()
+    _, headers, _ = call_wsgi(app, "GET", "/health/ready")
+    assert headers["Server-Timing"].endswith('"0 queries"')
+
+    app.start_draining()
+    _, _, body = call_wsgi(app, "GET", "/health/ready")
+    assert json.loads(body) == {"status": "draining"}
+
+
+def admin_request(method: str, token: str = "secret", body: bytes = b"") -> Request:
+    return Request(
+        method=method,
+        path="/admin/profile",
+        headers={"content-type": "application/json", "x-admin-token": token},
+        body=body,
+        client_ip="127.0.0.1",
+    )
+
+
+def test_admin_paths_hide_without_a_token_and_check_it(
+    app: Application, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    assert app.handle(admin_request("GET")).status == HTTPStatus.NOT_FOUND
+
+    monkeypatch.setattr(settings, "admin_token", "secret")
+    assert app.handle(admin_request("GET", token="")).status == HTTPStatus.UNAUTHORIZED
+    assert app.handle(admin_request("GET", token="guess")).status == HTTPStatus.UNAUTHORIZED
+    assert app.handle(admin_request("GET")).status == HTTPStatus.OK
+
+
+def test_admin_profile_clamps_sample_rate_and_rejects_bad_bodies(
+    app: Application, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    monkeypatch.setattr(settings, "admin_token", "secret")
+
+    def set_rate(body: bytes) -> tuple[int, Any]:
+        response = app.handle(admin_request("POST", body=body))
+        return response.status, json.loads(response.body)
+
+    assert set_rate(b'{"sample_rate": 5}') == (HTTPStatus.OK, {"sample_rate": 1.0})
+    assert set_rate(b'{"sample_rate": -1}') == (HTTPStatus.OK, {"sample_rate": 0.0})
+    assert set_rate(b'{"sample_rate": "often"}')[0] == HTTPStatus.BAD_REQUEST
+    assert set_rate(b"[1]")[0] == HTTPStatus.BAD_REQUEST
+
+
+def test_admin_paths_are_rate_limited(
+    container: tuple[ReservationController, OfficeRepositoryInterface],
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    monkeypatch.setattr(settings, "admin_token", "secret")
+    limited = Application(
+        *container, rate_limiter=RateLimiter(InMemoryCache(), max_requests=ADMIN_GUESSES)
+    )
+
+    statuses = [
+        limited.handle(admin_request(method, token="guess")).status
+        for method in ("GET", "POST") * ADMIN_GUESSES
+    ]
+
+    assert statuses[:ADMIN_GUESSES] == [HTTPStatus.UNAUTHORIZED] * ADMIN_GUESSES
+    assert set(statuses[ADMIN_GUESSES:]) == {HTTPStatus.TOO_MANY_REQUESTS}
@@ -0,0 +1,97 @@
+from http import HTTPStatus
+from pathlib import Path
+from typing import Optional
+
+import pytest
+
+from src.application.interfaces.notification import NotificationData
+from src.bootstrap import create_dependency_container, initialize_database
+from src.infrastructure.cache.memory_cache import InMemoryCache
+from src.infrastructure.database.connection import DatabaseConnection
+from src.infrastructure.notifications.null_notifier import NullNotificationService
+from src.infrastructure.security.idempotency import IdempotencyKeys
+from src.presentation.http.application import Application, Request, Response
+
+BOOKING = {
+    "office_id": 2,
+    "name": "Farrukh Rahimov",
+    "email": "farrukh@example.tj",
+    "phone": "+992901234567",
+    "date": "2030-01-07",
+    "start_time": "10:00",
+    "end_time": "11:00",
+}
+KEY = "4f1c2a7e-0b9d-4c57-a0e3-6d8f5b2c9e11"
+
+
+class CountingNotificationService(NullNotificationService):
+    def __init__(self) -> None:
+        self.sent = 0
+
+    def send_email(self, _notification_data: NotificationData) -> bool:
+        self.sent += 1
+        return True
+
+
+@pytest.fixture
+def notifier() -> CountingNotificationService:
+    return CountingNotificationService()
+
+
+@pytest.fixture
+def app(tmp_path: Path, notifier: CountingNotificationService) -> Application:
+    db = DatabaseConnection(f"sqlite:///{tmp_path / 'idempotency.db'}")
+    initialize_database(db)
+    cache = InMemoryCache()
+    controller, office_repository = create_dependency_container(db, cache, notifier)
+    return Application(controller, office_repository, idempotency=IdempotencyKeys(cache))
+
+
+def post(app: Application, payload: dict, key: Optional[str] = KEY) -> Response:
+    headers = {"content-type": "application/json"}
+    if key is not None:
+        headers["idempotency-key"] = key
+    return app.handle(
+        Request(
+            method="POST",
+            path="/api/reservations",
+            headers=headers,
+            body=app.codec.encode(payload),
+            client_ip="127.0.0.1",
+        )
+    )
+
+
+def test_retry_replays_first_response_without_booking_again(
+    app: Application, notifier: CountingNotificationService
+) -> None:
+    first = post(app, BOOKING)
+    assert first.status == HTTPStatus.CREATED
+
+    # Same request with its fields in another order.
+    retry = post(app, dict(reversed(BOOKING.items())))
+    assert (retry.status, retry.body) == (first.status, first.body)
+    assert ("Idempotent-Replayed", "true") in retry.headers
+    assert dict(retry.headers)["Server-Timing"].endswith('"0 queries"')
+    assert notifier.sent == 1
+
+    # Without a key the retry runs again and meets its own booking.
+    assert post(app, BOOKING, key=None).status == HTTPStatus.CONFLICT
+
+
+def test_key_reused_for_another_request_is_rejected(app: Application) -> None:
+    assert post(app, BOOKING).status == HTTPStatus.CREATED
+    other = post(app, {**BOOKING, "start_time": "12:00", "end_time": "13:00"})
+    assert other.status == HTTPStatus.UNPROCESSABLE_ENTITY
+
+
+def test_retry_while_first_is_running_is_told_to_wait(app: Application) -> None:
+    assert app.idempotency is not None
+    assert app.idempotency.claim(KEY)
+
+    busy = post(app, BOOKING)
+    assert busy.status == HTTPStatus.CONFLICT
+    assert "Retry-After" in dict(busy.headers)
+
+    app.idempotency.release(KEY)
+    assert post(app, BOOKING).status == HTTPStatus.CREATED
@@ -0,0 +1,23 @@
+from src.infrastructure.monitoring.metrics import MetricsRegistry
+
+
+def test_render_prometheus_text_format() -> None:
+    registry = MetricsRegistry()
+    requests = registry.counter("requests_total", "Requests", labels=("route",))
+    latency = registry.histogram("latency_seconds", "Latency", buckets=(0.1, 1.0))
+
+    requests.inc(route="/api/offices")
+    requests.inc(route="/api/offices")
+    latency.observe(0.05)
+    latency.observe(0.5)
+    latency.observe(5.0)
+
+    lines = registry.render().splitlines()
+
+    assert "# TYPE requests_total counter" in lines
+    assert 'requests_total{route="/api/offices"} 2' in lines
+    assert 'latency_seconds_bucket{le="0.1"} 1' in lines
+    assert 'latency_seconds_bucket{le="1"} 2' in lines
+    assert 'latency_seconds_bucket{le="+Inf"} 3' in lines
+    assert "latency_seconds_count 3" in lines
+    assert "latency_seconds_sum 5.55" in lines
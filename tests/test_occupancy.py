@@ -0,0 +1,122 @@
+import sqlite3
+import threading
+from datetime import datetime, timedelta
+from pathlib import Path
+from typing import Any
+
+import pytest
+
+from src.domain.entities.reservation import Reservation
+from src.domain.entities.user import User
+from src.domain.occupancy import peak_occupancy
+from src.domain.value_objects.contact_info import ContactInfo
+from src.domain.value_objects.time_slot import TimeSlot
+from src.infrastructure.database.booking_lock import SessionBookingLock
+from src.infrastructure.database.connection import DatabaseConnection
+from src.presentation.controllers.reservation_controller import ReservationController
+
+START = datetime(2030, 3, 4, 9, 0)
+HOUR = timedelta(hours=1)
+CAPACITY = 12
+SHARED_OFFICE = 5
+BOOKERS = 16
+FIRST_SEATS, SECOND_SEATS, THIRD_SEATS = 3, 4, 5
+
+
+def slot(offset_hours: float, hours: float = 1) -> TimeSlot:
+    start = START + HOUR * offset_hours
+    return TimeSlot(start_time=start, end_time=start + HOUR * hours)
+
+
+def reservation(time_slot: TimeSlot, seats: "int | None") -> Reservation:
+    user = User(
+        user_id=None,
+        name="Dilnoza Karimova",
+        contact_info=ContactInfo(email="d@example.tj", phone="+992901234567"),
+    )
+    return Reservation(office_id=SHARED_OFFICE, user=user, time_slot=time_slot, seats=seats)
+
+
+def book(
+    controller: ReservationController,
+    seats: "int | None",
+    start: str = "10:00",
+    end: str = "11:00",
+) -> dict[str, Any]:
+    return controller.book_office(
+        SHARED_OFFICE,
+        "2030-03-04",
+        start,
+        end,
+        "Dilnoza Karimova",
+        "d@example.tj",
+        "+992901234567",
+        seats=seats,
+    )
+
+
+def test_peak_counts_only_simultaneous_seats() -> None:
+    reservations = [
+        reservation(slot(0, 2), FIRST_SEATS),
+        reservation(slot(1, 2), SECOND_SEATS),
+        # Starts as the first ends: never held together with it.
+        reservation(slot(2), THIRD_SEATS),
+    ]
+
+    assert peak_occupancy(reservations, slot(0, 3), CAPACITY) == SECOND_SEATS + THIRD_SEATS
+    assert peak_occupancy(reservations, slot(0, 1), CAPACITY) == FIRST_SEATS
+    assert peak_occupancy([reservation(slot(0), None)], slot(0), CAPACITY) == CAPACITY
+    assert peak_occupancy([], slot(0), CAPACITY) == 0
+
+
+def test_shared_office_fills_up_to_capacity(controller: ReservationController) -> None:
+    assert book(controller, 8)["success"]
+    assert book(controller, 4, "10:30", "12:00")["success"]
+    full = controller.check_office_availability(
+        SHARED_OFFICE, "2030-03-04", "10:00", "11:00", seats=1
+    )
+    assert not full["available"]
+    assert full["data"]["peak_occupancy"] == CAPACITY
+    assert "is occupied by" in book(controller, 1)["error"]
+
+    # After the 8-seat booking ends the 4 seats are all that is held.
+    later = controller.check_office_availability(
+        SHARED_OFFICE, "2030-03-04", "11:00", "12:00", seats=8
+    )
+    assert later["available"], later
+    # A whole-office booking still needs the office to be empty.
+    assert not book(controller, None, "11:00", "12:00")["success"]
+    assert book(controller, None, "12:00", "13:00")["success"]
+    assert not book(controller, CAPACITY + 1, "14:00", "15:00")["success"]
+    assert not book(controller, 0, "14:00", "15:00")["success"]
+
+
+def test_concurrent_bookings_never_exceed_capacity(controller: ReservationController) -> None:
+    results: list[dict[str, Any]] = []
+    barrier = threading.Barrier(BOOKERS)
+
+    def worker() -> None:
+        barrier.wait()
+        results.append(book(controller, 1))
+
+    threads = [threading.Thread(target=worker) for _ in range(BOOKERS)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert sum(result["success"] for result in results) == CAPACITY
+
+
+def test_booking_lock_outlives_the_shared_session(
+    db: DatabaseConnection, db_path: Path
+) -> None:
+    shared = db.get_session()
+
+    with SessionBookingLock(db.session_scope).lock_office(SHARED_OFFICE):
+        # Another request thread ends its work on the shared session.
+        shared.rollback()
+        other_process = sqlite3.connect(db_path, timeout=0.1)
+        with pytest.raises(sqlite3.OperationalError, match="locked"):
+            other_process.execute("BEGIN IMMEDIATE")
+        other_process.close()
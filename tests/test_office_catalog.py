@@ -0,0 +1,110 @@
+import json
+from http import HTTPStatus
+from pathlib import Path
+
+import pytest
+from sqlalchemy import text
+
+from src.bootstrap import initialize_database
+from src.domain.entities.office import Office
+from src.infrastructure.database.connection import DatabaseConnection
+from src.infrastructure.database.repositories.office_repository import OfficeRepository
+from src.presentation.controllers.reservation_controller import ReservationController
+from src.presentation.http.application import Application, Request
+
+BUILDINGS = ("North", "South", "East")
+CATALOG_SIZE = 300
+PAGE_SIZE = 40
+ROOM_ID = 142
+MIN_CAPACITY = 10
+
+
+@pytest.fixture
+def db(db: DatabaseConnection) -> DatabaseConnection:
+    with db.session_scope() as session:
+        repository = OfficeRepository(session)
+        for office_id in range(6, CATALOG_SIZE + 1):
+            repository.save(
+                Office(
+                    office_id=office_id,
+                    name=f"Room {office_id}",
+                    capacity=office_id % 20 + 1,
+                    description="Whiteboard" if office_id % 2 else "Projector",
+                    building=BUILDINGS[office_id % 3],
+                )
+            )
+    return db
+
+
+def list_offices(app: Application, query: str) -> tuple[int, dict]:
+    response = app.handle(
+        Request(
+            method="GET",
+            path="/api/offices",
+            query_string=query,
+            headers={},
+            body=b"",
+            client_ip="127.0.0.1",
+        )
+    )
+    return response.status, json.loads(response.body)
+
+
+def test_pages_cover_filtered_catalog_exactly_once(db: DatabaseConnection) -> None:
+    repository = OfficeRepository(db.get_session())
+    expected = [
+        office.office_id
+        for office in repository.find_all()
+        if office.building == "South" and office.capacity >= MIN_CAPACITY
+    ]
+
+    seen, after_id = [], None
+    while True:
+        page = repository.find_page(
+            after_id=after_id, limit=PAGE_SIZE, min_capacity=MIN_CAPACITY, building="South"
+        )
+        seen += [office.office_id for office in page]
+        if len(page) < PAGE_SIZE:
+            break
+        after_id = page[-1].office_id
+
+    assert seen == expected
+    matches = repository.find_page(text="whiteboard room 14")
+    assert {office.office_id for office in matches} == {141, 143, 145, 147, 149}
+
+
+def test_http_listing_follows_cursor_and_books_beyond_five(
+    controller: ReservationController, app: Application
+) -> None:
+    status, first = list_offices(app, "limit=2&building=North")
+    assert status == HTTPStatus.OK
+    assert [office["office_id"] for office in first["offices"]] == [6, 9]
+    _, second = list_offices(app, f"limit=2&building=North&cursor={first['next_cursor']}")
+    assert [office["office_id"] for office in second["offices"]] == [12, 15]
+    assert list_offices(app, "limit=0")[0] == HTTPStatus.BAD_REQUEST
+    assert list_offices(app, "cursor=abc")[0] == HTTPStatus.BAD_REQUEST
+
+    result = controller.book_office(
+        ROOM_ID, "2031-05-06", "10:00", "11:00", "Dilnoza Karimova", "d@example.tj", "+992901234567"
+    )
+    assert result["success"], result
+    missing = controller.check_office_availability(CATALOG_SIZE + 1, "2031-05-06", "10:00", "11:00")
+    assert "not found" in missing["error"]
+
+
+def test_existing_offices_table_gains_building_column(tmp_path: Path) -> None:
+    db = DatabaseConnection(f"sqlite:///{tmp_path / 'legacy.db'}")
+    with db.session_scope() as session:
+        session.execute(
+            text(
+                "CREATE TABLE offices (office_id INTEGER PRIMARY KEY, name VARCHAR(100) NOT NULL, "
+                "capacity INTEGER NOT NULL, description TEXT)"
+            )
+        )
+        session.execute(text("INSERT INTO offices VALUES (1, 'Old Room', 4, NULL)"))
+
+    initialize_database(db)
+
+    office = OfficeRepository(db.get_session()).get_by_id(1)
+    assert office is not None
+    assert (office.name, office.building) == ("Old Room", None)
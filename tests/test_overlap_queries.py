@@ -0,0 +1,57 @@
+from datetime import datetime, timedelta
+from pathlib import Path
+
+from sqlalchemy.dialects import postgresql
+
+from src.bootstrap import initialize_database
+from src.domain.entities.reservation import Reservation
+from src.domain.entities.user import User
+from src.domain.value_objects.contact_info import ContactInfo
+from src.domain.value_objects.time_slot import TimeSlot
+from src.infrastructure.database.connection import DatabaseConnection
+from src.infrastructure.database.repositories.reservation_repository import (
+    ReservationRepository,
+)
+
+START = datetime(2030, 3, 4, 10, 0)
+HOUR = timedelta(hours=1)
+
+
+def slot(offset_hours: float, hours: float = 1) -> TimeSlot:
+    start = START + HOUR * offset_hours
+    return TimeSlot(start_time=start, end_time=start + HOUR * hours)
+
+
+def test_range_overlap_uses_tsrange_operator() -> None:
+    repository = ReservationRepository(session=None, range_overlap=True)  # type: ignore[arg-type]
+
+    sql = str(repository._overlap_query(1, slot(0)).compile(dialect=postgresql.dialect()))
+
+    assert "reservations.period && tsrange(" in sql
+    assert "reservations.end_time >" not in sql
+    # Partition key bounds for pruning.
+    assert "reservations.start_time <" in sql
+    assert "reservations.start_time >" in sql
+
+
+def test_column_pair_overlap_is_half_open(tmp_path: Path) -> None:
+    db = DatabaseConnection(f"sqlite:///{tmp_path / 'overlap.db'}")
+    initialize_database(db)
+    repository = ReservationRepository(db.get_session())
+    repository.save(
+        Reservation(
+            office_id=1,
+            user=User(
+                user_id=None,
+                name="Dilnoza Karimova",
+                contact_info=ContactInfo(email="d@example.tj", phone="+992901234567"),
+            ),
+            time_slot=slot(0, 2),
+        )
+    )
+
+    assert repository.find_by_office_and_time(1, slot(1))
+    assert repository.find_by_office_and_time(1, slot(-0.5))
+    assert not repository.find_by_office_and_time(1, slot(2))
+    assert not repository.find_by_office_and_time(1, slot(-1))
+    assert not repository.find_by_office_and_time(2, slot(1))
@@ -0,0 +1,90 @@
+from collections.abc import Iterator
+from contextlib import contextmanager
+from datetime import datetime
+from typing import Any, Optional
+from unittest.mock import Mock
+
+from sqlalchemy import TextClause
+from sqlalchemy.dialects import postgresql
+from sqlalchemy.schema import CreateTable
+
+from src.infrastructure.database.partitions import (
+    DEFAULT_PARTITION,
+    ReservationPartitions,
+    month_start,
+    partition_name,
+    partitioned_table,
+)
+
+
+def test_month_ranges_roll_over_years() -> None:
+    now = datetime(2030, 11, 17, 9, 30)
+
+    months = [month_start(now, offset) for offset in range(4)]
+
+    assert months == [datetime(2030, 11, 1), datetime(2030, 12, 1), datetime(2031, 1, 1), datetime(2031, 2, 1)]
+    assert partition_name(months[2]) == "reservations_p2031_01"
+    assert month_start(datetime(2031, 1, 5), -1) == datetime(2030, 12, 1)
+
+
+def test_partitioned_table_keys_on_start_time() -> None:
+    ddl = str(CreateTable(partitioned_table()).compile(dialect=postgresql.dialect()))
+
+    assert "PRIMARY KEY (reservation_id, start_time)" in ddl
+    assert "PARTITION BY RANGE (start_time)" in ddl
+    assert "reservation_id SERIAL" in ddl
+
+
+class RecordingSession:
+    """Answers the catalog queries ``rotate`` makes, recording every statement."""
+
+    def __init__(self, partitions: list[str], stranded: set[datetime]) -> None:
+        self.partitions = partitions
+        self.stranded = stranded
+        self.statements: list[str] = []
+
+    def execute(self, statement: TextClause, params: Optional[dict[str, Any]] = None) -> Mock:
+        sql = str(statement)
+        self.statements.append(sql)
+        if "pg_partitioned_table" in sql:
+            answer = True
+        elif sql.startswith(f"SELECT EXISTS (SELECT 1 FROM {DEFAULT_PARTITION} "):
+            answer = params is not None and params["start"] in self.stranded
+        else:
+            answer = False
+        return Mock(scalar=Mock(return_value=answer))
+
+    def scalars(self, *_args: object) -> Mock:
+        return Mock(all=Mock(return_value=self.partitions))
+
+
+class RecordingDatabase:
+    def __init__(self, session: RecordingSession) -> None:
+        self.session = session
+
+    @contextmanager
+    def session_scope(self) -> Iterator[RecordingSession]:
+        yield self.session
+
+
+def test_rotate_moves_stranded_rows_out_of_the_default_partition() -> None:
+    session = RecordingSession(
+        partitions=["reservations_p2030_09", "reservations_p2030_11", DEFAULT_PARTITION],
+        stranded={datetime(2031, 1, 1)},
+    )
+    partitions = ReservationPartitions(RecordingDatabase(session), months_ahead=2)  # type: ignore[arg-type]
+
+    created, dropped = partitions.rotate(
+        datetime(2030, 11, 17), drop_before=datetime(2030, 11, 1)
+    )
+
+    assert created == ["reservations_p2030_12", "reservations_p2031_01"]
+    assert dropped == ["reservations_p2030_09"]
+    ddl = [sql.split(" PARTITION")[0] for sql in session.statements if sql.startswith("ALTER")]
+    assert ddl == ["ALTER TABLE reservations DETACH", "ALTER TABLE reservations ATTACH"]
+    detach = next(i for i, sql in enumerate(session.statements) if "DETACH" in sql)
+    create, move, attach = session.statements[detach + 1 : detach + 4]
+    assert create.startswith("CREATE TABLE reservations_p2031_01 PARTITION OF reservations")
+    assert move.startswith(f"WITH moved AS (DELETE FROM {DEFAULT_PARTITION} WHERE")
+    assert "INSERT INTO reservations (reservation_id, " in move
+    assert attach.endswith(f"ATTACH PARTITION {DEFAULT_PARTITION} DEFAULT")
@@ -0,0 +1,80 @@
+from datetime import datetime
+
+import pytest
+
+from src.application.use_cases.check_availability import CheckAvailabilityUseCase
+from src.application.use_cases.create_reservation import CreateReservationUseCase
+from src.application.use_cases.get_reservation_info import GetReservationInfoUseCase
+from src.bootstrap import initialize_database
+from src.domain.value_objects.time_slot import TimeSlot
+from src.infrastructure.cache.memory_cache import InMemoryCache
+from src.infrastructure.database.booking_lock import SessionBookingLock
+from src.infrastructure.database.connection import DatabaseConnection
+from src.infrastructure.database.repositories.cached_office_repository import (
+    CachedOfficeRepository,
+)
+from src.infrastructure.database.repositories.office_repository import OfficeRepository
+from src.infrastructure.database.repositories.reservation_repository import (
+    ReservationRepository,
+)
+from src.infrastructure.notifications.null_notifier import NullNotificationService
+from tests.query_budget import assert_max_queries
+
+SLOT = TimeSlot(start_time=datetime(2030, 1, 7, 10, 0), end_time=datetime(2030, 1, 7, 11, 0))
+
+
+Repositories = tuple[CachedOfficeRepository, ReservationRepository]
+
+
+@pytest.fixture
+def repositories(db: DatabaseConnection) -> Repositories:
+    session = db.get_session()
+    office_repository = CachedOfficeRepository(OfficeRepository(session), InMemoryCache())
+    return office_repository, ReservationRepository(session)
+
+
+def test_check_availability_query_budget(repositories: Repositories) -> None:
+    use_case = CheckAvailabilityUseCase(*repositories)
+
+    with assert_max_queries(2):
+        use_case.execute(1, SLOT)
+
+    # Warm office cache: only the overlap scan remains.
+    with assert_max_queries(1):
+        use_case.execute(1, SLOT)
+
+
+def test_get_reservation_info_query_budget(repositories: Repositories) -> None:
+    use_case = GetReservationInfoUseCase(*repositories)
+    use_case.execute(1, SLOT)
+
+    with assert_max_queries(1):
+        use_case.execute(1, SLOT)
+
+
+def test_create_reservation_query_budget(
+    db: DatabaseConnection, repositories: Repositories
+) -> None:
+    use_case = CreateReservationUseCase(
+        repositories[0], SessionBookingLock(db.session_scope), NullNotificationService()
+    )
+    repositories[0].get_by_id(1)
+
+    # Office lock, reservation and series conflict scans, INSERT, rollup
+    # upsert and the post-commit refresh.
+    with assert_max_queries(6):
+        use_case.execute(
+            office_id=1,
+            user_name="Farrukh Rahimov",
+            user_email="farrukh@example.tj",
+            user_phone="+992901234567",
+            time_slot=SLOT,
+        )
+
+
+def test_initialize_database_skips_schema_work_when_version_matches(
+    db: DatabaseConnection,
+) -> None:
+    # Only the stored schema version is read; no create_all or seeding.
+    with assert_max_queries(1):
+        initialize_database(db)
@@ -0,0 +1,188 @@
+import sqlite3
+from datetime import date, datetime, timedelta
+from http import HTTPStatus
+from pathlib import Path
+from typing import Any
+
+import pytest
+from sqlalchemy import func, select
+
+from src.domain.entities.reservation_series import Recurrence, ReservationSeries
+from src.domain.entities.user import User
+from src.domain.value_objects.contact_info import ContactInfo
+from src.domain.value_objects.time_slot import TimeSlot
+from src.infrastructure.database.booking_lock import SessionBookingLock
+from src.infrastructure.database.connection import DatabaseConnection
+from src.infrastructure.database.models import ReservationModel, ReservationSeriesModel
+from src.presentation.http.application import Application, Request
+
+MONDAY = datetime(2031, 1, 6, 9, 0)
+STANDUP = TimeSlot(start_time=MONDAY, end_time=MONDAY + timedelta(minutes=30))
+WEEKS = 200
+SINGLE_BOOKINGS = 2
+CONTACT = {"name": "Dilnoza Karimova", "email": "d@example.tj", "phone": "+992901234567"}
+
+
+def standups(**kwargs: Any) -> ReservationSeries:
+    user = User(
+        user_id=None,
+        name=CONTACT["name"],
+        contact_info=ContactInfo(email=CONTACT["email"], phone=CONTACT["phone"]),
+    )
+    return ReservationSeries(
+        office_id=1, user=user, first_slot=STANDUP, recurrence=Recurrence.WEEKLY, **kwargs
+    )
+
+
+def day_window(day: date) -> TimeSlot:
+    start = datetime(day.year, day.month, day.day)
+    return TimeSlot(start_time=start, end_time=start + timedelta(hours=24))
+
+
+def test_occurrences_expand_only_inside_window() -> None:
+    series = standups(count=WEEKS, exceptions={date(2031, 1, 13)})
+    far_monday = date(2032, 1, 5)
+
+    assert [slot.start_time for slot in series.occurrences(day_window(far_monday))] == [
+        datetime(2032, 1, 5, 9, 0)
+    ]
+    assert not list(series.occurrences(day_window(date(2031, 1, 13))))
+    assert not list(series.occurrences(day_window(date(2031, 1, 7))))
+    assert series.last_end == STANDUP.end_time + timedelta(weeks=WEEKS - 1)
+
+    bounded = standups(until=date(2031, 1, 31))
+    assert bounded.occurrence_count() == len(
+        list(bounded.occurrences(TimeSlot.from_trusted(MONDAY, bounded.last_end)))
+    )
+    with pytest.raises(ValueError, match="no occurrence"):
+        bounded.materialize(date(2031, 1, 8))
+    with pytest.raises(ValueError, match="until date or an occurrence count"):
+        standups()
+
+
+def post(app: Application, path: str, payload: dict) -> tuple[int, dict]:
+    response = app.handle(
+        Request(
+            method="POST",
+            path=path,
+            headers={"content-type": "application/json"},
+            body=app.codec.encode(payload),
+            client_ip="127.0.0.1",
+        )
+    )
+    return response.status, app.codec.decode(response.body)
+
+
+def book(app: Application, day: str, start: str, end: str) -> tuple[int, dict]:
+    payload = {"office_id": 1, "date": day, "start_time": start, "end_time": end, **CONTACT}
+    return post(app, "/api/reservations", payload)
+
+
+def test_series_blocks_occurrences_and_stores_one_row(
+    app: Application, db: DatabaseConnection
+) -> None:
+    status, created = post(
+        app,
+        "/api/reservations/series",
+        {
+            "office_id": 1,
+            "date": "2031-01-06",
+            "start_time": "09:00",
+            "end_time": "09:30",
+            "recurrence": "weekly",
+            "count": WEEKS,
+            "exceptions": ["2031-01-20"],
+            **CONTACT,
+        },
+    )
+    assert status == HTTPStatus.CREATED, created
+    assert created["data"]["occurrences"] == WEEKS - 1
+
+    assert book(app, "2031-06-02", "09:15", "10:00")[0] == HTTPStatus.CONFLICT
+    assert book(app, "2031-01-20", "09:00", "09:30")[0] == HTTPStatus.CREATED
+    assert book(app, "2031-06-03", "09:00", "09:30")[0] == HTTPStatus.CREATED
+    _, info = post(
+        app,
+        "/api/offices/info",
+        {"office_id": 1, "date": "2032-01-05", "start_time": "08:00", "end_time": "10:00"},
+    )
+    assert info["occupied"]
+
+    with db.session_scope() as session:
+        assert session.scalar(select(func.count()).select_from(ReservationSeriesModel)) == 1
+        assert session.scalar(select(func.count()).select_from(ReservationModel)) == SINGLE_BOOKINGS
+
+    # A second series over an occupied Monday is rejected as a whole.
+    status, _ = post(
+        app,
+        "/api/reservations/series",
+        {
+            "office_id": 1,
+            "date": "2031-05-26",
+            "start_time": "09:00",
+            "end_time": "09:30",
+            "recurrence": "daily",
+            "until": "2031-06-10",
+            **CONTACT,
+        },
+    )
+    assert status == HTTPStatus.CONFLICT
+
+
+def test_override_materializes_one_occurrence(app: Application) -> None:
+    _, created = post(
+        app,
+        "/api/reservations/series",
+        {
+            "office_id": 1,
+            "date": "2031-01-06",
+            "start_time": "09:00",
+            "end_time": "09:30",
+            "recurrence": "weekly",
+            "until": "2031-12-31",
+            **CONTACT,
+        },
+    )
+    series_id = created["data"]["series_id"]
+
+    status, moved = post(
+        app,
+        "/api/reservations/series/occurrence",
+        {"series_id": series_id, "date": "2031-03-03", "start_time": "11:00", "end_time": "11:30"},
+    )
+    assert status == HTTPStatus.OK, moved
+    assert moved["data"]["reservation_id"]
+    assert book(app, "2031-03-03", "09:00", "09:30")[0] == HTTPStatus.CREATED
+    assert book(app, "2031-03-03", "11:00", "11:30")[0] == HTTPStatus.CONFLICT
+
+    status, _ = post(
+        app, "/api/reservations/series/occurrence", {"series_id": series_id, "date": "2031-03-10"}
+    )
+    assert status == HTTPStatus.OK
+    assert book(app, "2031-03-10", "09:00", "09:30")[0] == HTTPStatus.CREATED
+    status, _ = post(
+        app, "/api/reservations/series/occurrence", {"series_id": series_id, "date": "2031-03-10"}
+    )
+    assert status == HTTPStatus.BAD_REQUEST
+    status, _ = post(
+        app, "/api/reservations/series/occurrence", {"series_id": 999, "date": "2031-03-10"}
+    )
+    assert status == HTTPStatus.NOT_FOUND
+
+
+def test_booking_writes_commit_together_under_the_lock(
+    db: DatabaseConnection, db_path: Path
+) -> None:
+    other_process = sqlite3.connect(db_path, timeout=0.1)
+
+    with SessionBookingLock(db.session_scope).lock_office(1) as booking:
+        series = booking.series.save(standups(count=WEEKS))
+        booking.reservations.save(series.materialize(date(2031, 1, 13)))
+        booking.series.save(series)
+        # Flushed, not committed: the lock's transaction is still open.
+        assert other_process.execute("SELECT COUNT(*) FROM reservation_series").fetchone() == (0,)
+        with pytest.raises(sqlite3.OperationalError, match="locked"):
+            other_process.execute("BEGIN IMMEDIATE")
+
+    assert other_process.execute("SELECT COUNT(*) FROM reservations").fetchone() == (1,)
+    other_process.close()
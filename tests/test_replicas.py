@@ -0,0 +1,109 @@
+import shutil
+import time
+from http import HTTPStatus
+from pathlib import Path
+from typing import TypedDict
+
+from sqlalchemy import create_engine, text
+
+from src.application.interfaces.repository import OfficeRepositoryInterface
+from src.bootstrap import create_dependency_container, initialize_database
+from src.infrastructure.cache.memory_cache import InMemoryCache
+from src.infrastructure.database.connection import DatabaseConnection
+from src.infrastructure.database.replicas import (
+    ReadYourWritesPins,
+    ReplicaSet,
+    ReplicationHeartbeat,
+    reads_from_primary,
+)
+from src.infrastructure.notifications.null_notifier import NullNotificationService
+from src.presentation.controllers.reservation_controller import ReservationController
+from src.presentation.http.application import Application, Request
+
+STALE_SECONDS = 60
+
+
+class Slot(TypedDict):
+    office_id: int
+    date: str
+    start_time: str
+    end_time: str
+
+
+SLOT = Slot(office_id=1, date="2030-01-07", start_time="10:00", end_time="11:00")
+
+
+def make_replica(tmp_path: Path, written_at: float) -> str:
+    """Two SQLite files stand in for a primary and its replica."""
+    primary = tmp_path / "primary.db"
+    replica = tmp_path / "replica.db"
+    initialize_database(DatabaseConnection(f"sqlite:///{primary}"))
+    shutil.copy(primary, replica)
+
+    engine = create_engine(f"sqlite:///{replica}")
+    ReplicationHeartbeat(engine).beat()
+    with engine.begin() as connection:
+        connection.execute(text("UPDATE replica_heartbeat SET written_at = :t"), {"t": written_at})
+    engine.dispose()
+    return f"sqlite:///{replica}"
+
+
+def test_reads_use_replica_and_bookings_use_primary(tmp_path: Path) -> None:
+    replica_url = make_replica(tmp_path, written_at=time.time())
+    db = DatabaseConnection(f"sqlite:///{tmp_path / 'primary.db'}", replica_urls=[replica_url])
+    controller, _ = create_dependency_container(db, InMemoryCache(), NullNotificationService())
+
+    booked = controller.book_office(
+        **SLOT, name="Farrukh Rahimov", email="farrukh@example.tj", phone="+992901234567"
+    )
+    assert booked["success"]
+
+    # The replica has not "replicated" the booking yet...
+    assert controller.check_office_availability(**SLOT)["available"] is True
+    # ...but a client pinned to the primary sees its own write.
+    with reads_from_primary():
+        assert controller.check_office_availability(**SLOT)["available"] is False
+
+
+def test_every_booking_write_pins_the_client(
+    container: tuple[ReservationController, OfficeRepositoryInterface], cache: InMemoryCache
+) -> None:
+    pins = ReadYourWritesPins(cache)
+    app = Application(*container, read_your_writes=pins)
+
+    def post(path: str, payload: dict, client_ip: str) -> int:
+        request = Request(
+            method="POST",
+            path=path,
+            headers={"content-type": "application/json"},
+            body=app.codec.encode(payload),
+            client_ip=client_ip,
+        )
+        return app.handle(request).status
+
+    series = {
+        **SLOT,
+        "name": "Farrukh Rahimov",
+        "email": "farrukh@example.tj",
+        "phone": "+992901234567",
+        "recurrence": "weekly",
+        "count": 2,
+    }
+    assert post("/api/reservations/series", series, "10.0.0.1") == HTTPStatus.CREATED
+    assert pins.is_pinned("10.0.0.1")
+
+    cancel = {"series_id": 1, "date": SLOT["date"]}
+    assert post("/api/reservations/series/occurrence", cancel, "10.0.0.2") == HTTPStatus.OK
+    assert pins.is_pinned("10.0.0.2")
+
+    # A rejected write changes nothing worth reading back.
+    assert post("/api/reservations/series", series, "10.0.0.3") == HTTPStatus.CONFLICT
+    assert not pins.is_pinned("10.0.0.3")
+
+
+def test_lagging_replica_is_skipped(tmp_path: Path) -> None:
+    replica_url = make_replica(tmp_path, written_at=time.time() - STALE_SECONDS)
+    replicas = ReplicaSet([create_engine(replica_url)], max_lag=5)
+
+    assert replicas.choose() is None
+    assert replicas.lag(0) >= STALE_SECONDS
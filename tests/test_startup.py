@@ -0,0 +1,49 @@
+import subprocess
+import sys
+from pathlib import Path
+
+ROOT = Path(__file__).parent.parent
+
+HEAVY_MODULES = ("smtplib", "email.mime.text", "redis", "cProfile", "tracemalloc", "sqlalchemy")
+
+
+def loaded_modules(tmp_path: Path, *cli_args: str) -> set[str]:
+    script = (
+        "import sys, main\n"
+        f"sys.argv = ['main.py', *{list(cli_args)!r}]\n"
+        "try:\n"
+        "    main.main()\n"
+        "except SystemExit:\n"
+        "    pass\n"
+        f"print('loaded:' + ','.join(m for m in {HEAVY_MODULES!r} if m in sys.modules))\n"
+    )
+    result = subprocess.run(
+        [sys.executable, "-c", script],
+        cwd=ROOT,
+        env={"DATABASE_URL": f"sqlite:///{tmp_path / 'cli.db'}", "CACHE_BACKEND": "memory"},
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    last_line = result.stdout.strip().splitlines()[-1]
+    return set(filter(None, last_line.removeprefix("loaded:").split(",")))
+
+
+def test_help_does_not_load_infrastructure(tmp_path: Path) -> None:
+    assert not loaded_modules(tmp_path, "--help")
+
+
+def test_read_only_command_skips_notifiers_and_redis(tmp_path: Path) -> None:
+    loaded = loaded_modules(
+        tmp_path,
+        "check-availability",
+        "--office-id",
+        "1",
+        "--date",
+        "2030-01-07",
+        "--start-time",
+        "10:00",
+        "--end-time",
+        "11:00",
+    )
+    assert loaded == {"sqlalchemy"}
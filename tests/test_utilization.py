@@ -0,0 +1,132 @@
+import random
+from datetime import datetime, timedelta
+from http import HTTPStatus
+
+import pytest
+from sqlalchemy import delete, select
+
+from src.domain.utilization import (
+    Granularity,
+    bucket_edges,
+    occupied_seconds,
+    split_by_bucket,
+)
+from src.infrastructure.database.connection import DatabaseConnection
+from src.infrastructure.database.models import UtilizationRollupModel
+from src.infrastructure.database.repositories.reservation_repository import (
+    ReservationRepository,
+)
+from src.infrastructure.database.rollups import backfill_rollups
+from src.presentation.controllers.reservation_controller import ReservationController
+from src.presentation.http.application import Application, Request
+
+MONDAY = datetime(2031, 3, 3)
+HALF_HOUR = 1800
+SHARED_OFFICE, SHARED_CAPACITY, SHARED_SEATS = 5, 12, 3
+BOOKED_HOURS = 2.0
+
+
+def test_occupied_seconds_matches_direct_overlap() -> None:
+    rng = random.Random(7)
+    starts = [MONDAY + timedelta(minutes=rng.randrange(0, 3 * 24 * 60)) for _ in range(300)]
+    ends = [start + timedelta(minutes=rng.randrange(15, 600)) for start in starts]
+    weights = [rng.choice((1.0, 0.25, 0.5)) for _ in starts]
+    edges = bucket_edges(MONDAY, MONDAY + timedelta(days=3), timedelta(minutes=45))
+
+    expected = [
+        sum(
+            weight * max(0.0, (min(end, right) - max(start, left)).total_seconds())
+            for start, end, weight in zip(starts, ends, weights)
+        )
+        for left, right in zip(edges, edges[1:])
+    ]
+
+    assert occupied_seconds(starts, ends, weights, edges) == pytest.approx(expected)
+    assert occupied_seconds([], [], [], edges) == [0.0] * (len(edges) - 1)
+
+
+def test_split_by_bucket_crosses_midnight() -> None:
+    start = MONDAY + timedelta(hours=23, minutes=30)
+
+    assert split_by_bucket(start, start + timedelta(hours=1), Granularity.DAY) == [
+        (MONDAY, HALF_HOUR),
+        (MONDAY + timedelta(days=1), HALF_HOUR),
+    ]
+    assert split_by_bucket(start, start + timedelta(hours=1), Granularity.WEEK) == [
+        (MONDAY, 2 * HALF_HOUR)
+    ]
+
+
+def report(app: Application, query: str) -> tuple[int, dict]:
+    response = app.handle(
+        Request(method="GET", path="/api/analytics/utilization", query_string=query)
+    )
+    return response.status, app.codec.decode(response.body)
+
+
+def rollup_rows(db: DatabaseConnection) -> set[tuple]:
+    with db.session_scope() as session:
+        return set(
+            session.execute(
+                select(
+                    UtilizationRollupModel.office_id,
+                    UtilizationRollupModel.granularity,
+                    UtilizationRollupModel.bucket_start,
+                    UtilizationRollupModel.whole_seconds,
+                    UtilizationRollupModel.seat_seconds,
+                ).where(
+                    (UtilizationRollupModel.whole_seconds != 0)
+                    | (UtilizationRollupModel.seat_seconds != 0)
+                )
+            ).all()
+        )
+
+
+def test_rollups_follow_writes_and_agree_with_adhoc(
+    db: DatabaseConnection, controller: ReservationController, app: Application
+) -> None:
+    contact = ("Dilnoza Karimova", "d@example.tj", "+992901234567")
+    assert controller.book_office(1, "2031-03-03", "09:00", "10:30", *contact)["success"]
+    assert controller.book_office(1, "2031-03-04", "23:00", "23:30", *contact)["success"]
+    assert controller.book_office(
+        SHARED_OFFICE, "2031-03-03", "09:00", "11:00", *contact, seats=SHARED_SEATS
+    )["success"]
+
+    status, daily = report(app, "office_id=1&from=2031-03-03&to=2031-03-10")
+    assert status == HTTPStatus.OK, daily
+    assert daily["data"]["source"] == "rollup"
+    assert [bucket["occupied_hours"] for bucket in daily["data"]["buckets"][:3]] == [1.5, 0.5, 0]
+
+    _, hourly = report(app, "office_id=1&from=2031-03-03&to=2031-03-04&granularity=hour")
+    assert [bucket["utilization"] for bucket in hourly["data"]["buckets"][8:11]] == [0, 1, 0.5]
+
+    _, adhoc = report(app, "office_id=1&from=2031-03-03T08:00&to=2031-03-10&bucket_minutes=90")
+    assert adhoc["data"]["source"] == "adhoc"
+    assert adhoc["data"]["buckets"][0]["start_time"] == "2031-03-03 08:00"
+    total = sum(bucket["occupied_hours"] for bucket in adhoc["data"]["buckets"])
+    assert total == pytest.approx(BOOKED_HOURS)
+
+    _, shared = report(app, f"office_id={SHARED_OFFICE}&from=2031-03-03&to=2031-03-04")
+    assert shared["data"]["buckets"][0]["occupied_hours"] == round(
+        BOOKED_HOURS * SHARED_SEATS / SHARED_CAPACITY, 2
+    )
+
+    # Cancelling takes the booking back out of every bucket.
+    repository = ReservationRepository(db.get_session())
+    late = MONDAY + timedelta(days=1, hours=23)
+    reservation = next(r for r in repository.find_all() if r.time_slot.start_time == late)
+    reservation.cancel()
+    repository.save(reservation)
+    _, daily = report(app, "office_id=1&from=2031-03-03&to=2031-03-10")
+    assert daily["data"]["buckets"][1]["occupied_hours"] == 0
+
+    # A rebuild from the reservations reproduces the incremental rows.
+    incremental = rollup_rows(db)
+    with db.session_scope() as session:
+        session.execute(delete(UtilizationRollupModel))
+    backfill_rollups(db)
+    assert rollup_rows(db) == incremental
+
+    assert report(app, "office_id=1&from=2031-03-03&to=2031-03-03")[0] == HTTPStatus.BAD_REQUEST
+    assert report(app, "office_id=1&from=x&to=2031-03-04")[0] == HTTPStatus.BAD_REQUEST
+    assert report(app, "office_id=999&from=2031-03-03&to=2031-03-04")[0] == HTTPStatus.NOT_FOUND
@@ -0,0 +1,61 @@
+import socket
+import threading
+from collections.abc import Iterator
+from http import HTTPStatus
+from http.server import BaseHTTPRequestHandler
+
+import pytest
+
+from src.presentation.http.worker_pool import PooledHTTPServer
+
+started = threading.Event()
+release = threading.Event()
+
+
+class BlockingHandler(BaseHTTPRequestHandler):
+    def do_GET(self) -> None:
+        started.set()
+        release.wait(5)
+        self.send_response(200)
+        self.send_header("Content-Length", "0")
+        self.end_headers()
+
+    def log_message(self, *args: object) -> None:
+        pass
+
+
+@pytest.fixture
+def server() -> Iterator[PooledHTTPServer]:
+    started.clear()
+    release.clear()
+    httpd = PooledHTTPServer(
+        ("127.0.0.1", 0), BlockingHandler, threads=1, queue_size=1, retry_after=7
+    )
+    thread = threading.Thread(target=httpd.serve_forever, daemon=True)
+    thread.start()
+    yield httpd
+    release.set()
+    httpd.shutdown()
+    httpd.server_close()
+
+
+def send_get(server: PooledHTTPServer) -> socket.socket:
+    sock = socket.create_connection(("127.0.0.1", server.server_port), timeout=5)
+    sock.sendall(b"GET / HTTP/1.0\r\n\r\n")
+    return sock
+
+
+def test_sheds_with_retry_after_when_queue_is_full(server: PooledHTTPServer) -> None:
+    busy = send_get(server)
+    assert started.wait(5)
+    queued = send_get(server)
+    shed = send_get(server)
+
+    response = shed.makefile("rb").read().decode("ascii")
+    assert response.startswith(f"HTTP/1.0 {HTTPStatus.SERVICE_UNAVAILABLE.value}")
+    assert "Retry-After: 7" in response
+
+    release.set()
+    for sock in (busy, queued):
+        assert sock.makefile("rb").readline().startswith(b"HTTP/1.0 200")
+        sock.close()